@@ -9,19 +9,23 @@ Splits ParseResult content into Chunk objects respecting markdown structure:
 
 from __future__ import annotations
 
+import bisect
 import functools
 import hashlib
 import logging
+import os
 import re
 from typing import TYPE_CHECKING, ClassVar
 
-import tiktoken
-
 from hwcc.chunk.base import BaseChunker
 from hwcc.exceptions import ChunkError
 from hwcc.types import Chunk, ChunkMetadata
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import tiktoken
+
     from hwcc.config import HwccConfig
     from hwcc.types import ParseResult
 
@@ -32,15 +36,39 @@ logger = logging.getLogger(__name__)
 
 @functools.lru_cache(maxsize=1)
 def _get_encoding() -> tiktoken.Encoding:
-    """Get the tiktoken encoding, lazily initialized and thread-safe."""
+    """Get the tiktoken encoding, lazily initialized and thread-safe.
+
+    tiktoken is imported here rather than at module level so that importing
+    the chunker (e.g. from CLI commands that never chunk) stays cheap.
+    """
+    import tiktoken
+
     return tiktoken.get_encoding("cl100k_base")
 
 
 def count_tokens(text: str) -> int:
-    """Count tokens in text using cl100k_base encoding."""
+    """Count tokens in text using cl100k_base encoding.
+
+    Special-token text (e.g. ``<|endoftext|>``) is counted as ordinary text,
+    which also skips tiktoken's special-token scan over the input.
+    """
     if not text:
         return 0
-    return len(_get_encoding().encode(text))
+    return len(_get_encoding().encode_ordinary(text))
+
+
+def _encode_batch(texts: list[str]) -> list[list[int]]:
+    """Encode several texts in one call, in parallel where it can help.
+
+    tiktoken releases the GIL while encoding, so its batch API runs the BPE
+    work on a thread pool. A pool is only worth spinning up when there is
+    more than one text and more than one CPU.
+    """
+    enc = _get_encoding()
+    num_threads = os.cpu_count() or 1
+    if len(texts) > 1 and num_threads > 1:
+        return enc.encode_ordinary_batch(texts, num_threads=num_threads)
+    return [enc.encode_ordinary(text) for text in texts]
 
 
 # Page marker injected by PDF parser: <!-- PAGE:N -->
@@ -53,8 +81,9 @@ _HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
 # Fenced code block: ``` or ~~~ with optional language
 _FENCE_RE = re.compile(r"^(`{3,}|~{3,})", re.MULTILINE)
 
-# Table row: line starting with |
-_TABLE_ROW_RE = re.compile(r"^\|.+\|$", re.MULTILINE)
+# Start of an atomic block: a code fence (group 1) or a run of consecutive
+# table rows (the match ends before the last row's newline)
+_BLOCK_START_RE = re.compile(r"^(?:(`{3,}|~{3,})|\|.+\|$(?:\n\|.+\|$)*)", re.MULTILINE)
 
 # Table separator: | --- | --- | pattern
 _TABLE_SEP_RE = re.compile(r"^\|[\s:]*-+[\s:]*\|", re.MULTILINE)
@@ -129,105 +158,200 @@ _ELECTRICAL_KW_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Keyword families fused into one alternation; named groups tag each match
+# with its family so a single scan finds every family present in a chunk.
+_KEYWORD_FAMILIES: dict[str, re.Pattern[str]] = {
+    "errata": _ERRATA_KW_RE,
+    "config_procedure": _CONFIG_PROC_KW_RE,
+    "register": _REGISTER_KW_RE,
+    "timing_spec": _TIMING_KW_RE,
+    "pin_mapping": _PIN_MAP_KW_RE,
+    "electrical_spec": _ELECTRICAL_KW_RE,
+}
+_KEYWORD_RE = re.compile(
+    "|".join(f"(?P<{family}>{pattern.pattern})" for family, pattern in _KEYWORD_FAMILIES.items()),
+    re.IGNORECASE,
+)
+
+# (family, content_type) in priority order for tables and for prose
+_TABLE_KEYWORD_PRIORITY: tuple[tuple[str, str], ...] = (
+    ("register", "register_table"),
+    ("pin_mapping", "pin_mapping"),
+    ("electrical_spec", "electrical_spec"),
+    ("timing_spec", "timing_spec"),
+)
+_PROSE_KEYWORD_PRIORITY: tuple[tuple[str, str], ...] = (
+    ("errata", "errata"),
+    ("config_procedure", "config_procedure"),
+    ("register", "register_description"),
+    ("timing_spec", "timing_spec"),
+    ("pin_mapping", "pin_mapping"),
+    ("electrical_spec", "electrical_spec"),
+)
+
+
+def _match_keyword_family(text: str, priority: tuple[tuple[str, str], ...]) -> str | None:
+    """Return the content type of the highest-priority keyword family in text.
+
+    Scans once with the fused keyword pattern, stopping early when the top
+    family is found. A family can be hidden from the fused scan when all of
+    its occurrences overlap an earlier match of another family (e.g.
+    "step 1 ms"), so higher-priority families it missed are confirmed with
+    their own pattern before a lower one wins.
+    """
+    top_family, top_type = priority[0]
+    found: set[str] = set()
+    for match in _KEYWORD_RE.finditer(text):
+        if match.lastgroup == top_family:
+            return top_type
+        found.add(match.lastgroup or "")
+
+    if not found:
+        return None
+    for family, content_type in priority:
+        if family in found or _KEYWORD_FAMILIES[family].search(text):
+            return content_type
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _closing_fence_re(char: str, length: int) -> re.Pattern[str]:
+    """Compile the closing-fence pattern for a fence of ``length`` ``char``s.
+
+    Only a handful of (char, length) pairs occur in practice, so the cache
+    is warm after the first code block of each kind. Trailing spaces or tabs
+    after the closing fence are allowed, as in CommonMark.
+    """
+    return re.compile(rf"^{re.escape(char)}{{{length},}}[ \t]*$", re.MULTILINE)
+
 
 def _extract_atomic_blocks(text: str) -> list[tuple[str, bool]]:
     """Split text into segments, marking code blocks and tables as atomic.
 
     Returns a list of (content, is_atomic) tuples. Atomic blocks must not
     be split by the recursive splitter.
-    """
-    segments: list[tuple[str, bool]] = []
-    lines = text.split("\n")
-    i = 0
-    current_text: list[str] = []
-
-    while i < len(lines):
-        line = lines[i]
-
-        # Check for fenced code block start
-        fence_match = _FENCE_RE.match(line)
-        if fence_match:
-            # Flush accumulated text
-            if current_text:
-                segments.append(("\n".join(current_text), False))
-                current_text = []
-
-            fence_marker = fence_match.group(1)
-            fence_char = fence_marker[0]
-            fence_len = len(fence_marker)
-            code_lines = [line]
-            i += 1
-
-            # Find matching closing fence
-            while i < len(lines):
-                code_lines.append(lines[i])
-                close_match = re.match(rf"^{re.escape(fence_char)}{{{fence_len},}}$", lines[i])
-                if close_match:
-                    i += 1
-                    break
-                i += 1
-
-            segments.append(("\n".join(code_lines), True))
-            continue
-
-        # Check for table block (consecutive lines starting with |)
-        if _TABLE_ROW_RE.match(line):
-            # Flush accumulated text
-            if current_text:
-                segments.append(("\n".join(current_text), False))
-                current_text = []
 
-            table_lines = [line]
-            i += 1
-            while i < len(lines) and _TABLE_ROW_RE.match(lines[i]):
-                table_lines.append(lines[i])
-                i += 1
+    Candidate block starts are located with a single regex scan over the
+    whole text, and segments are sliced from the original string by offset
+    rather than rebuilt line by line. A segment never includes the newline
+    that separates it from the next one.
+    """
+    # Every block starts with "|" or a fence; plain prose skips the scan
+    if "|" not in text and "```" not in text and "~~~" not in text:
+        return [(text, False)]
 
+    segments: list[tuple[str, bool]] = []
+    end = len(text)
+    pos = 0  # start of pending (non-atomic) text
+    scan = 0  # where to look for the next block start
+
+    while (block := _BLOCK_START_RE.search(text, scan)) is not None:
+        start = block.start()
+        marker = block.group(1)
+
+        if marker:
+            # Fenced code block: runs to the matching closing fence, or to
+            # the end of the text when the fence is never closed
+            close_re = _closing_fence_re(marker[0], len(marker))
+            open_end = text.find("\n", start)
+            close_match = close_re.search(text, open_end + 1) if open_end != -1 else None
+            block_end = close_match.end() if close_match else end
+        else:
+            # Table block (consecutive lines starting with |)
+            block_end = block.end()
             # Only treat as atomic table if it has a separator row (real table)
-            table_text = "\n".join(table_lines)
-            if _TABLE_SEP_RE.search(table_text):
-                segments.append((table_text, True))
-            else:
-                # Not a real table, treat as normal text
-                current_text.extend(table_lines)
-            continue
+            if not _TABLE_SEP_RE.search(text, start, block_end):
+                # Not a real table: the rows start a new run of normal text
+                if start > pos:
+                    segments.append((text[pos : start - 1], False))
+                pos = start
+                scan = block_end + 1
+                continue
 
-        current_text.append(line)
-        i += 1
+        # Flush accumulated text
+        if start > pos:
+            segments.append((text[pos : start - 1], False))
+        segments.append((text[start:block_end], True))
+        pos = scan = block_end + 1
 
     # Flush remaining text
-    if current_text:
-        segments.append(("\n".join(current_text), False))
+    if pos <= end:
+        segments.append((text[pos:], False))
 
     return segments
 
 
+def _iter_headings(text: str) -> Iterator[re.Match[str]]:
+    """Yield the same matches as ``_HEADING_RE.finditer(text)``.
+
+    Only lines that start with ``#`` can hold a heading, so candidates are
+    found with ``str.find`` and the regex is run just at those positions
+    instead of being tried at every line start.
+    """
+    pos = 0
+    if not text.startswith("#"):
+        pos = text.find("\n#") + 1
+        if not pos:
+            return
+    while True:
+        match = _HEADING_RE.match(text, pos)
+        if match:
+            yield match
+            pos = match.end()
+        pos = text.find("\n#", pos) + 1
+        if not pos:
+            return
+
+
 class _SectionTracker:
-    """Tracks heading hierarchy across chunks to maintain section_path."""
+    """Tracks heading hierarchy across chunks to maintain section_path.
+
+    Headings of the whole document are scanned once up front; ``advance``
+    then applies those that start before a chunk's end offset, found by
+    binary search, instead of re-scanning every chunk's text.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, text: str = "") -> None:
         self._stack: list[tuple[int, str]] = []
+        self._headings = [
+            (match.start(), len(match.group(1)), match.group(2).strip())
+            for match in _iter_headings(text)
+        ]
+        self._starts = [start for start, _, _ in self._headings]
+        self._consumed = 0
 
     @property
     def path(self) -> str:
         """Current section path as 'H1 > H2 > H3'."""
         return " > ".join(h[1] for h in self._stack)
 
+    def advance(self, offset: int) -> None:
+        """Apply the pre-scanned headings that start before ``offset``."""
+        stop = bisect.bisect_left(self._starts, offset, lo=self._consumed)
+        for _, level, title in self._headings[self._consumed : stop]:
+            self._push(level, title)
+        self._consumed = stop
+
     def update(self, text: str) -> None:
         """Update the heading stack based on headings found in text."""
-        for match in _HEADING_RE.finditer(text):
-            level = len(match.group(1))
-            title = match.group(2).strip()
+        for match in _iter_headings(text):
+            self._push(len(match.group(1)), match.group(2).strip())
 
-            # Pop headings at same or deeper level
-            while self._stack and self._stack[-1][0] >= level:
-                self._stack.pop()
+    def _push(self, level: int, title: str) -> None:
+        # Pop headings at same or deeper level
+        while self._stack and self._stack[-1][0] >= level:
+            self._stack.pop()
 
-            self._stack.append((level, title))
+        self._stack.append((level, title))
 
 
 def _generate_chunk_id(doc_id: str, index: int, content: str) -> str:
-    """Generate a deterministic unique chunk ID."""
+    """Generate a deterministic unique chunk ID.
+
+    SHA-256 stays on purpose: hashlib's implementation is hardware
+    accelerated and benchmarks faster than blake2b or md5 on chunk-sized
+    inputs, and changing the hash would change every stored chunk ID.
+    """
     content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()[:8]
     return f"{doc_id}_chunk_{index:04d}_{content_hash}"
 
@@ -236,23 +360,104 @@ def _recursive_split(
     text: str,
     max_tokens: int,
     separators: list[str],
-) -> list[str]:
+    token_ids: list[int] | None = None,
+    offset: int = 0,
+) -> list[tuple[str, list[int], int]]:
     """Recursively split text to fit within max_tokens.
 
     Tries each separator in order, falling back to the next if chunks
-    are still too large.
+    are still too large. ``token_ids`` may be passed when the caller
+    already encoded ``text`` to avoid encoding it again.
+
+    The recursion runs on an explicit work stack rather than the call
+    stack: each level turns its pieces into finished chunks or further
+    work, pushed in reverse so they are popped back in source order.
+
+    Returns (text, token_ids, end) triples. The ids decode back to exactly
+    the text, so later steps can slice them instead of re-encoding, and
+    ``end`` is where the piece ends in the source, given that ``text``
+    starts at ``offset``.
     """
-    if count_tokens(text) <= max_tokens:
-        return [text]
+    enc = _get_encoding()
+    if token_ids is None:
+        token_ids = enc.encode_ordinary(text)
+
+    result: list[tuple[str, list[int], int]] = []
+    # Items are finished (text, ids, end) chunks, or (text, ids, offset,
+    # separator index) work still to be split.
+    work: list[tuple[str, list[int], int] | tuple[str, list[int], int, int]] = [
+        (text, token_ids, offset, 0)
+    ]
+
+    while work:
+        item = work.pop()
+        if len(item) == 3:
+            result.append(item)
+            continue
 
-    if not separators:
-        # Last resort: hard split by tokens
-        return _hard_split(text, max_tokens)
+        text, token_ids, offset, sep_index = item
+        if len(token_ids) <= max_tokens:
+            result.append((text, token_ids, offset + len(text)))
+            continue
+
+        if sep_index >= len(separators):
+            # Last resort: hard split by tokens
+            result.extend(_hard_split(text, max_tokens, token_ids, offset))
+            continue
 
-    separator = separators[0]
-    remaining_separators = separators[1:]
+        separator = separators[sep_index]
+        located = _locate_parts(text, separator, offset)
 
-    # Split on the separator
+        if len(located) <= 1:
+            # Separator didn't help, try next one
+            work.append((text, token_ids, offset, sep_index + 1))
+            continue
+
+        # Merge small adjacent parts and queue large ones for further splitting
+        pieces: list[tuple[str, list[int], int] | tuple[str, list[int], int, int]] = []
+        current: list[str] = []
+        current_ids: list[int] = []
+        current_end = offset
+
+        # For heading separators, the heading is preserved in the split part
+        # (thanks to lookahead), so use newline to rejoin instead of the separator
+        rejoin = "\n" if separator.startswith("\n#") else separator
+
+        # Parts are encoded with their leading separator (which BPE usually folds
+        # into the part's first token) and candidate sizes are summed from these
+        # cached counts instead of re-encoding the growing merge on every step.
+        # Only the part that opens a new group is encoded on its own.
+        for part, start in located:
+            if current:
+                joined_ids = enc.encode_ordinary(rejoin + part)
+                if len(current_ids) + len(joined_ids) <= max_tokens:
+                    current.append(part)
+                    current_ids += joined_ids
+                    current_end = start + len(part)
+                    continue
+                pieces.append((rejoin.join(current), current_ids, current_end))
+                current = []
+                current_ids = []
+
+            part_ids = enc.encode_ordinary(part)
+            # Check if this single part needs further splitting
+            if len(part_ids) > max_tokens:
+                pieces.append((part, part_ids, start, sep_index + 1))
+            else:
+                current = [part]
+                current_ids = part_ids
+                current_end = start + len(part)
+
+        if current:
+            pieces.append((rejoin.join(current), current_ids, current_end))
+
+        work.extend(reversed(pieces))
+
+    return result
+
+
+def _locate_parts(text: str, separator: str, offset: int) -> list[tuple[str, int]]:
+    """Split text on a separator, returning non-empty parts with source offsets."""
     if separator == "\n# ":
         # Special handling for headings: keep the heading with its content
         # Also match headings at start of text (no preceding newline)
@@ -264,89 +469,80 @@ def _recursive_split(
     else:
         parts = text.split(separator)
 
-    # Filter empty parts
-    parts = [p for p in parts if p.strip()]
-
-    if len(parts) <= 1:
-        # Separator didn't help, try next one
-        return _recursive_split(text, max_tokens, remaining_separators)
-
-    # Merge small adjacent parts and recursively split large ones
-    result: list[str] = []
-    current = ""
-
-    # For heading separators, the heading is preserved in the split part
-    # (thanks to lookahead), so use newline to rejoin instead of the separator
-    rejoin = "\n" if separator.startswith("\n#") else separator
+    # Heading splits keep the separator inside the parts (lookahead)
+    gap = 0 if separator.startswith("\n#") else len(separator)
 
+    located: list[tuple[str, int]] = []
+    start = offset
     for part in parts:
-        candidate = current + rejoin + part if current else part
-        if count_tokens(candidate) <= max_tokens:
-            current = candidate
-        else:
-            if current:
-                result.append(current)
-            # Check if this single part needs further splitting
-            if count_tokens(part) > max_tokens:
-                result.extend(_recursive_split(part, max_tokens, remaining_separators))
-            else:
-                current = part
-                continue
-            current = ""
-
-    if current:
-        result.append(current)
-
-    return result
+        if part.strip():
+            located.append((part, start))
+        start += len(part) + gap
+    return located
 
 
-def _hard_split(text: str, max_tokens: int) -> list[str]:
+def _hard_split(
+    text: str,
+    max_tokens: int,
+    token_ids: list[int] | None = None,
+    offset: int = 0,
+) -> list[tuple[str, list[int], int]]:
     """Hard-split text by token count when all separators are exhausted."""
     enc = _get_encoding()
-    tokens = enc.encode(text)
-    result: list[str] = []
+    tokens = token_ids if token_ids is not None else enc.encode_ordinary(text)
+    result: list[tuple[str, list[int], int]] = []
+    end = offset
 
     for i in range(0, len(tokens), max_tokens):
         chunk_tokens = tokens[i : i + max_tokens]
-        result.append(enc.decode(chunk_tokens))
+        piece = enc.decode(chunk_tokens)
+        end = min(end + len(piece), offset + len(text))
+        result.append((piece, chunk_tokens, end))
 
     return result
 
 
 def _add_overlap(
-    chunks: list[str],
+    chunks: list[tuple[str, list[int], int]],
     overlap_tokens: int,
-    atomic_indices: set[int] | None = None,
-) -> list[str]:
+    atomic_flags: bytearray | None = None,
+) -> list[tuple[str, int]]:
     """Add overlap from the end of each chunk to the start of the next.
 
+    The overlap is decoded from the tail of the previous chunk's token ids,
+    so only ``overlap_tokens`` ids are decoded per boundary and nothing is
+    re-encoded.
+
     Atomic blocks (tables, code fences) are skipped — they should not
     receive overlap prefixes since they are already self-contained and
-    may already be at or over the max_tokens budget.
+    may already be at or over the max_tokens budget. ``atomic_flags``
+    holds one byte per chunk, non-zero for atomic ones.
+
+    Returns (text, end) pairs, carrying each chunk's source end offset.
     """
     if overlap_tokens <= 0 or len(chunks) <= 1:
-        return chunks
+        return [(text, end) for text, _, end in chunks]
 
-    atomic = atomic_indices or set()
+    atomic = atomic_flags or bytearray(len(chunks))
     enc = _get_encoding()
-    result = [chunks[0]]
+    result = [(chunks[0][0], chunks[0][2])]
 
     for i in range(1, len(chunks)):
-        if i in atomic:
+        text, _, end = chunks[i]
+        if atomic[i]:
             # Don't prepend overlap to atomic blocks
-            result.append(chunks[i])
+            result.append((text, end))
             continue
 
-        prev_tokens = enc.encode(chunks[i - 1])
+        prev_tokens = chunks[i - 1][1]
         overlap_text = ""
         if len(prev_tokens) > overlap_tokens:
-            overlap_tokens_slice = prev_tokens[-overlap_tokens:]
-            overlap_text = enc.decode(overlap_tokens_slice)
+            overlap_text = enc.decode(prev_tokens[-overlap_tokens:])
 
         if overlap_text:
-            result.append(overlap_text + chunks[i])
+            result.append((overlap_text + text, end))
         else:
-            result.append(chunks[i])
+            result.append((text, end))
 
     return result
 
@@ -405,54 +601,79 @@ class MarkdownChunker(BaseChunker):
         # Reserve room for overlap so chunks stay within max_tokens after overlap
         split_budget = max(max_tokens - overlap_tokens, 1) if overlap_tokens > 0 else max_tokens
 
-        # Step 1: Extract atomic blocks (tables, code blocks)
-        segments = _extract_atomic_blocks(content)
-
-        # Step 2: Split non-atomic segments, pass through atomic ones
-        raw_chunks: list[str] = []
-        atomic_indices: set[int] = set()
-        for segment_text, is_atomic in segments:
+        # Step 1: Extract atomic blocks (tables, code blocks). Segments are
+        # separated by exactly one newline, which gives their source offsets.
+        blocks: list[tuple[str, bool, int]] = []
+        segment_start = 0
+        for segment_text, is_atomic in _extract_atomic_blocks(content):
             text = segment_text.strip()
-            if not text:
-                continue
+            if text:
+                leading = len(segment_text) - len(segment_text.lstrip())
+                blocks.append((text, is_atomic, segment_start + leading))
+            segment_start += len(segment_text) + 1
+
+        # Step 2: Split non-atomic segments, pass through atomic ones.
+        # Blocks are encoded up front in a single batch call; atomic blocks
+        # only need their ids as an overlap source.
+        block_ids = iter(
+            _encode_batch(
+                [text for text, is_atomic, _ in blocks if overlap_tokens > 0 or not is_atomic]
+            )
+        )
 
+        raw_chunks: list[tuple[str, list[int], int]] = []
+        atomic_flags = bytearray()
+        for text, is_atomic, start in blocks:
             if is_atomic:
                 # Atomic blocks go through as-is (even if oversized)
-                atomic_indices.add(len(raw_chunks))
-                raw_chunks.append(text)
+                atomic_flags.append(1)
+                ids = next(block_ids) if overlap_tokens > 0 else []
+                raw_chunks.append((text, ids, start + len(text)))
             else:
                 # Recursively split non-atomic text (budget accounts for overlap)
-                splits = _recursive_split(text, split_budget, self.SEPARATORS)
+                splits = _recursive_split(
+                    text, split_budget, self.SEPARATORS, next(block_ids), start
+                )
                 raw_chunks.extend(splits)
+                atomic_flags.extend(bytes(len(splits)))
 
         # Step 3: Add overlap between consecutive non-atomic chunks
-        raw_chunks = _add_overlap(raw_chunks, overlap_tokens, atomic_indices)
-
-        # Step 4: Filter out chunks below min_tokens (merge with neighbors)
-        raw_chunks = self._merge_small_chunks(raw_chunks, min_tokens, max_tokens)
-
-        # Step 5: Build Chunk objects with metadata
-        section_tracker = _SectionTracker()
+        overlapped = _add_overlap(raw_chunks, overlap_tokens, atomic_flags)
+
+        # Steps 4-5: Merge chunks below min_tokens with their neighbors and
+        # build Chunk objects as merged chunks come out, reusing the merge
+        # step's token count when the stored text is exactly what it counted.
+        # Section paths come from a single heading scan of the document,
+        # looked up by chunk end.
+        section_tracker = _SectionTracker(content)
         chunks: list[Chunk] = []
 
-        for i, chunk_text in enumerate(raw_chunks):
-            chunk_text = chunk_text.strip()
-            if not chunk_text:
-                continue
-
-            # Extract page number from first PAGE marker (PDF-only)
-            page_match = _PAGE_MARKER_RE.search(chunk_text)
-            page_num = int(page_match.group(1)) if page_match else 0
-
-            # Strip all page markers from content before storage
-            chunk_text = _PAGE_MARKER_STRIP_RE.sub("", chunk_text).strip()
+        merged = self._merge_small_chunks(overlapped, min_tokens, max_tokens)
+        for i, (raw_text, chunk_end, known_tokens) in enumerate(merged):
+            chunk_text = raw_text.strip()
             if not chunk_text:
                 continue
+            if len(chunk_text) != len(raw_text):
+                known_tokens = None
+
+            # Extract page number from first PAGE marker (PDF-only). The
+            # substring test skips both regex passes for non-PDF content.
+            page_num = 0
+            if "<!-- PAGE:" in chunk_text:
+                page_match = _PAGE_MARKER_RE.search(chunk_text)
+                if page_match:
+                    page_num = int(page_match.group(1))
+
+                # Strip all page markers from content before storage
+                chunk_text = _PAGE_MARKER_STRIP_RE.sub("", chunk_text).strip()
+                if not chunk_text:
+                    continue
+                known_tokens = None
 
             # Update section tracking
-            section_tracker.update(chunk_text)
+            section_tracker.advance(chunk_end)
 
-            token_count = count_tokens(chunk_text)
+            token_count = count_tokens(chunk_text) if known_tokens is None else known_tokens
             chunk_id = _generate_chunk_id(result.doc_id, i, chunk_text)
 
             metadata = ChunkMetadata(
@@ -485,49 +706,74 @@ class MarkdownChunker(BaseChunker):
 
     def _merge_small_chunks(
         self,
-        chunks: list[str],
+        chunks: list[tuple[str, int]],
         min_tokens: int,
         max_tokens: int,
-    ) -> list[str]:
-        """Merge chunks smaller than min_tokens with their neighbors."""
-        if not chunks or min_tokens <= 0:
-            return chunks
-
-        result: list[str] = []
+    ) -> Iterator[tuple[str, int, int | None]]:
+        """Merge chunks smaller than min_tokens with their neighbors.
+
+        Takes (text, end) pairs and yields (text, end, token_count) triples as
+        soon as each chunk is final; a merged chunk keeps the source end
+        offset of its last part. Each chunk is encoded once and merged sizes
+        are summed from the cached counts. ``token_count`` is the exact count
+        of ``text`` for chunks passed through unmerged, and None where the
+        summed count is only an estimate or nothing was counted.
+        """
+        if min_tokens <= 0:
+            for chunk_text, chunk_end in chunks:
+                yield chunk_text, chunk_end, None
+            return
+
+        sep = "\n\n"
+        sep_tokens = count_tokens(sep)
+        # The last finished chunk is held back, as the final chunk may still
+        # be merged into it: (text, tokens, end, merged)
+        held: tuple[str, int, int, bool] | None = None
         current = ""
+        current_tokens = 0
+        current_end = 0
+        current_merged = False
 
-        for chunk_text in chunks:
+        for chunk_text, chunk_end in chunks:
+            chunk_tokens = count_tokens(chunk_text)
             if not current:
                 current = chunk_text
+                current_tokens = chunk_tokens
+                current_end = chunk_end
                 continue
 
-            current_tokens = count_tokens(current)
-
             # If current chunk is too small, try to merge
             if current_tokens < min_tokens:
-                merged = current + "\n\n" + chunk_text
-                if count_tokens(merged) <= max_tokens:
-                    current = merged
+                merged_tokens = current_tokens + sep_tokens + chunk_tokens
+                if merged_tokens <= max_tokens:
+                    current = current + sep + chunk_text
+                    current_tokens = merged_tokens
+                    current_end = chunk_end
+                    current_merged = True
                     continue
-                # Can't merge (would exceed max), keep current as-is
-                result.append(current)
-                current = chunk_text
-            else:
-                result.append(current)
-                current = chunk_text
+            # Can't or needn't merge: current is finished
+            if held is not None:
+                yield held[0], held[2], None if held[3] else held[1]
+            held = (current, current_tokens, current_end, current_merged)
+            current = chunk_text
+            current_tokens = chunk_tokens
+            current_end = chunk_end
+            current_merged = False
 
         if current:
             # If the last chunk is too small, merge with previous if possible
-            if result and count_tokens(current) < min_tokens:
-                merged = result[-1] + "\n\n" + current
-                if count_tokens(merged) <= max_tokens:
-                    result[-1] = merged
-                else:
-                    result.append(current)
-            else:
-                result.append(current)
-
-        return result
+            if held is not None and current_tokens < min_tokens:
+                prev, prev_tokens, _, _ = held
+                merged_tokens = prev_tokens + sep_tokens + current_tokens
+                if merged_tokens <= max_tokens:
+                    held = (prev + sep + current, merged_tokens, current_end, True)
+                    current = ""
+            if held is not None:
+                yield held[0], held[2], None if held[3] else held[1]
+            if current:
+                yield current, current_end, None if current_merged else current_tokens
+        elif held is not None:
+            yield held[0], held[2], None if held[3] else held[1]
 
     def _detect_content_type(self, text: str) -> str:
         """Detect the primary content type of a chunk.
@@ -542,29 +788,12 @@ class MarkdownChunker(BaseChunker):
 
         # 2. Table-based types (structural + keyword refinement)
         if _TABLE_SEP_RE.search(text):
-            if _REGISTER_KW_RE.search(text):
-                return "register_table"
-            if _PIN_MAP_KW_RE.search(text):
-                return "pin_mapping"
-            if _ELECTRICAL_KW_RE.search(text):
-                return "electrical_spec"
-            if _TIMING_KW_RE.search(text):
-                return "timing_spec"
-            return "table"
+            return _match_keyword_family(text, _TABLE_KEYWORD_PRIORITY) or "table"
 
         # 3. Domain-specific prose types (keyword-based)
-        if _ERRATA_KW_RE.search(text):
-            return "errata"
-        if _CONFIG_PROC_KW_RE.search(text):
-            return "config_procedure"
-        if _REGISTER_KW_RE.search(text):
-            return "register_description"
-        if _TIMING_KW_RE.search(text):
-            return "timing_spec"
-        if _PIN_MAP_KW_RE.search(text):
-            return "pin_mapping"
-        if _ELECTRICAL_KW_RE.search(text):
-            return "electrical_spec"
+        content_type = _match_keyword_family(text, _PROSE_KEYWORD_PRIORITY)
+        if content_type:
+            return content_type
 
         # 4. Generic structural fallbacks
         if _HEADING_RE.search(text):
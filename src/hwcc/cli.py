@@ -6,25 +6,30 @@ Typer-based command-line interface with Rich output formatting.
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+import sys
 import time
-from dataclasses import replace
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from hwcc import __version__
-from hwcc.chunk import MarkdownChunker
-from hwcc.compile.hot_context import HotContextCompiler
-from hwcc.compile.output import OutputCompiler
-from hwcc.compile.peripheral import PeripheralContextCompiler
-from hwcc.compile.templates import TARGET_REGISTRY
 from hwcc.config import load_config
-from hwcc.exceptions import BenchmarkError, CatalogError, CompileError, HwccError, StoreError
-from hwcc.ingest import detect_file_type, get_parser
+from hwcc.exceptions import (
+    BenchmarkError,
+    CatalogError,
+    CompileError,
+    HwccError,
+    PipelineError,
+    StoreError,
+)
 from hwcc.manifest import (
     DocumentEntry,
     compute_hash,
@@ -32,14 +37,13 @@ from hwcc.manifest import (
     make_doc_id,
     save_manifest,
 )
-from hwcc.pipeline import Pipeline
-from hwcc.project import ProjectManager
-from hwcc.registry import default_registry
-from hwcc.store import ChromaStore
 
 if TYPE_CHECKING:
     from hwcc.config import HwccConfig
+    from hwcc.embed.base import BaseEmbedder
     from hwcc.ingest.base import BaseParser
+    from hwcc.project import ProjectManager
+    from hwcc.types import EmbeddedChunk
 
 __all__ = ["app"]
 
@@ -74,7 +78,9 @@ app = typer.Typer(
     no_args_is_help=True,
     rich_markup_mode="rich",
 )
-console = Console()
+# Highlighting only adds colour, which is dropped anyway when output is piped;
+# skipping it there saves a regex pass over every printed line
+console = Console(highlight=sys.stdout.isatty())
 
 
 @app.callback()
@@ -110,6 +116,12 @@ def _compile_project(pm: ProjectManager, target: str = "all") -> list[Path]:
     Raises:
         typer.Exit: On compile errors.
     """
+    from hwcc.compile.hot_context import HotContextCompiler
+    from hwcc.compile.output import OutputCompiler
+    from hwcc.compile.peripheral import PeripheralContextCompiler
+    from hwcc.compile.templates import TARGET_REGISTRY
+    from hwcc.store import ChromaStore
+
     config = load_config(pm.config_path)
 
     # Validate and filter targets
@@ -168,6 +180,8 @@ def init(
     ] = "",
 ) -> None:
     """Initialize a new hwcc project in the current directory."""
+    from hwcc.project import ProjectManager
+
     pm = ProjectManager()
     try:
         rag_dir = pm.init(chip=chip, rtos=rtos, name=name)
@@ -195,23 +209,67 @@ def _dir_size(path: Path) -> int:
     """Compute total size in bytes of all files under a directory."""
     if not path.is_dir():
         return 0
-    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+    total = 0
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
+# Above this many documents, status prints the document table as plain text
+_PLAIN_TABLE_THRESHOLD = 50
+
+_DOCUMENT_COLUMNS = ("ID", "Type", "Chip", "Chunks", "Added")
+
+
+def _format_plain_table(
+    headers: tuple[str, ...],
+    rows: list[tuple[str, ...]],
+    right_justified: set[int],
+) -> str:
+    """Lay out rows as aligned text columns, matching the borderless Rich table."""
+    widths = [len(h) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    lines = []
+    for row in (headers, *rows):
+        cells = [
+            cell.rjust(width) if i in right_justified else cell.ljust(width)
+            for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+        ]
+        lines.append(("  " + "    ".join(cells)).rstrip())
+    return "\n".join(lines)
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 def _format_size(size_bytes: int) -> str:
     """Format byte count as human-readable string."""
-    if size_bytes < 1024:
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit
+    tier = min(max(0, (size_bytes.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    if tier == 0:
         return f"{size_bytes} B"
-    size_kb = size_bytes / 1024
-    if size_kb < 1024:
-        return f"{size_kb:.1f} KB"
-    size_mb = size_kb / 1024
-    return f"{size_mb:.1f} MB"
+    return f"{size_bytes / (1 << (10 * tier)):.1f} {_SIZE_UNITS[tier]}"
 
 
 @app.command()
 def status() -> None:
     """Show project status: indexed documents, chunks, config."""
+    from rich.table import Table
+
+    from hwcc.project import ProjectManager
+
     pm = ProjectManager()
     st = pm.status()
 
@@ -244,27 +302,116 @@ def status() -> None:
     console.print(summary)
 
     # Per-document table
-    if st.document_count > 0:
-        manifest = load_manifest(pm.manifest_path)
-        doc_table = Table(box=None, padding=(0, 2))
-        doc_table.add_column("ID", style="bold")
-        doc_table.add_column("Type")
-        doc_table.add_column("Chip")
-        doc_table.add_column("Chunks", justify="right")
-        doc_table.add_column("Added")
-
-        for doc in manifest.documents:
-            added_date = doc.added[:10] if len(doc.added) >= 10 else doc.added
-            doc_table.add_row(doc.id, doc.doc_type, doc.chip, str(doc.chunks), added_date)
+    if st.manifest is not None and st.document_count > 0:
+        rows: list[tuple[str, ...]] = [
+            (doc.id, doc.doc_type, doc.chip, str(doc.chunks), doc.added[:10])
+            for doc in st.manifest.documents
+        ]
 
         console.print("\nDocuments:")
-        console.print(doc_table)
+        if len(rows) > _PLAIN_TABLE_THRESHOLD:
+            # Rich measures and styles every cell; for large manifests lay
+            # out the same columns as plain text instead
+            console.print(
+                _format_plain_table(_DOCUMENT_COLUMNS, rows, right_justified={3}),
+                markup=False,
+                highlight=False,
+                soft_wrap=True,
+            )
+        else:
+            doc_table = Table(box=None, padding=(0, 2))
+            doc_table.add_column("ID", style="bold")
+            doc_table.add_column("Type")
+            doc_table.add_column("Chip")
+            doc_table.add_column("Chunks", justify="right")
+            doc_table.add_column("Added")
+            for row in rows:
+                doc_table.add_row(*row)
+            console.print(doc_table)
     else:
         console.print(
             "\n[dim]No documents indexed yet. Run [bold]hwcc add <file>[/bold] to start.[/dim]"
         )
 
 
+@dataclass(frozen=True)
+class _PendingDocument:
+    """A file that passed the add checks and still needs processing."""
+
+    path: Path
+    parser_name: str
+    doc_id: str
+    file_hash: str
+    doc_type: str
+    chip: str
+    mtime_ns: int
+    size: int
+
+
+def _build_parser(parser_name: str, config: HwccConfig) -> BaseParser:
+    """Return the parser for a detected format, honouring the PDF backend setting."""
+    from hwcc.ingest import get_parser
+
+    if parser_name == "pdf":
+        return _get_pdf_parser(config)
+    return get_parser(parser_name)
+
+
+# Threads hashing changed files ahead of the add loop
+_HASH_WORKERS = 8
+
+# Per-process state of ``add --jobs`` workers, set up by _init_ingest_worker
+_worker_embedder: dict[str, BaseEmbedder] = {}
+_worker_parsers: dict[str, BaseParser] = {}
+
+
+def _create_ingest_embedder(config: HwccConfig, rag_dir: Path) -> BaseEmbedder:
+    """Create the configured embedder, behind the on-disk vector cache if enabled."""
+    from hwcc.embed import CachedEmbedder
+    from hwcc.registry import default_registry
+
+    embedder: BaseEmbedder = default_registry.create(
+        "embedding", config.embedding.provider, config
+    )
+    if not config.embedding.cache_dir:
+        return embedder
+    model = f"{config.embedding.provider}/{config.embedding.model}"
+    return CachedEmbedder(embedder, rag_dir / config.embedding.cache_dir, model)
+
+
+def _init_ingest_worker(config: HwccConfig, rag_dir: Path) -> None:
+    """Create the embedder once per worker process, not once per file."""
+    _worker_embedder["embedder"] = _create_ingest_embedder(config, rag_dir)
+
+
+def _ingest_document(
+    path: Path, parser_name: str, config: HwccConfig, doc_type: str, chip: str
+) -> list[EmbeddedChunk]:
+    """Parse, chunk and embed one file; runs in a worker process for ``add --jobs``."""
+    from hwcc.chunk import MarkdownChunker
+    from hwcc.pipeline import parse_and_chunk
+
+    try:
+        parser = _worker_parsers.get(parser_name)
+        if parser is None:
+            parser = _worker_parsers[parser_name] = _build_parser(parser_name, config)
+        chunks = parse_and_chunk(
+            parser,
+            MarkdownChunker(),
+            config,
+            path,
+            doc_type=doc_type,
+            chip=chip,
+        )
+        if not chunks:
+            return []
+        return _worker_embedder["embedder"].embed_chunks(chunks)
+    except HwccError:
+        raise
+    except Exception as e:
+        raise PipelineError(f"Pipeline failed processing {path}: {e}") from e
+
+
 @app.command()
 def add(
     paths: Annotated[
@@ -287,8 +434,24 @@ def add(
         bool,
         typer.Option("--no-compile", help="Skip auto-compile after adding"),
     ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Process up to N files in parallel worker processes (0 = one per CPU)",
+        ),
+    ] = 1,
 ) -> None:
     """Add document(s) to the index."""
+    from hwcc.chunk import MarkdownChunker
+    from hwcc.embed import CachedEmbedder
+    from hwcc.ingest import detect_file_type
+    from hwcc.pipeline import Pipeline
+    from hwcc.project import ProjectManager
+    from hwcc.store import ChromaStore, WriteBehindStore
+
     logger = logging.getLogger(__name__)
 
     if watch:
@@ -310,7 +473,7 @@ def add(
     # Build shared pipeline components
     try:
         chunker = MarkdownChunker()
-        embedder = default_registry.create("embedding", config.embedding.provider, config)
+        embedder = _create_ingest_embedder(config, pm.rag_dir)
         store = ChromaStore(
             persist_path=pm.rag_dir / "index",
             collection_name=config.store.collection_name,
@@ -322,96 +485,223 @@ def add(
     added_count = 0
     skipped_count = 0
     total_chunks = 0
-
-    for path_str in paths:
-        file_path = Path(path_str).resolve()
-
-        if not file_path.exists():
-            console.print(f"  [red]File not found:[/red] {path_str}")
-            continue
-
-        # Detect file type
-        info = detect_file_type(file_path)
-        if not info.parser_name:
-            console.print(
-                f"  [yellow]Unsupported format:[/yellow] {file_path.name} ({info.format})"
+    pending: list[_PendingDocument] = []
+    stats_refreshed = False
+
+    # Files whose stat changed are hashed on a small thread pool (hashlib
+    # releases the GIL), so all skip decisions are ready before parsing starts
+    # Keyed by doc_id: when two paths map to one doc_id, the last one wins,
+    # as it would if the files were added one after the other
+    candidates: dict[str, tuple[_PendingDocument, Future[str]]] = {}
+    seen_paths: dict[str, Path] = {}
+    with ThreadPoolExecutor(
+        max_workers=_HASH_WORKERS, thread_name_prefix="hwcc-hash"
+    ) as hash_pool:
+        for path_str in paths:
+            # abspath normalises lexically; symlinks are only resolved if the
+            # path does not fall under the project root as given
+            file_path = Path(os.path.abspath(path_str))
+
+            if not file_path.exists():
+                console.print(f"  [red]File not found:[/red] {path_str}")
+                continue
+
+            # Detect file type
+            info = detect_file_type(file_path)
+            if not info.parser_name:
+                console.print(
+                    f"  [yellow]Unsupported format:[/yellow] {file_path.name} ({info.format})"
+                )
+                continue
+
+            # Check manifest for changes
+            doc_id = make_doc_id(file_path)
+            earlier = seen_paths.get(doc_id)
+            if earlier == file_path:
+                console.print(f"  [dim]Skipped {file_path.name} (listed twice)[/dim]")
+                skipped_count += 1
+                continue
+            if earlier is not None:
+                console.print(
+                    f"  [yellow]{path_str} has the same document ID ({doc_id}) as "
+                    f"{earlier}; only the last one is indexed[/yellow]"
+                )
+                candidates.pop(doc_id, None)
+            seen_paths[doc_id] = file_path
+            st = file_path.stat()
+
+            # Same mtime and size as when indexed: skip without reading the file
+            if manifest.is_stat_unchanged(doc_id, st.st_mtime_ns, st.st_size):
+                console.print(f"  [dim]Skipped {file_path.name} (unchanged)[/dim]")
+                skipped_count += 1
+                continue
+
+            candidate = _PendingDocument(
+                path=file_path,
+                parser_name=info.parser_name,
+                doc_id=doc_id,
+                file_hash="",
+                doc_type=doc_type if doc_type != "auto" else info.doc_type.value,
+                chip=chip or config.hardware.mcu,
+                mtime_ns=st.st_mtime_ns,
+                size=st.st_size,
             )
-            continue
-
-        # Determine effective doc_type and chip
-        effective_doc_type = doc_type if doc_type != "auto" else info.doc_type.value
-        effective_chip = chip or config.hardware.mcu
-
-        # Check manifest for changes
-        doc_id = make_doc_id(file_path)
-        file_hash = compute_hash(file_path)
+            candidates[doc_id] = (candidate, hash_pool.submit(compute_hash, file_path))
+
+        stale_ids: list[str] = []
+        for candidate, hashed in candidates.values():
+            file_hash = hashed.result()
+            existing = manifest.get_document(candidate.doc_id)
+
+            if existing is not None and existing.hash == file_hash:
+                # Content is the same but the stat moved (touched, copied over);
+                # record the new stat so the next add can skip hashing
+                manifest.add_document(
+                    replace(existing, mtime_ns=candidate.mtime_ns, size=candidate.size)
+                )
+                stats_refreshed = True
+                console.print(f"  [dim]Skipped {candidate.path.name} (unchanged)[/dim]")
+                skipped_count += 1
+                continue
 
-        if not manifest.is_changed(doc_id, file_hash):
-            console.print(f"  [dim]Skipped {file_path.name} (unchanged)[/dim]")
-            skipped_count += 1
-            continue
+            # Old chunks of a changed document are removed before re-indexing
+            if existing is not None:
+                stale_ids.append(candidate.doc_id)
 
-        # Remove old chunks if re-indexing a changed document
-        if manifest.get_document(doc_id) is not None:
-            try:
-                store.delete(doc_id)
-            except HwccError as e:
-                logger.warning("Failed to remove old chunks for %s: %s", doc_id, e)
+            pending.append(replace(candidate, file_hash=file_hash))
 
-        # Build pipeline for this file
+    if stale_ids:
         try:
-            if info.parser_name == "pdf":
-                parser = _get_pdf_parser(config)
-            else:
-                parser = get_parser(info.parser_name)
-            pipeline = Pipeline(
-                parser=parser,
-                chunker=chunker,
-                embedder=embedder,
-                store=store,
-                config=config,
-            )
-            t0 = time.monotonic()
-            with console.status(f"Processing [bold]{file_path.name}[/bold] ...", spinner="dots"):
-                chunk_count = pipeline.process(
-                    path=file_path,
-                    doc_id=doc_id,
-                    doc_type=effective_doc_type,
-                    chip=effective_chip,
-                )
-            logger.info(
-                "Processed %s in %.1fs (%d chunks)",
-                file_path.name,
-                time.monotonic() - t0,
-                chunk_count,
-            )
+            store.delete_many(stale_ids)
         except HwccError as e:
-            console.print(f"  [red]Error processing {file_path.name}:[/red] {e}")
-            logger.error("Failed to process %s: %s", file_path, e)
-            continue
-
-        # Store relative path when file is inside the project root
-        try:
-            stored_path = str(file_path.relative_to(pm.root))
-        except ValueError:
-            stored_path = str(file_path)
-
-        # Update manifest with the already-computed hash (avoid double-hashing)
-        entry = DocumentEntry(
-            id=doc_id,
-            path=stored_path,
-            doc_type=effective_doc_type,
-            hash=file_hash,
-            added=datetime.now(UTC).isoformat(),
-            chunks=chunk_count,
-            chip=effective_chip,
+            logger.warning("Failed to remove old chunks for %s: %s", ", ".join(stale_ids), e)
+
+    # With --jobs, whole files are parsed, chunked and embedded in worker
+    # processes; this process only writes the results to the store and the
+    # manifest, in input order. Chroma stays in the parent as it is not
+    # fork-safe. Largest files are submitted first so a big datasheet does
+    # not start last and hold up the whole batch.
+    workers = jobs or os.cpu_count() or 1
+    pool: ProcessPoolExecutor | None = None
+    futures: dict[str, Future[list[EmbeddedChunk]]] = {}
+    if workers > 1 and len(pending) > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=min(workers, len(pending)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_ingest_worker,
+            initargs=(config, pm.rag_dir),
         )
-        manifest.add_document(entry)
-        save_manifest(manifest, pm.manifest_path)
+        for doc in sorted(pending, key=attrgetter("size"), reverse=True):
+            futures[doc.doc_id] = pool.submit(
+                _ingest_document, doc.path, doc.parser_name, config, doc.doc_type, doc.chip
+            )
 
-        console.print(f"  [green]Added {file_path.name}[/green] ({chunk_count} chunks)")
-        added_count += 1
-        total_chunks += chunk_count
+    # Store writes run on a background thread so that persisting one file
+    # overlaps with processing the next. A file is only recorded in the
+    # manifest once its write has completed.
+    writer = WriteBehindStore(store)
+    queued: list[tuple[_PendingDocument, int]] = []
+    # One pipeline for the whole run; only the parser changes between files,
+    # and each parser is built once per format
+    pipeline: Pipeline | None = None
+    parsers: dict[str, BaseParser] = {}
+    # Every document in a batch shares one "added" timestamp
+    added_at = datetime.now(UTC).isoformat()
+    try:
+        for index, doc in enumerate(pending):
+            file_path = doc.path
+            try:
+                t0 = time.monotonic()
+                with console.status(
+                    f"Processing [bold]{file_path.name}[/bold] ...", spinner="dots"
+                ):
+                    if doc.doc_id in futures:
+                        embedded = futures[doc.doc_id].result()
+                        chunk_count = writer.add(embedded, doc.doc_id)
+                    else:
+                        parser = parsers.get(doc.parser_name)
+                        if parser is None:
+                            parser = parsers[doc.parser_name] = _build_parser(
+                                doc.parser_name, config
+                            )
+                        if pipeline is None:
+                            pipeline = Pipeline(
+                                parser=parser,
+                                chunker=chunker,
+                                embedder=embedder,
+                                store=writer,
+                                config=config,
+                            )
+                        else:
+                            pipeline.parser = parser
+                        chunk_count = pipeline.process(
+                            path=file_path,
+                            doc_id=doc.doc_id,
+                            doc_type=doc.doc_type,
+                            chip=doc.chip,
+                        )
+                logger.info(
+                    "Processed %s in %.1fs (%d chunks)",
+                    file_path.name,
+                    time.monotonic() - t0,
+                    chunk_count,
+                )
+            except (HwccError, BrokenExecutor) as e:
+                console.print(f"  [red]Error processing {file_path.name}:[/red] {e}")
+                logger.error("Failed to process %s: %s", file_path, e)
+            else:
+                queued.append((doc, chunk_count))
+
+            # Record finished writes, leaving the latest one to complete in
+            # the background unless this was the last file
+            last = index == len(pending) - 1
+            while queued and (last or len(queued) > 1):
+                done, chunk_count = queued.pop(0)
+                try:
+                    stored_count = writer.wait(done.doc_id)
+                except HwccError as e:
+                    console.print(f"  [red]Error storing {done.path.name}:[/red] {e}")
+                    logger.error("Failed to store %s: %s", done.path, e)
+                    continue
+                if stored_count is not None:
+                    chunk_count = stored_count
+
+                # Store relative path when file is inside the project root
+                try:
+                    stored_path = str(done.path.relative_to(pm.root))
+                except ValueError:
+                    try:
+                        stored_path = str(done.path.resolve().relative_to(pm.root))
+                    except ValueError:
+                        stored_path = str(done.path)
+
+                # Update manifest with the already-computed hash (avoid double-hashing)
+                entry = DocumentEntry(
+                    id=done.doc_id,
+                    path=stored_path,
+                    doc_type=done.doc_type,
+                    hash=done.file_hash,
+                    added=added_at,
+                    chunks=chunk_count,
+                    chip=done.chip,
+                    mtime_ns=done.mtime_ns,
+                    size=done.size,
+                )
+                manifest.add_document(entry)
+
+                console.print(f"  [green]Added {done.path.name}[/green] ({chunk_count} chunks)")
+                added_count += 1
+                total_chunks += chunk_count
+    finally:
+        writer.close()
+        if isinstance(embedder, CachedEmbedder):
+            embedder.close()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        # Saved once per batch, and also when interrupted, so that every
+        # file whose write was confirmed is recorded
+        if added_count or stats_refreshed:
+            save_manifest(manifest, pm.manifest_path)
 
     # Summary
     if added_count > 0:
@@ -433,6 +723,9 @@ def remove(
     doc_id: Annotated[str, typer.Argument(help="Document ID or path to remove")],
 ) -> None:
     """Remove a document from the index."""
+    from hwcc.project import ProjectManager
+    from hwcc.store import ChromaStore
+
     pm = ProjectManager()
     if not pm.is_initialized:
         console.print("[yellow]No hwcc project found.[/yellow] Run [bold]hwcc init[/bold] first.")
@@ -479,6 +772,8 @@ def compile_cmd(
     ] = "all",
 ) -> None:
     """Regenerate all output context files."""
+    from hwcc.project import ProjectManager
+
     pm = ProjectManager()
     if not pm.is_initialized:
         console.print("[yellow]No hwcc project found.[/yellow] Run [bold]hwcc init[/bold] first.")
@@ -538,6 +833,8 @@ def context(
         hwcc context --list            # list available peripherals
         hwcc context "DMA transfer"    # semantic search fallback
     """
+    from hwcc.project import ProjectManager
+
     pm = ProjectManager()
     if not pm.is_initialized:
         console.print("[yellow]No hwcc project found.[/yellow] Run [bold]hwcc init[/bold] first.")
@@ -614,6 +911,8 @@ def _has_path_chars(name: str) -> bool:
 
 def _context_list(peripherals_dir: Path) -> None:
     """List available peripheral context files."""
+    from rich.table import Table
+
     if not peripherals_dir.is_dir():
         console.print("[dim]No peripheral context files found.[/dim]")
         console.print("Run [bold]hwcc add[/bold] and [bold]hwcc compile[/bold] first.")
@@ -671,7 +970,9 @@ def _context_search(
     copy: bool,
 ) -> None:
     """Fall back to semantic search when no peripheral file matches."""
+    from hwcc.registry import default_registry
     from hwcc.search import SearchEngine
+    from hwcc.store import ChromaStore
 
     config = load_config(pm.config_path)
 
@@ -795,7 +1096,10 @@ def search(
     ] = False,
 ) -> None:
     """Search indexed hardware documentation."""
+    from hwcc.project import ProjectManager
+    from hwcc.registry import default_registry
     from hwcc.search import SearchEngine
+    from hwcc.store import ChromaStore
 
     pm = ProjectManager()
     if not pm.is_initialized:
@@ -888,6 +1192,8 @@ def mcp(
     ] = False,
 ) -> None:
     """Start MCP server for dynamic hardware context serving."""
+    from hwcc.project import ProjectManager
+
     if config:
         import json
 
@@ -954,6 +1260,8 @@ def catalog_list(
     ] = "",
 ) -> None:
     """List or search SVD devices in the catalog."""
+    from rich.table import Table
+
     from hwcc.catalog import CatalogIndex
 
     try:
@@ -1024,6 +1332,12 @@ def catalog_add(
     import tempfile
 
     from hwcc.catalog import CatalogIndex, download_svd
+    from hwcc.chunk import MarkdownChunker
+    from hwcc.ingest import get_parser
+    from hwcc.pipeline import Pipeline
+    from hwcc.project import ProjectManager
+    from hwcc.registry import default_registry
+    from hwcc.store import ChromaStore
 
     pm = ProjectManager()
     if not pm.is_initialized:
@@ -1256,6 +1570,7 @@ def bench_run(
         save_report,
     )
     from hwcc.bench.runner import prepare_conditions, run_benchmark
+    from hwcc.project import ProjectManager
 
     # Load dataset
     dataset_path = Path(dataset_file)
@@ -1340,7 +1655,9 @@ def bench_run(
     # Set up SearchEngine if hwcc_rag requested
     search_engine = None
     if any(c.name == "hwcc_rag" for c in filtered):
+        from hwcc.registry import default_registry
         from hwcc.search import SearchEngine
+        from hwcc.store import ChromaStore
 
         config = load_config(pm.config_path) if pm.is_initialized else None
         if config is None:
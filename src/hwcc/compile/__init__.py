@@ -1,23 +1,38 @@
-"""Context compilation — generates output files from indexed documents."""
-
-from hwcc.compile.base import BaseCompiler
-from hwcc.compile.citations import build_title_map, format_citation
-from hwcc.compile.context import (
-    CompileContext,
-    DocumentSummary,
-    ErrataSummary,
-    PeripheralSummary,
-    TargetInfo,
-)
-from hwcc.compile.hot_context import HotContextCompiler
-from hwcc.compile.output import OutputCompiler
-from hwcc.compile.peripheral import PeripheralContextCompiler
-from hwcc.compile.relevance import (
-    build_peripheral_keywords,
-    rank_chunks,
-    score_chunk_relevance,
-)
-from hwcc.compile.templates import TARGET_REGISTRY, TemplateEngine
+"""Context compilation — generates output files from indexed documents.
+
+Public names are loaded on first access (PEP 562), so importing one
+submodule such as ``hwcc.compile.citations`` does not pull in Jinja2 and
+every compiler.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hwcc.compile.base import BaseCompiler
+    from hwcc.compile.citations import (
+        build_citation_formatter,
+        build_title_map,
+        format_citation,
+    )
+    from hwcc.compile.context import (
+        CompileContext,
+        DocumentSummary,
+        ErrataSummary,
+        PeripheralSummary,
+        TargetInfo,
+    )
+    from hwcc.compile.hot_context import HotContextCompiler
+    from hwcc.compile.output import OutputCompiler
+    from hwcc.compile.peripheral import PeripheralContextCompiler
+    from hwcc.compile.relevance import (
+        build_peripheral_keywords,
+        rank_chunks,
+        score_chunk_relevance,
+    )
+    from hwcc.compile.templates import TARGET_REGISTRY, TemplateEngine
 
 __all__ = [
     "TARGET_REGISTRY",
@@ -31,9 +46,44 @@ __all__ = [
     "PeripheralSummary",
     "TargetInfo",
     "TemplateEngine",
+    "build_citation_formatter",
     "build_peripheral_keywords",
     "build_title_map",
     "format_citation",
     "rank_chunks",
     "score_chunk_relevance",
 ]
+
+# Public name -> submodule defining it
+_LAZY = {
+    "TARGET_REGISTRY": "hwcc.compile.templates",
+    "BaseCompiler": "hwcc.compile.base",
+    "CompileContext": "hwcc.compile.context",
+    "DocumentSummary": "hwcc.compile.context",
+    "ErrataSummary": "hwcc.compile.context",
+    "HotContextCompiler": "hwcc.compile.hot_context",
+    "OutputCompiler": "hwcc.compile.output",
+    "PeripheralContextCompiler": "hwcc.compile.peripheral",
+    "PeripheralSummary": "hwcc.compile.context",
+    "TargetInfo": "hwcc.compile.context",
+    "TemplateEngine": "hwcc.compile.templates",
+    "build_citation_formatter": "hwcc.compile.citations",
+    "build_peripheral_keywords": "hwcc.compile.relevance",
+    "build_title_map": "hwcc.compile.citations",
+    "format_citation": "hwcc.compile.citations",
+    "rank_chunks": "hwcc.compile.relevance",
+    "score_chunk_relevance": "hwcc.compile.relevance",
+}
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
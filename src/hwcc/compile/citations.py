@@ -6,15 +6,17 @@ Generates inline source citations like:
 
 from __future__ import annotations
 
+import functools
 import logging
-from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from hwcc.manifest import Manifest
     from hwcc.types import ChunkMetadata
 
-__all__ = ["build_title_map", "format_citation"]
+__all__ = ["build_citation_formatter", "build_title_map", "format_citation"]
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +26,69 @@ def build_title_map(manifest: Manifest) -> dict[str, str]:
 
     Falls back to deriving title from the document path.
     """
-    title_map: dict[str, str] = {}
-    for entry in manifest.documents:
-        name = PurePosixPath(entry.path).stem
-        title = name.replace("_", " ").replace("-", " ") if name else entry.id
-        title_map[entry.id] = title
-    return title_map
+    return {
+        entry.id: _path_stem(entry.path).replace("_", " ").replace("-", " ") or entry.id
+        for entry in manifest.documents
+    }
+
+
+def _path_stem(path: str) -> str:
+    """Return ``PurePosixPath(path).stem`` without building a path object."""
+    name = path.rstrip("/").rpartition("/")[2]
+    dot = name.rfind(".")
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
+
+def _brief_section(section_path: str) -> str:
+    """Return the last two elements of a ``" > "``-separated section path."""
+    last = section_path.rfind(" > ")
+    if last < 0:
+        return section_path
+    previous = section_path.rfind(" > ", 0, last)
+    return section_path if previous < 0 else section_path[previous + 3 :]
+
+
+@functools.lru_cache(maxsize=8192)
+def _render_citation(title: str, section_path: str, page: int) -> str:
+    """Render a citation; memoized as the same chunk is cited by several outputs."""
+    section = f", §{_brief_section(section_path)}" if section_path else ""
+    page_part = f", p.{page}" if page > 0 else ""
+    return f"*Source: {title}{section}{page_part}*"
+
+
+def build_citation_formatter(
+    title_map: dict[str, str],
+    doc_type: str,
+) -> Callable[[ChunkMetadata], str]:
+    """Build a citation formatter specialised for one document type.
+
+    The returned callable produces the same strings as
+    :func:`format_citation` for chunks of ``doc_type``, without re-checking
+    the type on every call. Build it once and reuse it across the chunks
+    of a document.
+
+    Args:
+        title_map: Mapping of doc_id to human-readable title.
+        doc_type: Document type the formatter will be used for.
+
+    Returns:
+        Function formatting the citation for a chunk's metadata.
+    """
+    get_title = title_map.get
+
+    if doc_type == "pdf":
+
+        def _fmt_pdf(meta: ChunkMetadata) -> str:
+            return _render_citation(
+                get_title(meta.doc_id, meta.doc_id), meta.section_path, meta.page
+            )
+
+        return _fmt_pdf
+
+    def _fmt_other(meta: ChunkMetadata) -> str:
+        return _render_citation(get_title(meta.doc_id, meta.doc_id), meta.section_path, 0)
+
+    return _fmt_other
 
 
 def format_citation(
@@ -50,16 +109,8 @@ def format_citation(
     Returns:
         Formatted citation string in markdown italic.
     """
-    title = title_map.get(meta.doc_id, meta.doc_id)
-    parts: list[str] = [title]
-
-    if meta.section_path:
-        # Truncate to last 2 path elements for brevity
-        elements = meta.section_path.split(" > ")
-        brief = " > ".join(elements[-2:]) if len(elements) > 2 else meta.section_path
-        parts.append(f"§{brief}")
-
-    if meta.doc_type == "pdf" and meta.page > 0:
-        parts.append(f"p.{meta.page}")
-
-    return f"*Source: {', '.join(parts)}*"
+    return _render_citation(
+        title_map.get(meta.doc_id, meta.doc_id),
+        meta.section_path,
+        meta.page if meta.doc_type == "pdf" else 0,
+    )
@@ -6,7 +6,7 @@ These frozen dataclasses define the contract between the compile logic
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -67,12 +67,13 @@ class ErrataSummary:
     severity: str = "medium"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompileContext:
     """All data available to templates during compilation.
 
     Populated by the compile stage (tasks 2.1, 2.2) and passed
-    to TemplateEngine.render().
+    to TemplateEngine.render(). Derive modified copies with
+    :meth:`with_overrides`.
     """
 
     # From config — project
@@ -135,6 +136,7 @@ class CompileContext:
         """Create a CompileContext pre-filled from project configuration."""
         from hwcc import __version__
 
+        now = datetime.now(UTC)
         return cls(
             project_name=config.project.name,
             project_description=config.project.description,
@@ -159,5 +161,28 @@ class CompileContext:
             naming=config.conventions.naming,
             pin_assignments=tuple(sorted(config.pins.items())),
             hwcc_version=__version__,
-            generated_at=datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC"),
+            # Same as strftime("%Y-%m-%d %H:%M UTC") without parsing a format
+            generated_at=(
+                f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d} UTC"
+            ),
         )
+
+    def with_overrides(self, **changes: object) -> CompileContext:
+        """Return a copy with the given fields replaced.
+
+        Same result as ``dataclasses.replace`` but copies the slots
+        directly instead of re-running ``__init__``, which matters when
+        the hot-context budget search derives a series of contexts.
+
+        Raises:
+            TypeError: If a keyword is not a CompileContext field.
+        """
+        clone = object.__new__(type(self))
+        for name in _CONTEXT_FIELDS:
+            object.__setattr__(clone, name, changes.pop(name, getattr(self, name)))
+        if changes:
+            raise TypeError(f"Unknown CompileContext field(s): {', '.join(sorted(changes))}")
+        return clone
+
+
+_CONTEXT_FIELDS = tuple(f.name for f in fields(CompileContext))
@@ -8,8 +8,8 @@ respecting the configured line budget.
 from __future__ import annotations
 
 import logging
-from dataclasses import replace
 from datetime import UTC, datetime
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from hwcc.compile.base import BaseCompiler
@@ -20,6 +20,7 @@ from hwcc.exceptions import CompileError, ManifestError, StoreError
 from hwcc.manifest import load_manifest, save_manifest
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from hwcc.config import HwccConfig
@@ -108,80 +109,60 @@ class HotContextCompiler(BaseCompiler):
         # Start with config data
         context = CompileContext.from_config(config)
 
-        # Add document summaries from manifest
-        documents = self._gather_documents()
-
-        # Add peripheral summaries from store metadata
-        peripherals = self._gather_peripherals(store)
-
-        # Replace compiled data fields (frozen dataclass requires replace)
-        return replace(
-            context,
-            documents=tuple(documents),
-            peripherals=tuple(peripherals),
+        # Fill in compiled data fields (the context is frozen):
+        # document summaries from the manifest, peripherals from store metadata
+        return context.with_overrides(
+            documents=tuple(self._gather_documents()),
+            peripherals=tuple(self._gather_peripherals(store)),
         )
 
-    def _gather_documents(self) -> list[DocumentSummary]:
-        """Extract document summaries from the manifest."""
+    def _gather_documents(self) -> Iterator[DocumentSummary]:
+        """Yield document summaries from the manifest."""
         if not self._manifest_path.exists():
-            return []
+            return
 
         try:
             manifest = load_manifest(self._manifest_path)
         except ManifestError:
             logger.warning("Could not load manifest, skipping document data")
-            return []
+            return
 
         title_map = build_title_map(manifest)
-        summaries: list[DocumentSummary] = []
         for entry in manifest.documents:
-            title = title_map.get(entry.id, entry.id)
-            summaries.append(
-                DocumentSummary(
-                    doc_id=entry.id,
-                    title=title,
-                    doc_type=entry.doc_type,
-                    chip=entry.chip,
-                    chunk_count=entry.chunks,
-                )
+            yield DocumentSummary(
+                doc_id=entry.id,
+                title=title_map.get(entry.id, entry.id),
+                doc_type=entry.doc_type,
+                chip=entry.chip,
+                chunk_count=entry.chunks,
             )
-        return summaries
 
     def _gather_peripherals(self, store: BaseStore) -> list[PeripheralSummary]:
         """Extract unique peripheral names and register counts from store metadata."""
         try:
-            all_metadata = store.get_chunk_metadata()
+            # Only chunks tagged with a peripheral contribute; let the store filter
+            tagged_metadata = store.get_chunk_metadata(where={"peripheral": {"$ne": ""}})
         except StoreError:
             logger.warning("Could not query store metadata, skipping peripheral data")
             return []
 
-        # Count SVD chunks per (peripheral, chip) for register_count.
-        # TODO: Use filtered store.get_chunk_metadata(where={"doc_type": "svd"}).
+        # Count SVD chunks per (peripheral, chip) for register_count; the
+        # dict also keeps each pair's first-seen order.
         svd_counts: dict[tuple[str, str], int] = {}
-        seen: set[tuple[str, str]] = set()
-        peripheral_keys: list[tuple[str, str]] = []
 
-        for meta in all_metadata:
+        for meta in tagged_metadata:
             if not meta.peripheral:
                 continue
             key = (meta.peripheral, meta.chip)
-            if key not in seen:
-                seen.add(key)
-                peripheral_keys.append(key)
-            if meta.doc_type == "svd":
-                svd_counts[key] = svd_counts.get(key, 0) + 1
+            svd_counts[key] = svd_counts.get(key, 0) + (1 if meta.doc_type == "svd" else 0)
 
         peripherals = [
-            PeripheralSummary(
-                name=name,
-                chip=chip,
-                register_count=svd_counts.get((name, chip), 0),
-            )
-            for name, chip in peripheral_keys
+            PeripheralSummary(name=name, chip=chip, register_count=count)
+            for (name, chip), count in svd_counts.items()
         ]
 
         # Sort alphabetically for stable output
-        peripherals.sort(key=lambda p: p.name)
+        peripherals.sort(key=attrgetter("name"))
         return peripherals
 
     def _render_within_budget(self, context: CompileContext, max_lines: int) -> str:
@@ -190,57 +171,78 @@ class HotContextCompiler(BaseCompiler):
         If the rendered output exceeds max_lines, progressively remove
         lower-priority sections and re-render:
             1. Remove conventions (lowest priority)
-            2. Truncate peripheral list
-            3. Remove peripheral list entirely
-            4. Truncate document table
-            5. Remove document table entirely
+            2. Remove pin assignments
+            3. Truncate peripheral list, then remove it entirely
+            4. Truncate document table, then remove it entirely
         Errata and hardware/software info are always kept.
+
+        With the built-in template, steps whose :meth:`_estimate_lines`
+        already exceeds the budget cannot fit and are skipped without
+        rendering. A user override may be more compact than that estimate,
+        so every step of an overridden template is rendered and counted.
         """
-        content = self._engine.render(_TEMPLATE_NAME, context)
-        if self._count_lines(content) <= max_lines:
-            return content
+        use_estimate = not self._engine.is_overridden(_TEMPLATE_NAME)
+        content = ""
+        candidate = context
+        for candidate in self._truncation_steps(context):
+            if use_estimate and self._estimate_lines(candidate) > max_lines:
+                content = ""
+                continue
+            content = self._engine.render(_TEMPLATE_NAME, candidate)
+            if self._count_lines(content) <= max_lines:
+                return content
+
+        # Last resort: return what we have (header + hardware only)
+        return content or self._engine.render(_TEMPLATE_NAME, candidate)
+
+    @staticmethod
+    def _truncation_steps(context: CompileContext) -> Iterator[CompileContext]:
+        """Yield the context followed by each truncation, highest priority first."""
+        yield context
 
         # Priority 5 (lowest): remove conventions
-        reduced = replace(
-            context,
-            register_access="",
-            error_handling="",
-            naming="",
-        )
-        content = self._engine.render(_TEMPLATE_NAME, reduced)
-        if self._count_lines(content) <= max_lines:
-            return content
+        reduced = context.with_overrides(register_access="", error_handling="", naming="")
+        yield reduced
 
         # Priority 4.5: remove pin assignments
         if reduced.pin_assignments:
-            reduced = replace(reduced, pin_assignments=())
-            content = self._engine.render(_TEMPLATE_NAME, reduced)
-            if self._count_lines(content) <= max_lines:
-                return content
+            reduced = reduced.with_overrides(pin_assignments=())
+            yield reduced
 
         # Priority 4: truncate peripherals progressively
-        if reduced.peripherals:
-            current_count = len(reduced.peripherals)
-            truncated = reduced
-            for limit in (20, 10, 5, 0):
-                if limit >= current_count:
-                    continue
-                truncated = replace(reduced, peripherals=reduced.peripherals[:limit])
-                content = self._engine.render(_TEMPLATE_NAME, truncated)
-                if self._count_lines(content) <= max_lines:
-                    return content
-            reduced = truncated
+        for limit in (20, 10, 5, 0):
+            if limit < len(reduced.peripherals):
+                reduced = reduced.with_overrides(peripherals=reduced.peripherals[:limit])
+                yield reduced
 
         # Priority 3: truncate documents progressively
-        if reduced.documents:
-            for limit in (10, 5, 0):
-                truncated = replace(reduced, documents=reduced.documents[:limit])
-                content = self._engine.render(_TEMPLATE_NAME, truncated)
-                if self._count_lines(content) <= max_lines:
-                    return content
+        for limit in (10, 5, 0):
+            if limit < len(reduced.documents):
+                reduced = reduced.with_overrides(documents=reduced.documents[:limit])
+                yield reduced
 
-        # Last resort: return what we have (header + hardware only)
-        return content
+    @staticmethod
+    def _estimate_lines(context: CompileContext) -> int:
+        """Lower bound on the rendered line count of ``hot_context.md.j2``.
+
+        Counts the title plus the fixed lines of each list section; the
+        hardware and software sections are ignored. Every section renders
+        at least this many lines, so a context whose estimate exceeds the
+        budget can never fit.
+        """
+        lines = 1  # title
+        if context.pin_assignments:
+            lines += 3 + len(context.pin_assignments)  # heading + table header
+        if context.documents:
+            lines += 3 + len(context.documents)  # heading + table header
+        if context.peripherals:
+            lines += 1 + len(context.peripherals)  # heading
+        if context.errata:
+            lines += 1 + len(context.errata)  # heading
+        conventions = (context.register_access, context.error_handling, context.naming)
+        if any(conventions):
+            lines += 1 + sum(1 for value in conventions if value)
+        return lines
 
     def _update_manifest_timestamp(self) -> None:
         """Update manifest.last_compiled to current time."""
@@ -255,5 +257,10 @@ class HotContextCompiler(BaseCompiler):
 
     @staticmethod
     def _count_lines(content: str) -> int:
-        """Count lines in rendered content (including blank lines)."""
-        return len(content.strip().splitlines())
+        """Count lines in rendered content (including blank lines).
+
+        Counts newline characters rather than materializing the lines;
+        leading and trailing whitespace is ignored.
+        """
+        stripped = content.strip()
+        return stripped.count("\n") + 1 if stripped else 0
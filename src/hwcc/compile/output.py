@@ -8,7 +8,6 @@ non-destructive injection.
 from __future__ import annotations
 
 import logging
-from dataclasses import replace
 from typing import TYPE_CHECKING
 
 from hwcc.compile.base import BaseCompiler
@@ -26,6 +25,9 @@ __all__ = ["OutputCompiler"]
 
 logger = logging.getLogger(__name__)
 
+# For the unknown-target warning
+_SUPPORTED_TARGETS = ", ".join(sorted(TARGET_REGISTRY))
+
 
 class OutputCompiler(BaseCompiler):
     """Compiles tool-specific output files with non-destructive injection.
@@ -62,19 +64,21 @@ class OutputCompiler(BaseCompiler):
         """
         try:
             context = self._build_context(config)
+            # Every target renders the same context; flatten it only once
+            variables = self._engine.flatten(context)
             output_paths: list[Path] = []
 
             for target in config.output.targets:
-                if target not in TARGET_REGISTRY:
+                info = TARGET_REGISTRY.get(target)
+                if info is None:
                     logger.warning(
                         "Unknown output target %r, skipping (supported: %s)",
                         target,
-                        ", ".join(sorted(TARGET_REGISTRY)),
+                        _SUPPORTED_TARGETS,
                     )
                     continue
 
-                info = TARGET_REGISTRY[target]
-                rendered = self._engine.render_target(target, context)
+                rendered = self._engine.render(info.template, variables)
                 output_path = self._project_root / info.output_path
 
                 # Ensure parent directory exists
@@ -102,7 +106,7 @@ class OutputCompiler(BaseCompiler):
         # Read pre-rendered hot context if available
         hot_context = self._read_hot_context()
         if hot_context:
-            context = replace(context, hot_context=hot_context)
+            context = context.with_overrides(hot_context=hot_context)
 
         return context
 
@@ -113,11 +117,10 @@ class OutputCompiler(BaseCompiler):
             Hot context content, or empty string if not available.
         """
         hot_path = self._rag_dir / "context" / "hot.md"
-        if not hot_path.exists():
-            return ""
-
         try:
             return hot_path.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return ""
         except OSError:
             logger.warning("Could not read hot context from %s", hot_path)
             return ""
@@ -148,9 +151,12 @@ class OutputCompiler(BaseCompiler):
 
         existing = path.read_text(encoding="utf-8")
         begin_idx = existing.find(begin_marker)
-        end_idx = existing.find(end_marker)
+        # Only an END after the BEGIN closes the section; scan from there on
+        end_idx = (
+            existing.find(end_marker, begin_idx + len(begin_marker)) if begin_idx >= 0 else -1
+        )
 
-        if begin_idx >= 0 and end_idx >= 0 and end_idx > begin_idx:
+        if end_idx >= 0:
             # Extract only the marker-bounded section from rendered content
             # (prevents duplication of pre-marker content like cursor frontmatter)
             rendered_begin = rendered.find(begin_marker)
@@ -7,7 +7,8 @@ with cross-document content (datasheets, reference manuals) when available.
 from __future__ import annotations
 
 import logging
-from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from hwcc.compile.base import BaseCompiler
@@ -19,6 +20,7 @@ from hwcc.exceptions import CompileError, ManifestError
 from hwcc.manifest import load_manifest
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterable
     from pathlib import Path
 
     from hwcc.config import HwccConfig
@@ -37,6 +39,12 @@ _MAX_DETAIL_CHUNKS = 5
 # Maximum number of usage pattern chunks per peripheral.
 _MAX_USAGE_PATTERNS = 5
 
+# Leading register-map lines searched for the ``**Description:**`` line.
+_DESCRIPTION_SEARCH_LINES = 20
+
+# Threads writing rendered peripheral files to disk.
+_WRITE_WORKERS = 8
+
 # Keywords in section_path that indicate a usage/configuration procedure.
 _USAGE_KEYWORDS: frozenset[str] = frozenset(
     {
@@ -51,6 +59,17 @@ _USAGE_KEYWORDS: frozenset[str] = frozenset(
 )
 
 
+def _second_path_element(section_path: str) -> str | None:
+    """Return the stripped 2nd ``" > "``-separated element, or None if absent.
+
+    Uses ``str.partition`` so no list of all path elements is built.
+    """
+    _first, sep, rest = section_path.partition(" > ")
+    if not sep:
+        return None
+    return rest.partition(" > ")[0].strip()
+
+
 class PeripheralContextCompiler(BaseCompiler):
     """Compiles .rag/context/peripherals/<name>.md per peripheral.
 
@@ -69,6 +88,8 @@ class PeripheralContextCompiler(BaseCompiler):
         self._rag_dir = project_root / ".rag"
         self._peripherals_dir = self._rag_dir / "context" / "peripherals"
         self._engine = TemplateEngine(project_root)
+        # chunk_id -> relevance tokens, shared by every peripheral in one compile
+        self._token_cache: dict[str, set[str]] = {}
 
     def compile(self, store: BaseStore, config: HwccConfig) -> list[Path]:
         """Compile per-peripheral context files.
@@ -87,6 +108,7 @@ class PeripheralContextCompiler(BaseCompiler):
         Raises:
             CompileError: If compilation fails.
         """
+        self._token_cache = {}
         try:
             self._peripherals_dir.mkdir(parents=True, exist_ok=True)
 
@@ -98,7 +120,8 @@ class PeripheralContextCompiler(BaseCompiler):
                 return []
 
             # Discover peripherals from SVD section paths
-            peripherals = self._discover_peripherals(svd_chunks)
+            svd_by_name = self._group_by_peripheral(svd_chunks)
+            peripherals = self._peripheral_keys(svd_by_name)
             if not peripherals:
                 logger.info("No peripherals found in SVD data")
                 return []
@@ -114,31 +137,51 @@ class PeripheralContextCompiler(BaseCompiler):
             for name, _chip in peripherals:
                 name_counts[name] = name_counts.get(name, 0) + 1
 
-            # Load non-SVD chunks for cross-document enrichment
-            non_svd_chunks = store.get_chunks(where={"doc_type": {"$ne": "svd"}})
+            # Stream non-SVD chunks for cross-document enrichment, keeping only
+            # those whose section_path names a discovered peripheral
+            non_svd_by_part = self._index_by_section_part(
+                store.iter_chunks(where={"doc_type": {"$ne": "svd"}}),
+                keep={n.lower() for n in svd_by_name},
+            )
+
+            # Split both indexes by chip for multi-chip projects
+            svd_by_name_chip = self._index_by_chip(svd_by_name)
+            non_svd_by_name_chip = self._index_by_chip(non_svd_by_part)
+
+            # Pins are bucketed once instead of re-sorted per peripheral
+            pins_by_prefix = self._index_pins(config.pins)
 
             # Build title map for citations
             title_map = self._build_title_map()
 
             # Generate context file per peripheral
-            base_context = CompileContext.from_config(config)
+            # Flatten the shared context once; each peripheral overrides a few keys
+            base_variables = self._engine.flatten(CompileContext.from_config(config))
             output_paths: list[Path] = []
+            rendered: dict[Path, str] = {}
 
             for name, chip in peripherals:
-                register_map = self._extract_register_map(name, svd_chunks, chip)
+                # Only chunks indexed under this name (and chip) can match it,
+                # so the helpers below need no chip filter of their own
+                if chip:
+                    peripheral_chunks = svd_by_name_chip[(name, chip)]
+                    mentioning_chunks = non_svd_by_name_chip.get((name.lower(), chip), [])
+                else:
+                    peripheral_chunks = svd_by_name[name]
+                    mentioning_chunks = non_svd_by_part.get(name.lower(), [])
+
+                register_map = self._extract_register_map(name, peripheral_chunks)
                 description = self._extract_description(register_map)
 
                 # Extract usage patterns first, then exclude from details
                 usage_patterns, usage_ids = self._extract_usage_patterns(
                     name,
-                    non_svd_chunks,
-                    chip,
+                    mentioning_chunks,
                     title_map=title_map,
                 )
                 details = self._gather_peripheral_details(
                     name,
-                    non_svd_chunks,
-                    chip,
+                    mentioning_chunks,
                     title_map=title_map,
                     register_map=register_map,
                     description=description,
@@ -147,33 +190,27 @@ class PeripheralContextCompiler(BaseCompiler):
 
                 # Add SVD source citation to register map (one per unique doc_id)
                 if register_map and title_map:
-                    seen_doc_ids: set[str] = set()
-                    svd_citations: list[str] = []
-                    for c in sorted(svd_chunks, key=lambda c: c.metadata.doc_id):
-                        if (
-                            self._chunk_belongs_to_peripheral(c, name)
-                            and (not chip or c.metadata.chip == chip)
-                            and c.metadata.doc_id not in seen_doc_ids
-                        ):
-                            seen_doc_ids.add(c.metadata.doc_id)
-                            svd_citations.append(format_citation(c.metadata, title_map))
+                    svd_citations = [
+                        format_citation(c.metadata, title_map)
+                        for c in self._first_chunk_per_doc(peripheral_chunks)
+                    ]
                     if svd_citations:
                         register_map += "\n\n" + "\n".join(svd_citations)
 
                 # Filter pins for this peripheral
-                filtered_pins = self._filter_pins_for_peripheral(name, config.pins)
+                filtered_pins = pins_by_prefix.get(name.lower(), [])
 
-                ctx = replace(
-                    base_context,
-                    peripheral_name=name,
-                    peripheral_description=description,
-                    register_map=register_map,
-                    usage_patterns=usage_patterns,
-                    peripheral_details=details,
-                    peripheral_pins=tuple(filtered_pins),
-                )
+                variables = {
+                    **base_variables,
+                    "peripheral_name": name,
+                    "peripheral_description": description,
+                    "register_map": register_map,
+                    "usage_patterns": usage_patterns,
+                    "peripheral_details": details,
+                    "peripheral_pins": tuple(filtered_pins),
+                }
 
-                content = self._engine.render(_TEMPLATE_NAME, ctx)
+                content = self._engine.render(_TEMPLATE_NAME, variables)
 
                 # Include chip in filename when multiple chips define same peripheral
                 if name_counts[name] > 1:
@@ -182,10 +219,20 @@ class PeripheralContextCompiler(BaseCompiler):
                     filename = f"{name.lower()}.md"
 
                 output_path = self._peripherals_dir / filename
-                output_path.write_text(content, encoding="utf-8")
+                rendered[output_path] = content
                 output_paths.append(output_path)
 
-                logger.info("Compiled peripheral context: %s", filename)
+            # Rendering stays serial; only the file writes overlap
+            with ThreadPoolExecutor(
+                max_workers=_WRITE_WORKERS, thread_name_prefix="hwcc-write"
+            ) as executor:
+                writes = [
+                    executor.submit(path.write_text, content, encoding="utf-8")
+                    for path, content in rendered.items()
+                ]
+                for path, future in zip(rendered, writes, strict=True):
+                    future.result()
+                    logger.info("Compiled peripheral context: %s", path.name)
 
             logger.info("Compiled %d peripheral context files", len(output_paths))
 
@@ -214,13 +261,36 @@ class PeripheralContextCompiler(BaseCompiler):
         Returns:
             Sorted list of (signal_name, pin) tuples.
         """
-        prefix = peripheral_name.lower() + "_"
-        filtered: list[tuple[str, str]] = []
+        return PeripheralContextCompiler._index_pins(pins).get(peripheral_name.lower(), [])
+
+    @staticmethod
+    def _index_pins(pins: dict[str, str]) -> dict[str, list[tuple[str, str]]]:
+        """Index pin assignments by every lower-cased ``"_"``-delimited key prefix.
+
+        ``index[name.lower()]`` equals :meth:`_filter_pins_for_peripheral`
+        for ``name``, so names that contain underscores (``USB_OTG_FS``)
+        still match. Each bucket keeps sorted key order.
+        """
+        index: dict[str, list[tuple[str, str]]] = {}
         for key, pin in sorted(pins.items()):
-            if key.lower().startswith(prefix):
-                signal = key[len(prefix) :].upper()
-                filtered.append((signal, pin))
-        return filtered
+            lowered = key.lower()
+            cut = lowered.find("_")
+            while cut >= 0:
+                index.setdefault(lowered[:cut], []).append((key[cut + 1 :].upper(), pin))
+                cut = lowered.find("_", cut + 1)
+        return index
+
+    @staticmethod
+    def _first_chunk_per_doc(chunks: list[Chunk]) -> list[Chunk]:
+        """Return the first chunk of each doc_id, ordered by doc_id.
+
+        Only the distinct doc_ids are sorted (usually one per peripheral),
+        not the chunks themselves.
+        """
+        first: dict[str, Chunk] = {}
+        for chunk in chunks:
+            first.setdefault(chunk.metadata.doc_id, chunk)
+        return [first[doc_id] for doc_id in sorted(first)]
 
     def _build_title_map(self) -> dict[str, str]:
         """Build doc_id to title mapping from manifest for citations."""
@@ -249,21 +319,64 @@ class PeripheralContextCompiler(BaseCompiler):
         Returns:
             Sorted list of (peripheral_name, chip) tuples.
         """
-        seen: set[tuple[str, str]] = set()
-        peripherals: list[tuple[str, str]] = []
+        return self._peripheral_keys(self._group_by_peripheral(svd_chunks))
 
+    @staticmethod
+    def _group_by_peripheral(svd_chunks: list[Chunk]) -> dict[str, list[Chunk]]:
+        """Group SVD chunks by peripheral name (2nd section_path element).
+
+        Chunks without a peripheral element are dropped. Each group keeps
+        the store order of its chunks.
+        """
+        groups: dict[str, list[Chunk]] = {}
         for chunk in svd_chunks:
-            parts = chunk.metadata.section_path.split(" > ")
-            if len(parts) >= 2:
-                peripheral_name = parts[1].strip()
-                chip = chunk.metadata.chip
-                key = (peripheral_name, chip)
-                if key not in seen:
-                    seen.add(key)
-                    peripherals.append(key)
-
-        peripherals.sort(key=lambda p: p[0])
-        return peripherals
+            name = _second_path_element(chunk.metadata.section_path)
+            if name is not None:
+                groups.setdefault(name, []).append(chunk)
+        return groups
+
+    @staticmethod
+    def _peripheral_keys(groups: dict[str, list[Chunk]]) -> list[tuple[str, str]]:
+        """List (peripheral_name, chip) pairs sorted by name.
+
+        Chips of one peripheral keep the order they first appear in.
+        """
+        return [
+            (name, chip)
+            for name in sorted(groups)
+            for chip in dict.fromkeys(c.metadata.chip for c in groups[name])
+        ]
+
+    @staticmethod
+    def _index_by_chip(groups: dict[str, list[Chunk]]) -> dict[tuple[str, str], list[Chunk]]:
+        """Split each group by chip, keyed by ``(group_key, chip)``.
+
+        Chunks keep their order within each group.
+        """
+        index: dict[tuple[str, str], list[Chunk]] = {}
+        for key, chunks in groups.items():
+            for chunk in chunks:
+                index.setdefault((key, chunk.metadata.chip), []).append(chunk)
+        return index
+
+    @staticmethod
+    def _index_by_section_part(
+        chunks: Iterable[Chunk], keep: Container[str] | None = None
+    ) -> dict[str, list[Chunk]]:
+        """Index chunks by each lower-cased section_path element.
+
+        ``index[name.lower()]`` holds exactly the chunks for which
+        :meth:`_section_path_mentions_peripheral` is true, in store order.
+        When ``keep`` is given, only those elements are indexed, so chunks
+        mentioning none of them are dropped as they stream past.
+        """
+        index: dict[str, list[Chunk]] = {}
+        for chunk in chunks:
+            parts = {part.strip().lower() for part in chunk.metadata.section_path.split(" > ")}
+            for part in parts:
+                if keep is None or part in keep:
+                    index.setdefault(part, []).append(chunk)
+        return index
 
     def _extract_register_map(
         self,
@@ -294,8 +407,8 @@ class PeripheralContextCompiler(BaseCompiler):
             if self._chunk_belongs_to_peripheral(c, peripheral_name)
             and (not chip or c.metadata.chip == chip)
         ]
-        relevant.sort(key=lambda c: c.chunk_id)
-        return "\n\n".join(c.content for c in relevant).strip()
+        relevant.sort(key=attrgetter("chunk_id"))
+        return "\n\n".join([c.content for c in relevant]).strip()
 
     def _gather_peripheral_details(
         self,
@@ -345,7 +458,9 @@ class PeripheralContextCompiler(BaseCompiler):
             and c.chunk_id not in excluded
         ]
         keywords = build_peripheral_keywords(peripheral_name, register_map, description)
-        relevant = rank_chunks(relevant, keywords, max_chunks=_MAX_DETAIL_CHUNKS)
+        relevant = rank_chunks(
+            relevant, keywords, max_chunks=_MAX_DETAIL_CHUNKS, token_cache=self._token_cache
+        )
 
         if not relevant:
             return ""
@@ -357,7 +472,7 @@ class PeripheralContextCompiler(BaseCompiler):
                 parts.append(f"{c.content}\n\n{citation}")
             return "\n\n---\n\n".join(parts).strip()
 
-        return "\n\n---\n\n".join(c.content for c in relevant).strip()
+        return "\n\n---\n\n".join([c.content for c in relevant]).strip()
 
     def _extract_usage_patterns(
         self,
@@ -407,6 +522,7 @@ class PeripheralContextCompiler(BaseCompiler):
             keywords,
             max_chunks=_MAX_USAGE_PATTERNS,
             min_score=0.0,
+            token_cache=self._token_cache,
         )
 
         # Deduplicate by task name (keep first/highest-ranked occurrence)
@@ -467,8 +583,7 @@ class PeripheralContextCompiler(BaseCompiler):
         The peripheral name must match the 2nd element of the section_path
         exactly (case-sensitive) to avoid cross-peripheral contamination.
         """
-        parts = chunk.metadata.section_path.split(" > ")
-        return len(parts) >= 2 and parts[1].strip() == peripheral_name
+        return _second_path_element(chunk.metadata.section_path) == peripheral_name
 
     @staticmethod
     def _section_path_mentions_peripheral(section_path: str, peripheral_name: str) -> bool:
@@ -494,10 +609,16 @@ class PeripheralContextCompiler(BaseCompiler):
         Returns:
             The description text, or empty string if not found.
         """
-        for line in register_map.splitlines()[:20]:
-            stripped = line.strip()
+        # Walk the first lines with str.find instead of splitting the whole map
+        start = 0
+        for _ in range(_DESCRIPTION_SEARCH_LINES):
+            end = register_map.find("\n", start)
+            stripped = register_map[start : end if end >= 0 else None].strip()
             if stripped.startswith("**Description:**"):
                 return stripped.removeprefix("**Description:**").strip()
+            if end < 0:
+                break
+            start = end + 1
 
         if register_map:
             logger.debug("No **Description:** found in register map content")
@@ -8,8 +8,10 @@ Inspired by EmbedGenius "Selective Memory Pick-up" (TF-IDF scoring).
 
 from __future__ import annotations
 
+import heapq
 import logging
 import re
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -144,8 +146,25 @@ def _tokenize(text: str) -> set[str]:
     """
     if not text:
         return set()
-    words = _WORD_RE.findall(text.lower())
-    return {w for w in words if w not in _STOPWORDS}
+    return _tokenize_lowered(text.lower())
+
+
+def _tokenize_lowered(lowered: str) -> set[str]:
+    """Tokenize text that has already been lower-cased."""
+    # Dedupe in C first; dropping the few stopwords after is one pass over them
+    tokens = set(_WORD_RE.findall(lowered))
+    tokens -= _STOPWORDS
+    return tokens
+
+
+def _has_keyword_substring(lowered: str, keywords: set[str]) -> bool:
+    """Return whether any keyword occurs anywhere in *lowered*.
+
+    Every token is a substring of the lower-cased text, so ``False``
+    means no keyword can be among the tokens and the score is 0.0.
+    Substring checks are much cheaper than the regex tokenizer.
+    """
+    return any(keyword in lowered for keyword in keywords)
 
 
 def build_peripheral_keywords(
@@ -208,16 +227,37 @@ def score_chunk_relevance(content: str, keywords: set[str]) -> float:
     """
     if not keywords or not content:
         return 0.0
-    words = _tokenize(content)
-    overlap = keywords & words
+    lowered = content.lower()
+    if not _has_keyword_substring(lowered, keywords):
+        return 0.0
+    overlap = keywords & _tokenize_lowered(lowered)
     return len(overlap) / len(keywords)
 
 
+def _chunk_overlap(
+    chunk: Chunk, keywords: set[str], token_cache: dict[str, set[str]] | None
+) -> int:
+    """Count keywords among *chunk*'s tokens, reusing *token_cache* when given.
+
+    Chunks rejected by the substring check are not tokenized or cached.
+    """
+    tokens = token_cache.get(chunk.chunk_id) if token_cache is not None else None
+    if tokens is None:
+        lowered = chunk.content.lower()
+        if not _has_keyword_substring(lowered, keywords):
+            return 0
+        tokens = _tokenize_lowered(lowered)
+        if token_cache is not None:
+            token_cache[chunk.chunk_id] = tokens
+    return len(keywords & tokens)
+
+
 def rank_chunks(
     chunks: list[Chunk],
     keywords: set[str],
     max_chunks: int = 5,
     min_score: float = _MIN_RELEVANCE_SCORE,
+    token_cache: dict[str, set[str]] | None = None,
 ) -> list[Chunk]:
     """Score, filter, and rank chunks by keyword relevance.
 
@@ -233,6 +273,9 @@ def rank_chunks(
         keywords: Target keyword set from ``build_peripheral_keywords``.
         max_chunks: Maximum number of chunks to return.
         min_score: Minimum score threshold (0.0-1.0).
+        token_cache: Optional chunk_id -> token set mapping, filled on
+            demand so a chunk ranked for several peripherals is only
+            tokenized once.
 
     Returns:
         Ranked list of relevant chunks.
@@ -242,13 +285,18 @@ def rank_chunks(
 
     # Fallback: no keywords → positional order (backward compat)
     if not keywords:
-        return sorted(chunks, key=lambda c: c.chunk_id)[:max_chunks]
-
-    scored = [(c, score_chunk_relevance(c.content, keywords)) for c in chunks]
-    # Sort by score descending, then chunk_id ascending for stability
-    scored.sort(key=lambda x: (-x[1], x[0].chunk_id))
-
-    result = [c for c, s in scored if s >= min_score][:max_chunks]
+        return heapq.nsmallest(max_chunks, chunks, key=attrgetter("chunk_id"))
+
+    # Score descending, then chunk_id ascending for stability. Plain tuples
+    # compare in C; the input index breaks remaining ties in order. Only the
+    # top max_chunks are needed, so select them with a bounded heap.
+    n_keywords = len(keywords)
+    scored = (
+        (-_chunk_overlap(c, keywords, token_cache) / n_keywords, c.chunk_id, i)
+        for i, c in enumerate(chunks)
+    )
+    top = heapq.nsmallest(max_chunks, (entry for entry in scored if -entry[0] >= min_score))
+    result = [chunks[i] for _neg_score, _chunk_id, i in top]
 
     # Log filtering stats
     if len(result) < len(chunks):
@@ -7,9 +7,12 @@ precedence over built-in templates in src/hwcc/templates/.
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Mapping
 from dataclasses import asdict
 from pathlib import Path, PurePosixPath
+from typing import Any
 
 import jinja2
 
@@ -65,6 +68,28 @@ TARGET_REGISTRY: dict[str, TargetInfo] = {
 }
 
 
+@functools.cache
+def _environment(search_paths: tuple[str, ...]) -> jinja2.Environment:
+    """Return the shared Jinja2 environment for a template search path.
+
+    Compilers each build their own :class:`TemplateEngine`, so sharing the
+    environment means each template is parsed and compiled once per
+    process. ``auto_reload`` stays on so an edited ``.rag/templates``
+    override is picked up by a long-lived process; checking it costs one
+    ``stat`` per lookup, far less than recompiling.
+    """
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(list(search_paths)),
+        autoescape=False,
+        undefined=jinja2.StrictUndefined,
+        keep_trailing_newline=True,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=True,
+        cache_size=-1,
+    )
+
+
 class TemplateEngine:
     """Jinja2 template engine with built-in and user-override support.
 
@@ -100,26 +125,29 @@ class TemplateEngine:
             )
         search_paths.append(str(builtin_dir))
 
-        self._loader = jinja2.FileSystemLoader(search_paths)
-        self._env = jinja2.Environment(
-            loader=self._loader,
-            autoescape=False,
-            undefined=jinja2.StrictUndefined,
-            keep_trailing_newline=True,
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self._env = _environment(tuple(search_paths))
         logger.info("TemplateEngine initialized with %d search path(s)", len(search_paths))
 
-    def render(self, template_name: str, context: CompileContext) -> str:
+    @staticmethod
+    def flatten(context: CompileContext) -> dict[str, Any]:
+        """Flatten a compile context into template variables.
+
+        Uses ``dataclasses.asdict()``: nested dataclasses become dicts and
+        tuples become lists. Callers rendering one context into several
+        templates can flatten it once and pass the result to
+        :meth:`render`.
+        """
+        return asdict(context)
+
+    def render(self, template_name: str, context: CompileContext | Mapping[str, Any]) -> str:
         """Render a template with the given compile context.
 
-        Context is flattened via ``dataclasses.asdict()`` before passing
-        to Jinja2. Nested dataclasses become dicts; tuples become lists.
+        A CompileContext is flattened via :meth:`flatten` before passing
+        to Jinja2; a mapping is taken as already-flattened variables.
 
         Args:
             template_name: Template filename (e.g., ``"hot_context.md.j2"``).
-            context: Typed compile context data.
+            context: Typed compile context data, or its flattened variables.
 
         Returns:
             Rendered template content as a string.
@@ -133,16 +161,17 @@ class TemplateEngine:
             raise CompileError(f"Template not found: {template_name}") from e
 
         try:
-            return template.render(**asdict(context))
+            variables = context if isinstance(context, Mapping) else self.flatten(context)
+            return template.render(variables)
         except jinja2.TemplateError as e:
             raise CompileError(f"Failed to render template {template_name}: {e}") from e
 
-    def render_target(self, target: str, context: CompileContext) -> str:
+    def render_target(self, target: str, context: CompileContext | Mapping[str, Any]) -> str:
         """Render the template for a specific output target.
 
         Args:
             target: Config target name (e.g., ``"claude"``, ``"codex"``).
-            context: Typed compile context data.
+            context: Typed compile context data, or its flattened variables.
 
         Returns:
             Rendered template content as a string.
@@ -155,7 +184,7 @@ class TemplateEngine:
 
     def list_templates(self) -> list[str]:
         """List all available template names (built-in + overrides)."""
-        return sorted(self._loader.list_templates())
+        return sorted(self._env.list_templates())
 
     def is_overridden(self, template_name: str) -> bool:
         """Check if a template has a user override in .rag/templates/.
@@ -6,10 +6,11 @@ and sensible defaults for all values.
 
 from __future__ import annotations
 
+import copy
 import logging
 import sys
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, TypeVar
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import tomli_w
 
@@ -18,6 +19,12 @@ if sys.version_info >= (3, 12):
 else:
     import tomli as tomllib
 
+# Optional Rust TOML parser; the stdlib/tomli parser is pure Python
+try:
+    import rtoml
+except ImportError:
+    rtoml = None
+
 from hwcc.exceptions import ConfigError
 
 if TYPE_CHECKING:
@@ -38,6 +45,7 @@ __all__ = [
     "SoftwareConfig",
     "StoreConfig",
     "VisionConfig",
+    "clear_config_cache",
     "default_config",
     "load_config",
     "save_config",
@@ -45,6 +53,14 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# Errors load_config reports as ConfigError
+_LOAD_ERRORS: tuple[type[Exception], ...] = (OSError, tomllib.TOMLDecodeError)
+if rtoml is not None:
+    _LOAD_ERRORS += (rtoml.TomlParsingError,)
+
+# Parsed configs keyed by (resolved path, mtime_ns, size); see load_config
+_config_cache: dict[tuple[str, int, int], HwccConfig] = {}
+
 
 @dataclass
 class ProjectConfig:
@@ -109,6 +125,9 @@ class EmbeddingConfig:
     api_key_env: str = ""
     base_url: str = ""
     batch_size: int = 64
+    max_concurrency: int = 4
+    cache_dir: str = "embed-cache"  # under .rag/; empty disables the cache
+    compress_requests: bool = False  # gzip request bodies (OpenAI-compatible provider)
 
 
 @dataclass
@@ -170,34 +189,35 @@ class HwccConfig:
     pins: dict[str, str] = field(default_factory=dict)
 
 
+# TOML section name -> dataclass, for load_config
+_SECTIONS: dict[str, type] = {
+    "project": ProjectConfig,
+    "hardware": HardwareConfig,
+    "software": SoftwareConfig,
+    "conventions": ConventionsConfig,
+    "chunk": ChunkConfig,
+    "embedding": EmbeddingConfig,
+    "store": StoreConfig,
+    "llm": LlmConfig,
+    "output": OutputConfig,
+    "ingest": IngestConfig,
+    "vision": VisionConfig,
+}
+
+# Field names of each section dataclass, computed once instead of per load
+_KNOWN_FIELDS: dict[type, frozenset[str]] = {
+    cls: frozenset(f.name for f in fields(cls)) for cls in _SECTIONS.values()
+}
+
+
 def default_config() -> HwccConfig:
     """Return a config with all default values."""
     return HwccConfig()
 
 
-def _section_to_dict(obj: object) -> dict[str, object]:
-    """Convert a dataclass instance to a dict for TOML serialization."""
-    return dict(vars(obj))
-
-
 def _config_to_dict(config: HwccConfig) -> dict[str, object]:
     """Convert HwccConfig to a nested dict suitable for TOML serialization."""
-    result: dict[str, object] = {}
-    for section_name in (
-        "project",
-        "hardware",
-        "software",
-        "conventions",
-        "chunk",
-        "embedding",
-        "store",
-        "llm",
-        "output",
-        "ingest",
-        "vision",
-    ):
-        section = getattr(config, section_name)
-        result[section_name] = _section_to_dict(section)
+    result: dict[str, object] = {name: dict(vars(getattr(config, name))) for name in _SECTIONS}
     if config.pins:
         result["pins"] = dict(config.pins)
     return result
@@ -210,50 +230,57 @@ def save_config(config: HwccConfig, path: Path) -> None:
     try:
         with path.open("wb") as f:
             tomli_w.dump(data, f)
+        # A rewrite within one mtime tick could otherwise hit a stale entry
+        _config_cache.clear()
         logger.info("Saved config to %s", path)
     except OSError as e:
         logger.error("Failed to save config to %s: %s", path, e)
         raise ConfigError(f"Failed to save config to {path}: {e}") from e
 
 
+def _parse_toml(text: str) -> dict[str, Any]:
+    """Parse TOML text, with ``rtoml`` when it is installed."""
+    if rtoml is not None:
+        return rtoml.loads(text)  # type: ignore[no-any-return]
+    return tomllib.loads(text)
+
+
 def _load_section(cls: type[_T], data: dict[str, object]) -> _T:
     """Load a dataclass section from a dict, ignoring unknown keys."""
-    known_fields = {f.name for f in cls.__dataclass_fields__.values()}  # type: ignore[attr-defined]
-    filtered = {k: v for k, v in data.items() if k in known_fields}
-    return cls(**filtered)
+    known_fields = _KNOWN_FIELDS[cls]
+    return cls(**{k: v for k, v in data.items() if k in known_fields})
 
 
 def load_config(path: Path) -> HwccConfig:
     """Load configuration from a TOML file.
 
-    Missing sections or keys get default values.
+    Missing sections or keys get default values. Parsed configs are cached
+    per file until its mtime or size changes; each call returns a fresh
+    copy, so callers may mutate the result. :func:`clear_config_cache`
+    empties the cache.
     """
     if not path.exists():
         raise ConfigError(f"Config file not found: {path}")
 
+    try:
+        st = path.stat()
+        key: tuple[str, int, int] | None = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    cached = _config_cache.get(key) if key is not None else None
+    if cached is not None:
+        logger.debug("Using cached config for %s", path)
+        return copy.deepcopy(cached)
+
     try:
         raw = path.read_bytes()
-        data = tomllib.loads(raw.decode("utf-8"))
-    except (OSError, tomllib.TOMLDecodeError) as e:
+        data = _parse_toml(raw.decode("utf-8"))
+    except _LOAD_ERRORS as e:
         logger.error("Failed to load config from %s: %s", path, e)
         raise ConfigError(f"Failed to load config from {path}: {e}") from e
 
     config = HwccConfig()
-    section_map: dict[str, type] = {
-        "project": ProjectConfig,
-        "hardware": HardwareConfig,
-        "software": SoftwareConfig,
-        "conventions": ConventionsConfig,
-        "chunk": ChunkConfig,
-        "embedding": EmbeddingConfig,
-        "store": StoreConfig,
-        "llm": LlmConfig,
-        "output": OutputConfig,
-        "ingest": IngestConfig,
-        "vision": VisionConfig,
-    }
-
-    for name, cls in section_map.items():
+    for name, cls in _SECTIONS.items():
         if name in data:
             setattr(config, name, _load_section(cls, data[name]))
 
@@ -261,5 +288,12 @@ def load_config(path: Path) -> HwccConfig:
     if "pins" in data and isinstance(data["pins"], dict):
         config.pins = {str(k): str(v) for k, v in data["pins"].items()}
 
+    if key is not None:
+        _config_cache[key] = copy.deepcopy(config)
     logger.info("Loaded config from %s", path)
     return config
+
+
+def clear_config_cache() -> None:
+    """Forget every config parsed by :func:`load_config`."""
+    _config_cache.clear()
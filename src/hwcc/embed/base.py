@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+from hwcc.types import EmbeddedChunk
+
 if TYPE_CHECKING:
-    from hwcc.types import Chunk, EmbeddedChunk
+    from collections.abc import Callable
+
+    from hwcc.types import Chunk
 
 __all__ = ["BaseEmbedder"]
 
@@ -34,6 +40,15 @@ class BaseEmbedder(ABC):
             EmbeddingError: If embedding generation fails.
         """
 
+    async def aembed_chunks(self, chunks: list[Chunk]) -> list[EmbeddedChunk]:
+        """Async variant of :meth:`embed_chunks` for use inside an event loop.
+
+        Runs the blocking call on a worker thread so the loop keeps serving
+        other tasks meanwhile. HTTP providers still overlap their batches
+        on their own thread pool within that call.
+        """
+        return await asyncio.to_thread(self.embed_chunks, chunks)
+
     @abstractmethod
     def embed_query(self, text: str) -> list[float]:
         """Generate an embedding for a search query.
@@ -52,3 +67,54 @@ class BaseEmbedder(ABC):
     @abstractmethod
     def dimension(self) -> int:
         """Return the dimensionality of the embedding vectors."""
+
+    @staticmethod
+    def _unique_texts(chunks: list[Chunk]) -> tuple[list[str], list[int]]:
+        """Collapse chunks with identical content for embedding.
+
+        Returns:
+            ``(texts, indices)``: each distinct content once, in first-seen
+            order, and for every chunk the index of its text in ``texts``.
+        """
+        seen: dict[str, int] = {}
+        indices = [seen.setdefault(c.content, len(seen)) for c in chunks]
+        return list(seen), indices
+
+    def _embed_in_batches(
+        self,
+        chunks: list[Chunk],
+        embed_batch: Callable[[list[str]], list[list[float]]],
+        batch_size: int,
+        max_concurrency: int,
+    ) -> list[EmbeddedChunk]:
+        """Embed chunks through a provider call that takes one batch of texts.
+
+        Repeated texts such as boilerplate headers are sent once and share
+        one vector. The distinct texts are split into batches of
+        ``batch_size``, and up to ``max_concurrency`` batches are in flight
+        at once on a thread pool.
+
+        Returns:
+            One EmbeddedChunk per input chunk, in input order.
+        """
+        texts, indices = self._unique_texts(chunks)
+        batches = [
+            texts[batch_start : batch_start + batch_size]
+            for batch_start in range(0, len(texts), batch_size)
+        ]
+
+        # map() returns the vectors in batch order
+        workers = min(max_concurrency, len(batches))
+        if workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="hwcc-embed"
+            ) as executor:
+                vector_batches = list(executor.map(embed_batch, batches))
+        else:
+            vector_batches = [embed_batch(batch) for batch in batches]
+
+        vectors = [tuple(vec) for batch_vectors in vector_batches for vec in batch_vectors]
+        return [
+            EmbeddedChunk(chunk=chunk, embedding=vectors[i])
+            for chunk, i in zip(chunks, indices, strict=True)
+        ]
@@ -0,0 +1,164 @@
+"""Persistent embedding cache decorator.
+
+Re-adding a changed document usually leaves most of its chunks unchanged,
+and every one of them would otherwise be embedded again. Vectors are kept
+in a SQLite database keyed by embedding model and a hash of the chunk text,
+so only new or edited text reaches the wrapped provider.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from typing import TYPE_CHECKING
+
+from hwcc.embed.base import BaseEmbedder
+from hwcc.types import EmbeddedChunk
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from hwcc.types import Chunk
+
+__all__ = ["CachedEmbedder"]
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = "embeddings.sqlite"
+
+# Keys per SELECT ... IN (...); well under SQLite's bound-parameter limit
+_LOOKUP_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    key BLOB NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, key)
+) WITHOUT ROWID
+"""
+
+
+def _text_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class CachedEmbedder(BaseEmbedder):
+    """Embedder decorator that remembers chunk vectors across runs.
+
+    Vectors are stored as float64 bytes, so a cached vector is identical to
+    the one the provider returned. ``model`` identifies the vector space:
+    entries written under one model are never returned for another.
+    Queries are not cached. If the database cannot be opened or written,
+    a warning is logged and the wrapped embedder is used directly.
+
+    Usage::
+
+        embedder = CachedEmbedder(OllamaEmbedder(config), cache_dir, "ollama/nomic-embed-text")
+        embedded = embedder.embed_chunks(chunks)  # only unseen texts are sent
+        embedder.close()
+    """
+
+    def __init__(self, embedder: BaseEmbedder, cache_dir: Path, model: str) -> None:
+        self._embedder = embedder
+        self._model = model
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(cache_dir / CACHE_FILE, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Embedding cache disabled, cannot open %s: %s", cache_dir, e)
+        else:
+            self._conn = conn
+
+    def embed_chunks(self, chunks: list[Chunk]) -> list[EmbeddedChunk]:
+        """Embed chunks, reusing cached vectors for previously seen texts."""
+        if self._conn is None or not chunks:
+            return self._embedder.embed_chunks(chunks)
+
+        texts, indices = self._unique_texts(chunks)
+        keys = [_text_key(t) for t in texts]
+        vectors = self._lookup(keys)
+
+        # One representative chunk per uncached text goes to the provider
+        first_chunk: dict[int, Chunk] = {}
+        for chunk, i in zip(chunks, indices, strict=True):
+            if i not in vectors:
+                first_chunk.setdefault(i, chunk)
+        if first_chunk:
+            missing = list(first_chunk)
+            embedded = self._embedder.embed_chunks([first_chunk[i] for i in missing])
+            fresh = {key_i: ec.embedding for key_i, ec in zip(missing, embedded, strict=True)}
+            vectors.update(fresh)
+            self._insert((keys[i], vec) for i, vec in fresh.items())
+
+        logger.info(
+            "Embedding cache: %d of %d distinct texts reused",
+            len(texts) - len(first_chunk),
+            len(texts),
+        )
+        return [
+            EmbeddedChunk(chunk=chunk, embedding=vectors[i])
+            for chunk, i in zip(chunks, indices, strict=True)
+        ]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a search query with the wrapped embedder (not cached)."""
+        return self._embedder.embed_query(text)
+
+    @property
+    def dimension(self) -> int:
+        """Return the wrapped embedder's dimensionality."""
+        return self._embedder.dimension
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _lookup(self, keys: list[bytes]) -> dict[int, tuple[float, ...]]:
+        """Return cached vectors by position in *keys*."""
+        position = {key: i for i, key in enumerate(keys)}
+        found: dict[int, tuple[float, ...]] = {}
+        try:
+            with self._lock:
+                if self._conn is None:
+                    return found
+                for start in range(0, len(keys), _LOOKUP_BATCH):
+                    batch = keys[start : start + _LOOKUP_BATCH]
+                    rows = self._conn.execute(
+                        "SELECT key, vector FROM embeddings WHERE model = ? AND key IN "
+                        f"({','.join('?' * len(batch))})",
+                        (self._model, *batch),
+                    )
+                    for key, blob in rows:
+                        found[position[key]] = tuple(array("d", blob))
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache lookup failed: %s", e)
+        return found
+
+    def _insert(self, items: Iterable[tuple[bytes, tuple[float, ...]]]) -> None:
+        """Store freshly computed vectors in one transaction."""
+        rows = [(self._model, key, array("d", vec).tobytes()) for key, vec in items]
+        try:
+            with self._lock:
+                if self._conn is None:
+                    return
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings (model, key, vector) VALUES (?, ?, ?)",
+                        rows,
+                    )
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache write failed: %s", e)
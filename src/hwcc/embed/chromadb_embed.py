@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 
 from hwcc.embed.base import BaseEmbedder
@@ -73,7 +74,8 @@ class ChromaDBEmbedder(BaseEmbedder):
         if not chunks:
             return []
 
-        texts = [c.content for c in chunks]
+        # Embed each distinct text once; duplicates share its vector
+        texts, indices = self._unique_texts(chunks)
 
         try:
             vectors = self._ef(texts)
@@ -85,9 +87,13 @@ class ChromaDBEmbedder(BaseEmbedder):
                 f"ChromaDB returned {len(vectors)} embeddings for {len(texts)} inputs"
             )
 
-        results: list[EmbeddedChunk] = []
-        for chunk, vec in zip(chunks, vectors, strict=True):
-            results.append(EmbeddedChunk(chunk=chunk, embedding=tuple(float(v) for v in vec)))
+        # The ONNX function returns float32 arrays; tolist() converts each row
+        # to Python floats in C instead of one float() call per element
+        embeddings = [tuple(np.asarray(vec, dtype=np.float64).tolist()) for vec in vectors]
+        results = [
+            EmbeddedChunk(chunk=chunk, embedding=embeddings[i])
+            for chunk, i in zip(chunks, indices, strict=True)
+        ]
 
         if results and self._dimension is None:
             self._dimension = len(results[0].embedding)
@@ -115,7 +121,7 @@ class ChromaDBEmbedder(BaseEmbedder):
         if not vectors or len(vectors) != 1:
             raise EmbeddingError("ChromaDB returned unexpected result for single query")
 
-        vec = [float(v) for v in vectors[0]]
+        vec: list[float] = np.asarray(vectors[0], dtype=np.float64).tolist()
 
         if self._dimension is None:
             self._dimension = len(vec)
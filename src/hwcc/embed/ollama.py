@@ -9,15 +9,15 @@ import json
 import logging
 from typing import TYPE_CHECKING
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.request import Request
 
 from hwcc.embed.base import BaseEmbedder
+from hwcc.embed.transport import dumps_json, loads_json, urlopen
 from hwcc.exceptions import EmbeddingError
-from hwcc.types import EmbeddedChunk
 
 if TYPE_CHECKING:
     from hwcc.config import HwccConfig
-    from hwcc.types import Chunk
+    from hwcc.types import Chunk, EmbeddedChunk
 
 __all__ = ["OllamaEmbedder"]
 
@@ -39,6 +39,7 @@ class OllamaEmbedder(BaseEmbedder):
         provider = "ollama"
         base_url = ""           # empty = http://localhost:11434
         batch_size = 64
+        max_concurrency = 4     # batches in flight at once
     """
 
     _DEFAULT_TIMEOUT = 120  # seconds
@@ -47,15 +48,19 @@ class OllamaEmbedder(BaseEmbedder):
         self._model = config.embedding.model
         self._base_url = (config.embedding.base_url or _DEFAULT_BASE_URL).rstrip("/")
         self._batch_size = config.embedding.batch_size
+        self._max_concurrency = config.embedding.max_concurrency
         self._dimension: int | None = None
 
         if self._batch_size < 1:
             raise EmbeddingError(f"batch_size must be >= 1, got {self._batch_size}")
+        if self._max_concurrency < 1:
+            raise EmbeddingError(f"max_concurrency must be >= 1, got {self._max_concurrency}")
 
     def embed_chunks(self, chunks: list[Chunk]) -> list[EmbeddedChunk]:
         """Generate embeddings for a batch of chunks via Ollama.
 
-        Splits into batches of ``batch_size`` to avoid overwhelming the server.
+        Splits into batches of ``batch_size`` to avoid overwhelming the server
+        and keeps up to ``max_concurrency`` batches in flight at once.
 
         Args:
             chunks: Chunks to embed.
@@ -69,15 +74,9 @@ class OllamaEmbedder(BaseEmbedder):
         if not chunks:
             return []
 
-        all_results: list[EmbeddedChunk] = []
-
-        for batch_start in range(0, len(chunks), self._batch_size):
-            batch = chunks[batch_start : batch_start + self._batch_size]
-            texts = [c.content for c in batch]
-            vectors = self._call_embed(texts)
-
-            for chunk, vec in zip(batch, vectors, strict=True):
-                all_results.append(EmbeddedChunk(chunk=chunk, embedding=tuple(vec)))
+        all_results = self._embed_in_batches(
+            chunks, self._call_embed, self._batch_size, self._max_concurrency
+        )
 
         logger.info("Embedded %d chunks via Ollama (%s)", len(all_results), self._model)
         return all_results
@@ -124,13 +123,13 @@ class OllamaEmbedder(BaseEmbedder):
             EmbeddingError: On connection or API errors.
         """
         url = f"{self._base_url}/api/embed"
-        payload = json.dumps({"model": self._model, "input": texts}).encode("utf-8")
+        payload = dumps_json({"model": self._model, "input": texts})
         req = Request(url, data=payload, headers={"Content-Type": "application/json"})
 
         try:
             with urlopen(req, timeout=self._DEFAULT_TIMEOUT) as resp:
                 body = resp.read()
-            data = json.loads(body)
+            data = loads_json(body)
         except json.JSONDecodeError as e:
             raise EmbeddingError(f"Ollama returned invalid JSON from {url}") from e
         except (ConnectionError, URLError) as e:
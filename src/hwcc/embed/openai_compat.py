@@ -6,20 +6,21 @@ OpenAI, LiteLLM proxy, vLLM, Ollama (OpenAI-compat mode), etc.
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.request import Request
 
 from hwcc.embed.base import BaseEmbedder
+from hwcc.embed.transport import dumps_json, loads_json, urlopen
 from hwcc.exceptions import EmbeddingError
-from hwcc.types import EmbeddedChunk
 
 if TYPE_CHECKING:
     from hwcc.config import HwccConfig
-    from hwcc.types import Chunk
+    from hwcc.types import Chunk, EmbeddedChunk
 
 __all__ = ["OpenAICompatEmbedder"]
 
@@ -41,6 +42,8 @@ class OpenAICompatEmbedder(BaseEmbedder):
         api_key_env = "OPENAI_API_KEY"   # env var name; empty = no auth
         base_url = ""                     # empty = https://api.openai.com/v1
         batch_size = 64
+        max_concurrency = 4               # batches in flight at once
+        compress_requests = false         # gzip request bodies; server must accept it
     """
 
     _DEFAULT_TIMEOUT = 120  # seconds
@@ -49,10 +52,14 @@ class OpenAICompatEmbedder(BaseEmbedder):
         self._model = config.embedding.model
         self._base_url = (config.embedding.base_url or _DEFAULT_BASE_URL).rstrip("/")
         self._batch_size = config.embedding.batch_size
+        self._max_concurrency = config.embedding.max_concurrency
+        self._compress_requests = config.embedding.compress_requests
         self._dimension: int | None = None
 
         if self._batch_size < 1:
             raise EmbeddingError(f"batch_size must be >= 1, got {self._batch_size}")
+        if self._max_concurrency < 1:
+            raise EmbeddingError(f"max_concurrency must be >= 1, got {self._max_concurrency}")
 
         # Resolve API key from environment variable
         self._api_key: str | None = None
@@ -67,6 +74,8 @@ class OpenAICompatEmbedder(BaseEmbedder):
     def embed_chunks(self, chunks: list[Chunk]) -> list[EmbeddedChunk]:
         """Generate embeddings for a batch of chunks.
 
+        Sends up to ``max_concurrency`` batches of ``batch_size`` at once.
+
         Args:
             chunks: Chunks to embed.
 
@@ -79,15 +88,9 @@ class OpenAICompatEmbedder(BaseEmbedder):
         if not chunks:
             return []
 
-        all_results: list[EmbeddedChunk] = []
-
-        for batch_start in range(0, len(chunks), self._batch_size):
-            batch = chunks[batch_start : batch_start + self._batch_size]
-            texts = [c.content for c in batch]
-            vectors = self._call_embeddings(texts)
-
-            for chunk, vec in zip(batch, vectors, strict=True):
-                all_results.append(EmbeddedChunk(chunk=chunk, embedding=tuple(vec)))
+        all_results = self._embed_in_batches(
+            chunks, self._call_embeddings, self._batch_size, self._max_concurrency
+        )
 
         logger.info(
             "Embedded %d chunks via OpenAI-compatible API (%s)", len(all_results), self._model
@@ -136,9 +139,16 @@ class OpenAICompatEmbedder(BaseEmbedder):
             EmbeddingError: On connection or API errors.
         """
         url = f"{self._base_url}/embeddings"
-        payload = json.dumps({"model": self._model, "input": texts}).encode("utf-8")
-
-        headers: dict[str, str] = {"Content-Type": "application/json"}
+        payload = dumps_json({"model": self._model, "input": texts})
+
+        # Responses are mostly float text and compress well; urlopen decodes them
+        headers: dict[str, str] = {
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip",
+        }
+        if self._compress_requests:
+            payload = gzip.compress(payload, compresslevel=3)
+            headers["Content-Encoding"] = "gzip"
         if self._api_key:
             headers["Authorization"] = f"Bearer {self._api_key}"
 
@@ -147,7 +157,7 @@ class OpenAICompatEmbedder(BaseEmbedder):
         try:
             with urlopen(req, timeout=self._DEFAULT_TIMEOUT) as resp:
                 body = resp.read()
-            data = json.loads(body)
+            data = loads_json(body)
         except json.JSONDecodeError as e:
             raise EmbeddingError(f"Embedding API returned invalid JSON from {url}") from e
         except (ConnectionError, URLError) as e:
@@ -157,10 +167,10 @@ class OpenAICompatEmbedder(BaseEmbedder):
         except HTTPError as e:
             raise EmbeddingError(f"Embedding API error (HTTP {e.code}): {e.reason}") from e
 
-        # Sort by index to ensure correct order (OpenAI spec includes "index" per item)
+        # Put items in input order (OpenAI spec includes "index" per item)
         raw_items = data.get("data", [])
-        if raw_items and all("index" in item for item in raw_items):
-            raw_items = sorted(raw_items, key=lambda x: x["index"])
+        if raw_items:
+            raw_items = self._order_by_index(raw_items)
 
         try:
             embeddings: list[list[float]] = [item["embedding"] for item in raw_items]
@@ -179,3 +189,26 @@ class OpenAICompatEmbedder(BaseEmbedder):
             self._dimension = len(embeddings[0])
 
         return embeddings
+
+    @staticmethod
+    def _order_by_index(items: list[Any]) -> list[Any]:
+        """Return response items in ``index`` order.
+
+        Indices normally form ``0..n-1`` and items are scattered straight
+        into place. Items are returned as received if any lacks an index,
+        and sorted by index if the indices are not such a permutation.
+        """
+        ordered: list[Any] = [None] * len(items)
+        permutation = True
+        for item in items:
+            try:
+                index = item["index"]
+            except (KeyError, TypeError):
+                return items
+            if not permutation:
+                continue
+            if type(index) is int and 0 <= index < len(ordered) and ordered[index] is None:
+                ordered[index] = item
+            else:
+                permutation = False
+        return ordered if permutation else sorted(items, key=lambda x: x["index"])
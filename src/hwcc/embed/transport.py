@@ -0,0 +1,207 @@
+"""Keep-alive HTTP transport for the embedding providers.
+
+``urllib.request.urlopen`` opens a new TCP (and TLS) connection for every
+request. :func:`urlopen` here is a drop-in replacement for the simple
+request/response calls the embedders make: it keeps idle connections per
+host in a small pool, so consecutive batches reuse the same socket.
+
+Requests that need a proxy, or that use a scheme other than HTTP(S), are
+handed to ``urllib.request.urlopen`` unchanged. Either way, a gzip
+``Content-Encoding`` on the response is decoded before it is returned.
+
+:func:`dumps_json` and :func:`loads_json` encode request payloads and
+decode the multi-megabyte embedding responses with ``orjson`` when it is
+installed, falling back to the stdlib.
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import json
+import logging
+import threading
+import urllib.request
+import zlib
+from typing import TYPE_CHECKING, Any
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+
+# Optional faster JSON codec; its decode errors subclass json.JSONDecodeError
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+__all__ = ["dumps_json", "loads_json", "urlopen"]
+
+logger = logging.getLogger(__name__)
+
+# Idle connections kept per (scheme, host, port).
+_MAX_IDLE_PER_HOST = 8
+
+# Errors that mean a reused keep-alive socket was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+_Key = tuple[str, str, int | None]
+
+
+class _Response:
+    """Fully read response body, usable like the object ``urlopen`` returns."""
+
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status = status
+        self._body = body
+
+    def read(self) -> bytes:
+        return self._body
+
+    def __enter__(self) -> _Response:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        pass
+
+
+class _ConnectionPool:
+    """Thread-safe pool of idle HTTP connections keyed by host."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: dict[_Key, list[http.client.HTTPConnection]] = {}
+
+    def acquire(self, key: _Key, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """Return ``(connection, reused)``, preferring an idle connection."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def release(self, key: _Key, conn: http.client.HTTPConnection) -> None:
+        """Return a connection for reuse, closing it if the pool is full."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < _MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def clear(self) -> None:
+        """Close and forget every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+_pool = _ConnectionPool()
+
+
+def urlopen(req: urllib.request.Request, timeout: float) -> _Response:
+    """Send *req* over a pooled keep-alive connection and read the response.
+
+    Behaves like ``urllib.request.urlopen`` for the embedders' use: HTTP
+    error statuses raise :class:`~urllib.error.HTTPError` and connection
+    failures raise :class:`~urllib.error.URLError`. A request that fails
+    on a reused connection the server has since closed is retried on
+    another connection.
+
+    Args:
+        req: Request to send.
+        timeout: Socket timeout in seconds.
+
+    Returns:
+        Context-manager response whose ``read()`` returns the body.
+    """
+    url = req.full_url
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = parts.hostname or ""
+    proxied = scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(host)
+    if scheme not in ("http", "https") or not host or proxied:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            body = _decode_body(resp.read(), resp.headers.get("Content-Encoding"))
+            return _Response(resp.status, body)
+
+    key: _Key = (scheme, host, parts.port)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    headers = dict(req.header_items())
+
+    while True:
+        conn, reused = _pool.acquire(key, timeout)
+        try:
+            conn.request(req.get_method(), path, body=req.data, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except _STALE_CONNECTION_ERRORS as e:
+            conn.close()
+            if reused:
+                logger.debug("Reused connection to %s was closed; reconnecting", host)
+                continue
+            raise URLError(e) from e
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise URLError(e) from e
+        break
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _pool.release(key, conn)
+
+    if resp.status >= 400:
+        raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    return _Response(resp.status, _decode_body(body, resp.getheader("Content-Encoding")))
+
+
+def _decode_body(body: bytes, encoding: str | None) -> bytes:
+    """Undo a gzip content encoding, which servers use if the request allowed it."""
+    if encoding is None or encoding.strip().lower() != "gzip":
+        return body
+    try:
+        return gzip.decompress(body)
+    except (OSError, EOFError, zlib.error) as e:
+        raise URLError(f"invalid gzip response body: {e}") from e
+
+
+def dumps_json(obj: object) -> bytes:
+    """Encode *obj* as a UTF-8 JSON request body."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates from a bad text extraction, which json escapes
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def loads_json(raw: bytes) -> Any:
+    """Decode a JSON response body.
+
+    Raises:
+        json.JSONDecodeError: If *raw* is not valid JSON.
+    """
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
@@ -8,12 +8,19 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from hwcc.exceptions import ManifestError
 
+# Optional faster JSON codec; the stdlib writes byte-identical output
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -29,8 +36,6 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
-HASH_CHUNK_SIZE = 65536
-
 
 @dataclass(frozen=True)
 class DocumentEntry:
@@ -43,6 +48,8 @@ class DocumentEntry:
     added: str
     chunks: int = 0
     chip: str = ""
+    mtime_ns: int = 0
+    size: int = 0
 
 
 @dataclass
@@ -87,17 +94,27 @@ class Manifest:
             return True
         return existing.hash != current_hash
 
+    def is_stat_unchanged(self, doc_id: str, mtime_ns: int, size: int) -> bool:
+        """Check if a document's file stat matches the one recorded at indexing.
+
+        A match means the file can be treated as unchanged without hashing it.
+        Entries written before stats were recorded never match.
+        """
+        existing = self.get_document(doc_id)
+        if existing is None or existing.mtime_ns == 0:
+            return False
+        return existing.mtime_ns == mtime_ns and existing.size == size
+
 
 def compute_hash(path: Path) -> str:
     """Compute SHA-256 hash of a file's contents."""
-    h = hashlib.sha256()
     try:
         with path.open("rb") as f:
-            while True:
-                chunk = f.read(HASH_CHUNK_SIZE)
-                if not chunk:
-                    break
-                h.update(chunk)
+            # Hint sequential access so the kernel reads ahead aggressively;
+            # the parser re-reads the same file right after and finds it cached
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            h = hashlib.file_digest(f, "sha256")
     except OSError as e:
         raise ManifestError(f"Failed to hash file {path}: {e}") from e
     return f"sha256:{h.hexdigest()}"
@@ -115,6 +132,9 @@ def _entry_to_dict(entry: DocumentEntry) -> dict[str, object]:
     }
     if entry.chip:
         d["chip"] = entry.chip
+    if entry.mtime_ns:
+        d["mtime_ns"] = entry.mtime_ns
+        d["size"] = entry.size
     return d
 
 
@@ -132,6 +152,8 @@ def _entry_from_dict(data: dict[str, object]) -> DocumentEntry:
         added=str(data["added"]),
         chunks=int(str(data.get("chunks", 0))),
         chip=str(data.get("chip", "")),
+        mtime_ns=int(str(data.get("mtime_ns", 0))),
+        size=int(str(data.get("size", 0))),
     )
 
 
@@ -143,23 +165,36 @@ def save_manifest(manifest: Manifest, path: Path) -> None:
         "documents": [_entry_to_dict(d) for d in manifest.documents],
         "last_compiled": manifest.last_compiled,
     }
+    # Write a sibling file and rename it over the manifest, so a crash
+    # mid-write never leaves a truncated manifest behind
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    tmp_path = path.with_name(path.name + ".tmp")
     try:
-        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
         logger.info("Saved manifest to %s", path)
     except OSError as e:
+        tmp_path.unlink(missing_ok=True)
         logger.error("Failed to save manifest to %s: %s", path, e)
         raise ManifestError(f"Failed to save manifest to {path}: {e}") from e
 
 
 def load_manifest(path: Path) -> Manifest:
     """Load manifest from a JSON file."""
-    if not path.exists():
-        raise ManifestError(f"Manifest file not found: {path}")
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError as e:
+        raise ManifestError(f"Manifest file not found: {path}") from e
+    except OSError as e:
+        logger.error("Failed to load manifest from %s: %s", path, e)
+        raise ManifestError(f"Failed to load manifest from {path}: {e}") from e
 
     try:
-        raw = path.read_text(encoding="utf-8")
-        data = json.loads(raw)
-    except (OSError, json.JSONDecodeError) as e:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except json.JSONDecodeError as e:
         logger.error("Failed to load manifest from %s: %s", path, e)
         raise ManifestError(f"Failed to load manifest from {path}: {e}") from e
 
@@ -19,12 +19,54 @@ if TYPE_CHECKING:
     from hwcc.embed.base import BaseEmbedder
     from hwcc.ingest.base import BaseParser
     from hwcc.store.base import BaseStore
+    from hwcc.types import Chunk
 
-__all__ = ["Pipeline"]
+__all__ = ["Pipeline", "parse_and_chunk"]
 
 logger = logging.getLogger(__name__)
 
 
+def parse_and_chunk(
+    parser: BaseParser,
+    chunker: BaseChunker,
+    config: HwccConfig,
+    path: Path,
+    doc_type: str = "",
+    chip: str = "",
+) -> list[Chunk]:
+    """Run the parse → chunk half of the pipeline.
+
+    This half needs no embedder or store, so it can run in a worker process
+    while the parent keeps the (not fork-safe) store to itself.
+
+    Args:
+        parser: Parser for the document's format.
+        chunker: Chunker to split the parsed content.
+        config: Project configuration.
+        path: Path to the document file.
+        doc_type: Document type override (e.g. "datasheet", "svd").
+        chip: Chip/device override for multi-vendor support.
+
+    Returns:
+        Chunks for the document, possibly empty.
+    """
+    result = parser.parse(path, config)
+
+    # Apply caller-supplied overrides (CLI --type / --chip flags)
+    if doc_type or chip:
+        result = replace(
+            result,
+            doc_type=doc_type or result.doc_type,
+            chip=chip or result.chip,
+        )
+
+    logger.info("Parsed %s: %d chars", path.name, len(result.content))
+
+    chunks = chunker.chunk(result, config)
+    logger.info("Chunked into %d chunks", len(chunks))
+    return chunks
+
+
 class Pipeline:
     """Orchestrates the document processing pipeline.
 
@@ -81,25 +123,37 @@ class Pipeline:
         try:
             logger.info("Processing %s (doc_id=%s)", path, doc_id)
 
-            result = self.parser.parse(path, self.config)
-
-            # Apply caller-supplied overrides (CLI --type / --chip flags)
-            if doc_type or chip:
-                result = replace(
-                    result,
-                    doc_type=doc_type or result.doc_type,
-                    chip=chip or result.chip,
-                )
-
-            logger.info("Parsed %s: %d chars", path.name, len(result.content))
-
-            chunks = self.chunker.chunk(result, self.config)
-            logger.info("Chunked into %d chunks", len(chunks))
+            chunks = parse_and_chunk(
+                self.parser, self.chunker, self.config, path, doc_type=doc_type, chip=chip
+            )
 
             if not chunks:
                 logger.warning("No chunks produced for %s", path)
                 return 0
 
+            return self.index(chunks, doc_id)
+
+        except PipelineError:
+            raise
+        except Exception as e:
+            raise PipelineError(f"Pipeline failed processing {path}: {e}") from e
+
+    def index(self, chunks: list[Chunk], doc_id: str) -> int:
+        """Run the embed → store half of the pipeline on ready-made chunks.
+
+        Args:
+            chunks: Chunks produced by :func:`parse_and_chunk`.
+            doc_id: Unique document identifier.
+
+        Returns:
+            Number of chunks stored.
+
+        Raises:
+            PipelineError: If embedding or storing fails.
+        """
+        if not chunks:
+            return 0
+        try:
             embedded = self.embedder.embed_chunks(chunks)
             logger.info("Embedded %d chunks", len(embedded))
 
@@ -111,7 +165,7 @@ class Pipeline:
         except PipelineError:
             raise
         except Exception as e:
-            raise PipelineError(f"Pipeline failed processing {path}: {e}") from e
+            raise PipelineError(f"Pipeline failed indexing {doc_id}: {e}") from e
 
     def remove(self, doc_id: str) -> int:
         """Remove a document from the store.
@@ -44,6 +44,7 @@ class ProjectStatus:
     document_count: int
     chunk_count: int
     config: HwccConfig | None
+    manifest: Manifest | None = None
 
 
 class ProjectManager:
@@ -144,6 +145,7 @@ class ProjectManager:
             document_count=len(manifest.documents),
             chunk_count=total_chunks,
             config=config,
+            manifest=manifest,
         )
 
     def _find_svd_files(self) -> list[Path]:
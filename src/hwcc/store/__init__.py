@@ -2,8 +2,9 @@
 
 from hwcc.store.base import BaseStore
 from hwcc.store.chroma import ChromaStore
+from hwcc.store.write_behind import WriteBehindStore
 
-__all__ = ["BaseStore", "ChromaStore"]
+__all__ = ["BaseStore", "ChromaStore", "WriteBehindStore"]
 
 # Registry registration deferred to task 1.8 (CLI integration).
 # ChromaStore needs persist_path which is derived at runtime from project root.
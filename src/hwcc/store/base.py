@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from hwcc.types import Chunk, ChunkMetadata, EmbeddedChunk, SearchResult
 
 __all__ = ["BaseStore"]
@@ -70,6 +72,23 @@ class BaseStore(ABC):
             StoreError: If deletion fails.
         """
 
+    def delete_many(self, doc_ids: list[str]) -> int:
+        """Delete all chunks for several documents.
+
+        The default deletes one document at a time; stores that can remove
+        them in a single operation should override this.
+
+        Args:
+            doc_ids: Document IDs to remove.
+
+        Returns:
+            Total number of chunks deleted.
+
+        Raises:
+            StoreError: If deletion fails.
+        """
+        return sum(self.delete(doc_id) for doc_id in doc_ids)
+
     @abstractmethod
     def get_chunk_metadata(
         self,
@@ -112,6 +131,29 @@ class BaseStore(ABC):
             StoreError: If the query fails.
         """
 
+    def iter_chunks(
+        self,
+        where: dict[str, str | dict[str, str]] | None = None,
+        batch_size: int = 256,
+    ) -> Iterator[Chunk]:
+        """Yield chunks matching filters, fetched ``batch_size`` at a time.
+
+        Callers that keep only some of the chunks never hold the full
+        result set. The default yields from :meth:`get_chunks`; stores
+        that can page through results override it.
+
+        Args:
+            where: Optional metadata filters (e.g., ``{"doc_type": "svd"}``).
+            batch_size: Number of chunks fetched per store query.
+
+        Yields:
+            Chunk objects with content and metadata.
+
+        Raises:
+            StoreError: If the query fails.
+        """
+        yield from self.get_chunks(where)
+
     @abstractmethod
     def count(self) -> int:
         """Return the total number of chunks in the store."""
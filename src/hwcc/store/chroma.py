@@ -7,18 +7,22 @@ Uses file-based persistence — no server required.
 from __future__ import annotations
 
 import logging
+import sys
 from typing import TYPE_CHECKING
 
 import chromadb
+import numpy as np
 
 from hwcc.exceptions import StoreError
 from hwcc.store.base import BaseStore
 from hwcc.types import Chunk, ChunkMetadata, EmbeddedChunk, SearchResult
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
     from pathlib import Path
 
+    from chromadb.api.types import GetResult
+
 __all__ = ["ChromaStore"]
 
 logger = logging.getLogger(__name__)
@@ -70,7 +74,6 @@ class ChromaStore(BaseStore):
             return 0
 
         ids = [c.chunk.chunk_id for c in chunks]
-        embeddings = [list(c.embedding) for c in chunks]
         documents = [c.chunk.content for c in chunks]
         metadatas = [
             {
@@ -88,9 +91,12 @@ class ChromaStore(BaseStore):
         ]
 
         try:
+            # One contiguous float32 matrix (ChromaDB's storage dtype) instead of
+            # a fresh list of boxed floats per chunk
+            embeddings = np.array([c.embedding for c in chunks], dtype=np.float32)
             self._collection.add(
                 ids=ids,
-                embeddings=embeddings,  # type: ignore[arg-type]
+                embeddings=embeddings,
                 documents=documents,
                 metadatas=metadatas,  # type: ignore[arg-type]
             )
@@ -216,6 +222,37 @@ class ChromaStore(BaseStore):
         logger.info("Deleted %d chunks for doc_id=%s", count, doc_id)
         return count
 
+    def delete_many(self, doc_ids: list[str]) -> int:
+        """Delete all chunks for several documents in one collection call.
+
+        Args:
+            doc_ids: Document IDs to remove.
+
+        Returns:
+            Total number of chunks deleted.
+
+        Raises:
+            StoreError: If deletion fails.
+        """
+        if not doc_ids:
+            return 0
+        try:
+            existing = self._collection.get(
+                where={"doc_id": {"$in": doc_ids}},  # type: ignore[dict-item]
+                include=[],
+            )
+            ids = existing["ids"]
+
+            if not ids:
+                return 0
+
+            self._collection.delete(ids=ids)
+        except Exception as e:
+            raise StoreError(f"Failed to delete chunks for {len(doc_ids)} documents: {e}") from e
+
+        logger.info("Deleted %d chunks for %d documents", len(ids), len(doc_ids))
+        return len(ids)
+
     def get_chunk_metadata(
         self,
         where: dict[str, str | dict[str, str]] | None = None,
@@ -276,6 +313,53 @@ class ChromaStore(BaseStore):
         except Exception as e:
             raise StoreError(f"Failed to get chunks: {e}") from e
 
+        return self._chunks_from_results(results)
+
+    def iter_chunks(
+        self,
+        where: dict[str, str | dict[str, str]] | None = None,
+        batch_size: int = 256,
+    ) -> Iterator[Chunk]:
+        """Yield chunks matching filters, one ``limit``/``offset`` page at a time.
+
+        Args:
+            where: Optional metadata filters (e.g., ``{"doc_type": "svd"}``).
+            batch_size: Number of chunks fetched per query.
+
+        Yields:
+            Chunk objects with content and metadata.
+
+        Raises:
+            StoreError: If a query fails.
+        """
+        offset = 0
+        while True:
+            try:
+                results = self._collection.get(
+                    where=where,  # type: ignore[arg-type]
+                    include=["documents", "metadatas"],
+                    limit=batch_size,
+                    offset=offset,
+                )
+            except Exception as e:
+                raise StoreError(f"Failed to get chunks: {e}") from e
+
+            chunks = self._chunks_from_results(results)
+            yield from chunks
+            if len(chunks) < batch_size:
+                return
+            offset += batch_size
+
+    def count(self) -> int:
+        """Return the total number of chunks in the store."""
+        try:
+            return self._collection.count()
+        except Exception as e:
+            raise StoreError(f"Failed to count chunks: {e}") from e
+
+    @classmethod
+    def _chunks_from_results(cls, results: GetResult) -> list[Chunk]:
+        """Build Chunk objects from a ``collection.get`` result."""
         ids = results.get("ids", [])
         documents = results.get("documents")
         metadatas = results.get("metadatas")
@@ -287,7 +371,7 @@ class ChromaStore(BaseStore):
             metadatas or [],
             strict=True,
         ):
-            chunk_meta = self._meta_from_dict(meta)
+            chunk_meta = cls._meta_from_dict(meta)
             token_val = meta.get("token_count", 0) if meta else 0
             chunks.append(
                 Chunk(
@@ -300,26 +384,25 @@ class ChromaStore(BaseStore):
 
         return chunks
 
-    def count(self) -> int:
-        """Return the total number of chunks in the store."""
-        try:
-            return self._collection.count()
-        except Exception as e:
-            raise StoreError(f"Failed to count chunks: {e}") from e
-
     @staticmethod
     def _meta_from_dict(meta: Mapping[str, object] | None) -> ChunkMetadata:
-        """Reconstruct a ChunkMetadata from a ChromaDB metadata dict."""
+        """Reconstruct a ChunkMetadata from a ChromaDB metadata dict.
+
+        Low-cardinality fields (ids, types, tags) and section paths, which
+        consecutive chunks of one section repeat, are interned, so chunks
+        loaded in bulk share one string per distinct value instead of each
+        holding its own copy decoded from the store.
+        """
         if not meta:
             return ChunkMetadata(doc_id="")
         page_val = meta.get("page", 0)
         return ChunkMetadata(
-            doc_id=str(meta.get("doc_id", "")),
-            doc_type=str(meta.get("doc_type", "")),
-            chip=str(meta.get("chip", "")),
-            section_path=str(meta.get("section_path", "")),
+            doc_id=sys.intern(str(meta.get("doc_id", ""))),
+            doc_type=sys.intern(str(meta.get("doc_type", ""))),
+            chip=sys.intern(str(meta.get("chip", ""))),
+            section_path=sys.intern(str(meta.get("section_path", ""))),
             page=int(page_val) if page_val is not None else 0,  # type: ignore[call-overload]
-            chunk_level=str(meta.get("chunk_level", "detail")),
-            peripheral=str(meta.get("peripheral", "")),
-            content_type=str(meta.get("content_type", "")),
+            chunk_level=sys.intern(str(meta.get("chunk_level", "detail"))),
+            peripheral=sys.intern(str(meta.get("peripheral", ""))),
+            content_type=sys.intern(str(meta.get("content_type", ""))),
         )
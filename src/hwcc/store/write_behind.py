@@ -0,0 +1,126 @@
+"""Write-behind decorator for vector stores.
+
+Runs ``add`` on a background thread so that persisting one document's
+chunks overlaps with embedding the next one.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from hwcc.store.base import BaseStore
+
+if TYPE_CHECKING:
+    from hwcc.types import Chunk, ChunkMetadata, EmbeddedChunk, SearchResult
+
+__all__ = ["WriteBehindStore"]
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindStore(BaseStore):
+    """Store decorator that performs writes on a single background thread.
+
+    ``add`` queues the write and returns at once; :meth:`wait` blocks until
+    a document's write has finished and reports its outcome. Every other
+    operation is queued behind the pending writes and waited for, so reads
+    and deletes observe all earlier adds and the wrapped store is only
+    ever used from one thread.
+
+    Usage::
+
+        store = WriteBehindStore(ChromaStore(persist_path, collection_name))
+        store.add(embedded, doc_id)  # returns immediately
+        ...                          # embed the next document meanwhile
+        count = store.wait(doc_id)   # raises StoreError if the write failed
+        store.close()
+    """
+
+    def __init__(self, store: BaseStore) -> None:
+        self._store = store
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hwcc-store")
+        # Queued writes per document, oldest first; a doc_id may be added twice
+        self._pending: dict[str, deque[Future[int]]] = {}
+
+    def add(self, chunks: list[EmbeddedChunk], doc_id: str) -> int:
+        """Queue chunks for storage and return how many were queued."""
+        if not chunks:
+            return 0
+        future = self._executor.submit(self._store.add, chunks, doc_id)
+        self._pending.setdefault(doc_id, deque()).append(future)
+        return len(chunks)
+
+    def wait(self, doc_id: str) -> int | None:
+        """Wait for the oldest queued write of a document.
+
+        Each ``add`` is reported by its own ``wait``, in submission order.
+
+        Args:
+            doc_id: Document whose write to wait for.
+
+        Returns:
+            Number of chunks the wrapped store added, or None if no write
+            is pending for the document.
+
+        Raises:
+            StoreError: If the write failed.
+        """
+        queue = self._pending.get(doc_id)
+        if not queue:
+            return None
+        future = queue.popleft()
+        if not queue:
+            del self._pending[doc_id]
+        return future.result()
+
+    def close(self) -> None:
+        """Finish all queued writes and stop the background thread.
+
+        Outcomes of writes that were never waited for are discarded.
+        """
+        self._executor.shutdown(wait=True)
+        for doc_id, queue in self._pending.items():
+            for future in queue:
+                if future.exception() is not None:
+                    logger.warning(
+                        "Unreported write failure for %s: %s", doc_id, future.exception()
+                    )
+        self._pending.clear()
+
+    def search(
+        self,
+        query_embedding: list[float],
+        k: int = 5,
+        where: dict[str, str | dict[str, str]] | None = None,
+    ) -> list[SearchResult]:
+        """Search after all queued writes have been applied."""
+        return self._executor.submit(self._store.search, query_embedding, k, where).result()
+
+    def delete(self, doc_id: str) -> int:
+        """Delete a document after all queued writes have been applied."""
+        return self._executor.submit(self._store.delete, doc_id).result()
+
+    def delete_many(self, doc_ids: list[str]) -> int:
+        """Delete documents after all queued writes have been applied."""
+        return self._executor.submit(self._store.delete_many, doc_ids).result()
+
+    def get_chunk_metadata(
+        self,
+        where: dict[str, str | dict[str, str]] | None = None,
+    ) -> list[ChunkMetadata]:
+        """Get chunk metadata after all queued writes have been applied."""
+        return self._executor.submit(self._store.get_chunk_metadata, where).result()
+
+    def get_chunks(
+        self,
+        where: dict[str, str | dict[str, str]] | None = None,
+    ) -> list[Chunk]:
+        """Get chunks after all queued writes have been applied."""
+        return self._executor.submit(self._store.get_chunks, where).result()
+
+    def count(self) -> int:
+        """Count chunks after all queued writes have been applied."""
+        return self._executor.submit(self._store.count).result()
@@ -53,6 +53,9 @@ class TestCountTokens:
         long = count_tokens("Hello, this is a much longer sentence with many words.")
         assert long > short
 
+    def test_special_token_text_counted_as_ordinary(self):
+        assert count_tokens("see <|endoftext|> here") > 0
+
 
 # ---------------------------------------------------------------------------
 # Config defaults
@@ -145,6 +148,40 @@ class TestMultiChunkSplitting:
         for chunk in chunks:
             assert chunk.token_count <= config.chunk.max_tokens
 
+    def test_chunks_keep_source_order_across_split_levels(self, chunker):
+        """Parts split at different separator depths should stay in document order."""
+        config = default_config()
+        config.chunk.max_tokens = 40
+        config.chunk.overlap_tokens = 0
+        config.chunk.min_tokens = 0
+
+        # Short sections interleaved with ones that need line and word splits
+        sections = []
+        for i in range(6):
+            body = f"marker{i} " + ("word " * 60 if i % 2 else "short")
+            sections.append(f"## Section {i}\n\n{body}")
+        content = "\n\n".join(sections)
+
+        chunks = chunker.chunk(_make_result(content), config)
+        text = " ".join(c.content for c in chunks)
+        positions = [text.index(f"marker{i}") for i in range(6)]
+        assert positions == sorted(positions)
+        assert all(c.token_count <= config.chunk.max_tokens for c in chunks)
+
+    def test_hard_split_pieces_reassemble_input(self, chunker):
+        """Text with no separators is split by token count without losing characters."""
+        config = default_config()
+        config.chunk.max_tokens = 20
+        config.chunk.overlap_tokens = 0
+        config.chunk.min_tokens = 0
+
+        content = "0x" + "DEADBEEF" * 60
+        chunks = chunker.chunk(_make_result(content), config)
+
+        assert len(chunks) > 1
+        assert "".join(c.content for c in chunks) == content
+        assert all(c.token_count <= config.chunk.max_tokens for c in chunks)
+
 
 # ---------------------------------------------------------------------------
 # Overlap
@@ -398,6 +435,39 @@ class TestSectionPath:
         tracker.update("## Registers\n\nRegister map")
         assert tracker.path == "SPI > Registers"
 
+    def test_section_tracker_ignores_hash_lines_that_are_not_headings(self):
+        tracker = _SectionTracker()
+
+        tracker.update("#define SPI_CR1 0x00\n# SPI\n####### Too deep\n  # Indented\n## DMA")
+        assert tracker.path == "SPI > DMA"
+
+    def test_section_tracker_advance_by_offset(self):
+        """Pre-scanned headings are applied up to a chunk's end offset."""
+        text = "# SPI\n\nIntro\n\n## Configuration\n\nBody\n\n## Registers\n\nMap"
+        tracker = _SectionTracker(text)
+
+        tracker.advance(text.index("Intro"))
+        assert tracker.path == "SPI"
+
+        tracker.advance(text.index("Body"))
+        assert tracker.path == "SPI > Configuration"
+
+        tracker.advance(len(text))
+        assert tracker.path == "SPI > Registers"
+
+    def test_section_path_includes_heading_after_overlap(self, chunker):
+        """A heading glued to overlap text still updates the section path."""
+        config = default_config()
+        config.chunk.max_tokens = 60
+        config.chunk.overlap_tokens = 10
+        config.chunk.min_tokens = 0
+
+        content = "# Intro\n\n```c\nint a = 1;\nint b = 2;\n```\n## Next\n\n" + "Word " * 30
+        result = _make_result(content)
+        chunks = chunker.chunk(result, config)
+
+        assert chunks[-1].metadata.section_path == "Intro > Next"
+
 
 # ---------------------------------------------------------------------------
 # Metadata propagation
@@ -543,6 +613,29 @@ class TestAtomicBlockExtraction:
         assert len(atomic) == 1
         assert "code" in atomic[0][0]
 
+    def test_unclosed_fence_runs_to_end(self):
+        text = "Before.\n```c\nint x;\n\nStill code."
+        segments = _extract_atomic_blocks(text)
+
+        assert segments == [("Before.", False), ("```c\nint x;\n\nStill code.", True)]
+
+    def test_closing_fence_with_trailing_spaces(self):
+        text = "```\ncode\n```  \nAfter."
+        segments = _extract_atomic_blocks(text)
+
+        assert segments == [("```\ncode\n```  ", True), ("After.", False)]
+
+    def test_segments_are_verbatim_slices(self):
+        text = (
+            "Intro\n| not | a table |\nmore text\n\n"
+            "| A | B |\n|---|---|\n| 1 | 2 |\n"
+            "```\ncode\n```\n"
+            "Tail\n"
+        )
+        segments = _extract_atomic_blocks(text)
+
+        assert "\n".join(s for s, _ in segments) == text
+
 
 # ---------------------------------------------------------------------------
 # Content type detection
@@ -677,6 +770,13 @@ class TestContentType:
         chunks = chunker.chunk(result, config)
         assert chunks[0].metadata.content_type == "errata"
 
+    def test_detect_table_with_overlapping_keywords_returns_timing_spec(self, chunker, config):
+        """A timing value sharing its digit with a config step is still detected."""
+        table = "| Phase | Duration |\n|-------|----------|\n| Step 1 ms | wait |\n"
+        result = _make_result(table)
+        chunks = chunker.chunk(result, config)
+        assert chunks[0].metadata.content_type == "timing_spec"
+
     def test_all_content_types_in_taxonomy(self, chunker, config):
         """Every detected content_type must be a member of CONTENT_TYPES."""
         samples = [
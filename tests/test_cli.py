@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from typing import TYPE_CHECKING
 
 from typer.testing import CliRunner
 
 from hwcc import __version__
-from hwcc.cli import app
+from hwcc.cli import _dir_size, _format_size, app
 from hwcc.config import load_config
 from hwcc.manifest import DocumentEntry, Manifest, save_manifest
 from hwcc.project import CONFIG_FILE, MANIFEST_FILE, RAG_DIR
@@ -20,6 +22,16 @@ if TYPE_CHECKING:
 runner = CliRunner()
 
 
+class TestStartup:
+    def test_import_does_not_load_vector_store(self):
+        """Heavy backends are imported by the commands that need them."""
+        code = "import sys, hwcc.cli; print(sorted({'chromadb', 'jinja2'} & set(sys.modules)))"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+
 class TestVersion:
     def test_prints_version(self):
         result = runner.invoke(app, ["version"])
@@ -56,7 +68,7 @@ class TestInit:
             raise OSError("Permission denied")
 
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("hwcc.cli.ProjectManager.init", _fail_init)
+        monkeypatch.setattr("hwcc.project.ProjectManager.init", _fail_init)
         result = runner.invoke(app, ["init"])
         assert result.exit_code == 1
         assert "Permission denied" in result.output
@@ -83,6 +95,26 @@ class TestStatus:
         assert result.exit_code == 0
         assert "hwcc add" in result.output
 
+    def test_dir_size_sums_nested_files(self, tmp_path: Path):
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.bin").write_bytes(b"x" * 10)
+        (tmp_path / "a" / "mid.bin").write_bytes(b"x" * 20)
+        (tmp_path / "a" / "b" / "deep.bin").write_bytes(b"x" * 30)
+        assert _dir_size(tmp_path) == 60
+
+    def test_dir_size_missing_directory_is_zero(self, tmp_path: Path):
+        assert _dir_size(tmp_path / "missing") == 0
+
+    def test_format_size_units(self):
+        assert _format_size(0) == "0 B"
+        assert _format_size(1023) == "1023 B"
+        assert _format_size(1024) == "1.0 KB"
+        assert _format_size(1536) == "1.5 KB"
+        assert _format_size(1024 * 1024 - 1) == "1024.0 KB"
+        assert _format_size(5 * 1024 * 1024) == "5.0 MB"
+        assert _format_size(3 * 1024**3) == "3.0 GB"
+        assert _format_size(2048 * 1024**4) == "2048.0 TB"
+
 
 class TestStatusWithDocuments:
     """Tests for enhanced status output with indexed documents."""
@@ -149,6 +181,34 @@ class TestStatusWithDocuments:
         # Chip should appear
         assert "STM32F407" in result.output
 
+    def test_status_large_manifest_lists_all_documents(
+        self, initialized_project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        manifest = Manifest()
+        for i in range(60):
+            manifest.add_document(
+                DocumentEntry(
+                    id=f"doc_{i:02d}_pdf",
+                    path=f"/tmp/doc_{i:02d}.pdf",
+                    doc_type="datasheet",
+                    hash=f"sha256:{i}",
+                    added="2026-02-28T10:00:00+00:00",
+                    chunks=i,
+                    chip="STM32F407",
+                )
+            )
+        save_manifest(manifest, initialized_project / RAG_DIR / MANIFEST_FILE)
+
+        result = runner.invoke(app, ["status"])
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        header = next(line for line in lines if line.lstrip().startswith("ID"))
+        row = next(line for line in lines if "doc_59_pdf" in line)
+        assert row.index(" 59 ") + 3 == header.index("Chunks") + len("Chunks")
+        assert row.index("2026-02-28") == header.index("Added")
+        assert all(f"doc_{i:02d}_pdf" in result.output for i in range(60))
+
     def test_status_shows_embedding_info(
         self, initialized_project: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
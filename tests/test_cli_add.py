@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
@@ -9,8 +11,9 @@ import pytest
 from typer.testing import CliRunner
 
 from hwcc.cli import app
-from hwcc.manifest import load_manifest
+from hwcc.manifest import compute_hash, load_manifest, save_manifest
 from hwcc.project import MANIFEST_FILE, RAG_DIR
+from hwcc.types import EmbeddedChunk
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -30,17 +33,17 @@ def txt_file(initialized_project: Path) -> Path:
 def _mock_pipeline(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     """Mock heavy pipeline components so add doesn't need Ollama/ChromaDB/tiktoken.
 
-    Patches Pipeline, MarkdownChunker, ChromaStore, and default_registry
-    as they will be imported in hwcc.cli.
+    Patches Pipeline, MarkdownChunker, ChromaStore, and default_registry in
+    their own modules, which hwcc.cli imports from inside the commands.
     """
     mock_process = MagicMock(return_value=10)
     mock_pipeline_cls = MagicMock()
     mock_pipeline_cls.return_value.process = mock_process
 
-    monkeypatch.setattr("hwcc.cli.Pipeline", mock_pipeline_cls)
-    monkeypatch.setattr("hwcc.cli.MarkdownChunker", MagicMock())
-    monkeypatch.setattr("hwcc.cli.ChromaStore", MagicMock())
-    monkeypatch.setattr("hwcc.cli.default_registry", MagicMock())
+    monkeypatch.setattr("hwcc.pipeline.Pipeline", mock_pipeline_cls)
+    monkeypatch.setattr("hwcc.chunk.MarkdownChunker", MagicMock())
+    monkeypatch.setattr("hwcc.store.ChromaStore", MagicMock())
+    monkeypatch.setattr("hwcc.registry.default_registry", MagicMock())
 
     return mock_process
 
@@ -163,6 +166,46 @@ class TestAddIncremental:
         assert result.exit_code == 0
         assert "skip" in result.output.lower() or "unchanged" in result.output.lower()
 
+    @pytest.mark.usefixtures("_mock_pipeline")
+    def test_unchanged_stat_skips_hashing(
+        self,
+        initialized_project: Path,
+        txt_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        runner.invoke(app, ["add", str(txt_file)])
+
+        hash_mock = MagicMock(side_effect=AssertionError("file was re-hashed"))
+        monkeypatch.setattr("hwcc.cli.compute_hash", hash_mock)
+        result = runner.invoke(app, ["add", str(txt_file)])
+        assert result.exit_code == 0
+        assert "unchanged" in result.output.lower()
+        hash_mock.assert_not_called()
+
+    def test_touched_file_is_skipped_and_stat_refreshed(
+        self,
+        initialized_project: Path,
+        txt_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        _mock_pipeline: MagicMock,
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        runner.invoke(app, ["add", str(txt_file)])
+        st = txt_file.stat()
+        os.utime(txt_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        result = runner.invoke(app, ["add", str(txt_file)])
+        assert result.exit_code == 0
+        assert "unchanged" in result.output.lower()
+        assert _mock_pipeline.call_count == 1
+
+        entry = load_manifest(initialized_project / RAG_DIR / MANIFEST_FILE).get_document(
+            "notes_txt"
+        )
+        assert entry is not None
+        assert entry.mtime_ns == txt_file.stat().st_mtime_ns
+
 
 # --- --chip Flag ---
 
@@ -179,10 +222,10 @@ class TestAddChipFlag:
         mock_process = MagicMock(return_value=5)
         mock_pipeline_cls = MagicMock()
         mock_pipeline_cls.return_value.process = mock_process
-        monkeypatch.setattr("hwcc.cli.Pipeline", mock_pipeline_cls)
-        monkeypatch.setattr("hwcc.cli.MarkdownChunker", MagicMock())
-        monkeypatch.setattr("hwcc.cli.ChromaStore", MagicMock())
-        monkeypatch.setattr("hwcc.cli.default_registry", MagicMock())
+        monkeypatch.setattr("hwcc.pipeline.Pipeline", mock_pipeline_cls)
+        monkeypatch.setattr("hwcc.chunk.MarkdownChunker", MagicMock())
+        monkeypatch.setattr("hwcc.store.ChromaStore", MagicMock())
+        monkeypatch.setattr("hwcc.registry.default_registry", MagicMock())
 
         result = runner.invoke(app, ["add", "--chip", "NRF52840", str(txt_file)])
         assert result.exit_code == 0
@@ -208,10 +251,10 @@ class TestAddTypeFlag:
         mock_process = MagicMock(return_value=5)
         mock_pipeline_cls = MagicMock()
         mock_pipeline_cls.return_value.process = mock_process
-        monkeypatch.setattr("hwcc.cli.Pipeline", mock_pipeline_cls)
-        monkeypatch.setattr("hwcc.cli.MarkdownChunker", MagicMock())
-        monkeypatch.setattr("hwcc.cli.ChromaStore", MagicMock())
-        monkeypatch.setattr("hwcc.cli.default_registry", MagicMock())
+        monkeypatch.setattr("hwcc.pipeline.Pipeline", mock_pipeline_cls)
+        monkeypatch.setattr("hwcc.chunk.MarkdownChunker", MagicMock())
+        monkeypatch.setattr("hwcc.store.ChromaStore", MagicMock())
+        monkeypatch.setattr("hwcc.registry.default_registry", MagicMock())
 
         result = runner.invoke(app, ["add", "--type", "errata", str(txt_file)])
         assert result.exit_code == 0
@@ -244,6 +287,204 @@ class TestAddMultipleFiles:
         manifest = load_manifest(initialized_project / RAG_DIR / MANIFEST_FILE)
         assert len(manifest.documents) == 2
 
+    def test_same_file_listed_twice_is_added_once(
+        self,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        _mock_pipeline: MagicMock,
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        f = initialized_project / "file1.txt"
+        f.write_text("Content one", encoding="utf-8")
+
+        result = runner.invoke(app, ["add", "--no-compile", str(f), str(f)])
+        assert result.exit_code == 0
+        assert _mock_pipeline.call_count == 1
+        assert "listed twice" in result.output
+        assert "Added 1 document(s)" in result.output
+
+    def test_paths_sharing_a_doc_id_index_only_the_last(
+        self,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        _mock_pipeline: MagicMock,
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        (initialized_project / "x").mkdir()
+        (initialized_project / "y").mkdir()
+        fx = initialized_project / "x" / "a.txt"
+        fy = initialized_project / "y" / "a.txt"
+        fx.write_text("First copy", encoding="utf-8")
+        fy.write_text("Second copy", encoding="utf-8")
+
+        result = runner.invoke(app, ["add", "--no-compile", str(fx), str(fy)])
+        assert result.exit_code == 0
+        assert [c.kwargs["path"] for c in _mock_pipeline.call_args_list] == [fy]
+        manifest = load_manifest(initialized_project / RAG_DIR / MANIFEST_FILE)
+        assert [d.path for d in manifest.documents] == [os.path.join("y", "a.txt")]
+
+    @pytest.mark.usefixtures("_mock_pipeline")
+    def test_manifest_saved_once_per_batch(
+        self,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        save = MagicMock(wraps=save_manifest)
+        monkeypatch.setattr("hwcc.cli.save_manifest", save)
+        files = []
+        for i in range(3):
+            f = initialized_project / f"file{i}.txt"
+            f.write_text(f"Content {i}", encoding="utf-8")
+            files.append(str(f))
+
+        result = runner.invoke(app, ["add", "--no-compile", *files])
+        assert result.exit_code == 0
+        save.assert_called_once()
+        manifest = load_manifest(initialized_project / RAG_DIR / MANIFEST_FILE)
+        assert len(manifest.documents) == 3
+        assert len({doc.added for doc in manifest.documents}) == 1
+
+    @pytest.mark.usefixtures("_mock_pipeline")
+    def test_files_hashed_ahead_record_their_own_hash(
+        self,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        files = []
+        for i in range(5):
+            f = initialized_project / f"file{i}.txt"
+            f.write_text(f"Content {i}", encoding="utf-8")
+            files.append(f)
+
+        result = runner.invoke(app, ["add", "--no-compile", *map(str, files)])
+        assert result.exit_code == 0
+
+        manifest = load_manifest(initialized_project / RAG_DIR / MANIFEST_FILE)
+        for f in files:
+            entry = manifest.get_document(f"{f.stem}_txt")
+            assert entry is not None
+            assert entry.hash == compute_hash(f)
+
+    @pytest.mark.usefixtures("_mock_pipeline")
+    def test_changed_files_old_chunks_deleted_in_one_call(
+        self,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        store_cls = MagicMock()
+        monkeypatch.setattr("hwcc.store.ChromaStore", store_cls)
+        files = []
+        for i in range(3):
+            f = initialized_project / f"file{i}.txt"
+            f.write_text(f"Content {i}", encoding="utf-8")
+            files.append(f)
+        runner.invoke(app, ["add", "--no-compile", *map(str, files)])
+
+        for f in files[:2]:
+            f.write_text(f"{f.read_text(encoding='utf-8')} changed", encoding="utf-8")
+        result = runner.invoke(app, ["add", "--no-compile", *map(str, files)])
+        assert result.exit_code == 0
+
+        store_cls.return_value.delete_many.assert_called_once_with(["file0_txt", "file1_txt"])
+        store_cls.return_value.delete.assert_not_called()
+
+    @pytest.mark.usefixtures("_mock_pipeline")
+    def test_pipeline_and_parser_reused_across_files(
+        self,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        pipeline_cls = MagicMock()
+        pipeline_cls.return_value.process.return_value = 4
+        build_parser = MagicMock()
+        monkeypatch.setattr("hwcc.pipeline.Pipeline", pipeline_cls)
+        monkeypatch.setattr("hwcc.cli._build_parser", build_parser)
+        files = []
+        for i in range(3):
+            f = initialized_project / f"file{i}.txt"
+            f.write_text(f"Content {i}", encoding="utf-8")
+            files.append(str(f))
+
+        result = runner.invoke(app, ["add", *files])
+        assert result.exit_code == 0
+        assert pipeline_cls.return_value.process.call_count == 3
+        pipeline_cls.assert_called_once()
+        build_parser.assert_called_once()
+
+    def test_jobs_processes_files_in_workers(
+        self,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """With --jobs, workers parse, chunk and embed; results are stored in input order."""
+        monkeypatch.chdir(initialized_project)
+
+        # Threads stand in for worker processes so the mocks below apply to them
+        def _thread_pool(max_workers, mp_context, initializer, initargs):
+            return ThreadPoolExecutor(max_workers, initializer=initializer, initargs=initargs)
+
+        mock_registry = MagicMock()
+        mock_registry.create.return_value.embed_chunks.side_effect = lambda chunks: [
+            EmbeddedChunk(chunk=c, embedding=(0.0,)) for c in chunks
+        ]
+        mock_store_cls = MagicMock()
+        mock_store = mock_store_cls.return_value
+        mock_store.add.side_effect = lambda embedded, doc_id: len(embedded)
+        mock_pipeline_cls = MagicMock()
+        monkeypatch.setattr("hwcc.cli.ProcessPoolExecutor", _thread_pool)
+        monkeypatch.setattr("hwcc.store.ChromaStore", mock_store_cls)
+        monkeypatch.setattr("hwcc.registry.default_registry", mock_registry)
+        monkeypatch.setattr("hwcc.pipeline.Pipeline", mock_pipeline_cls)
+
+        f1 = initialized_project / "file1.txt"
+        f2 = initialized_project / "file2.txt"
+        f1.write_text("Short note.", encoding="utf-8")
+        f2.write_text("A longer note about SPI clock polarity. " * 20, encoding="utf-8")
+
+        result = runner.invoke(app, ["add", "--jobs", "2", "--no-compile", str(f1), str(f2)])
+        assert result.exit_code == 0, result.output
+
+        mock_pipeline_cls.return_value.process.assert_not_called()
+        assert [c.args[1] for c in mock_store.add.call_args_list] == ["file1_txt", "file2_txt"]
+        manifest = load_manifest(initialized_project / RAG_DIR / MANIFEST_FILE)
+        assert [d.id for d in manifest.documents] == ["file1_txt", "file2_txt"]
+        assert all(d.chunks >= 1 for d in manifest.documents)
+
+    def test_jobs_file_removed_after_checks_is_reported(
+        self,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Ordering the pool uses the recorded size, not a second stat."""
+        monkeypatch.chdir(initialized_project)
+
+        def _thread_pool(max_workers, mp_context, initializer, initargs):
+            return ThreadPoolExecutor(max_workers, initializer=initializer, initargs=initargs)
+
+        f1 = initialized_project / "file1.txt"
+        f2 = initialized_project / "file2.txt"
+        f1.write_text("Short note.", encoding="utf-8")
+        f2.write_text("Another note.", encoding="utf-8")
+
+        def hash_then_remove(path: Path) -> str:
+            digest = compute_hash(path)
+            if path == f2:
+                path.unlink()
+            return digest
+
+        monkeypatch.setattr("hwcc.cli.compute_hash", hash_then_remove)
+        monkeypatch.setattr("hwcc.cli.ProcessPoolExecutor", _thread_pool)
+        monkeypatch.setattr("hwcc.store.ChromaStore", MagicMock())
+        monkeypatch.setattr("hwcc.registry.default_registry", MagicMock())
+
+        result = runner.invoke(app, ["add", "--jobs", "2", "--no-compile", str(f1), str(f2)])
+        assert result.exit_code == 0, result.output
+        assert "Error processing file2.txt" in result.output
+
 
 # --- Pipeline Error ---
 
@@ -262,11 +503,11 @@ class TestAddPipelineError:
         mock_process = MagicMock(side_effect=[PipelineError("Embedding failed"), 5])
         mock_pipeline_cls = MagicMock()
         mock_pipeline_cls.return_value.process = mock_process
-        monkeypatch.setattr("hwcc.cli.Pipeline", mock_pipeline_cls)
-        monkeypatch.setattr("hwcc.cli.MarkdownChunker", MagicMock())
+        monkeypatch.setattr("hwcc.pipeline.Pipeline", mock_pipeline_cls)
+        monkeypatch.setattr("hwcc.chunk.MarkdownChunker", MagicMock())
         mock_store = MagicMock()
-        monkeypatch.setattr("hwcc.cli.ChromaStore", mock_store)
-        monkeypatch.setattr("hwcc.cli.default_registry", MagicMock())
+        monkeypatch.setattr("hwcc.store.ChromaStore", mock_store)
+        monkeypatch.setattr("hwcc.registry.default_registry", MagicMock())
 
         f1 = initialized_project / "file1.txt"
         f2 = initialized_project / "file2.txt"
@@ -304,6 +545,44 @@ class TestAddRelativePath:
         assert not entry.path.startswith("/")
         assert entry.path == "notes.txt"
 
+    @pytest.mark.usefixtures("_mock_pipeline")
+    def test_relative_argument_with_parent_segments(
+        self,
+        initialized_project: Path,
+        txt_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        (initialized_project / "sub").mkdir()
+        monkeypatch.chdir(initialized_project)
+        result = runner.invoke(app, ["add", "sub/../notes.txt"])
+        assert result.exit_code == 0
+
+        entry = load_manifest(initialized_project / RAG_DIR / MANIFEST_FILE).get_document(
+            "notes_txt"
+        )
+        assert entry is not None
+        assert entry.path == "notes.txt"
+
+    @pytest.mark.usefixtures("_mock_pipeline")
+    def test_symlinked_project_path_stored_relative(
+        self,
+        initialized_project: Path,
+        txt_file: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        link = tmp_path_factory.mktemp("links") / "project"
+        link.symlink_to(initialized_project, target_is_directory=True)
+        monkeypatch.chdir(initialized_project)
+        result = runner.invoke(app, ["add", str(link / "notes.txt")])
+        assert result.exit_code == 0
+
+        entry = load_manifest(initialized_project / RAG_DIR / MANIFEST_FILE).get_document(
+            "notes_txt"
+        )
+        assert entry is not None
+        assert entry.path == "notes.txt"
+
 
 # --- Remove Command Tests ---
 
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from pathlib import PurePosixPath
+
 import pytest
 
-from hwcc.compile.citations import build_title_map, format_citation
+from hwcc.compile.citations import (
+    _path_stem,
+    build_citation_formatter,
+    build_title_map,
+    format_citation,
+)
 from hwcc.manifest import DocumentEntry, Manifest
 from hwcc.types import ChunkMetadata
 
@@ -107,6 +114,42 @@ class TestFormatCitation:
         result = format_citation(meta, {})
         assert result == "*Source: some_doc, p.1*"
 
+    def test_repeated_citation_is_memoized(self, title_map):
+        first = format_citation(_meta(section_path="A > B > C", page=3), title_map)
+        again = format_citation(_meta(section_path="A > B > C", page=3), title_map)
+        assert first == "*Source: RM0090, §B > C, p.3*"
+        assert again is first
+
+    def test_memoized_citation_follows_title_map(self, title_map):
+        meta = _meta(page=2)
+        assert format_citation(meta, title_map) == "*Source: RM0090, p.2*"
+        assert format_citation(meta, {"rm0090_pdf": "Renamed"}) == "*Source: Renamed, p.2*"
+
+
+class TestBuildCitationFormatter:
+    @pytest.mark.parametrize("doc_type", ["pdf", "svd", "markdown"])
+    @pytest.mark.parametrize(
+        "section_path",
+        ["", "SPI", "SPI > Configuration", "Root > A > B > C", "A >  > B"],
+    )
+    @pytest.mark.parametrize("page", [0, 7])
+    def test_matches_split_based_format(self, title_map, doc_type, section_path, page):
+        meta = _meta(doc_type=doc_type, section_path=section_path, page=page)
+        parts = ["RM0090"]
+        if section_path:
+            parts.append("§" + " > ".join(section_path.split(" > ")[-2:]))
+        if doc_type == "pdf" and page > 0:
+            parts.append(f"p.{page}")
+        formatter = build_citation_formatter(title_map, doc_type)
+        assert formatter(meta) == f"*Source: {', '.join(parts)}*"
+
+    def test_reused_across_chunks(self, title_map):
+        formatter = build_citation_formatter(title_map, "pdf")
+        assert formatter(_meta(page=1)) == "*Source: RM0090, p.1*"
+        assert formatter(_meta(doc_id="other", section_path="A > B > C", page=2)) == (
+            "*Source: other, §B > C, p.2*"
+        )
+
 
 # ---------------------------------------------------------------------------
 # build_title_map
@@ -114,6 +157,13 @@ class TestFormatCitation:
 
 
 class TestBuildTitleMap:
+    @pytest.mark.parametrize(
+        "path",
+        ["a.pdf", "/docs/RM0090.pdf", "dir/a.b.c", "dir/.hidden", "a.", "", "x/y/", "noext"],
+    )
+    def test_path_stem_matches_pure_posix_path(self, path: str):
+        assert _path_stem(path) == PurePosixPath(path).stem
+
     def test_builds_from_manifest(self):
         manifest = Manifest()
         manifest.add_document(
@@ -160,3 +210,18 @@ class TestBuildTitleMap:
 
         result = build_title_map(manifest)
         assert result["my_doc"] == "my cool datasheet"
+
+    def test_empty_stem_falls_back_to_doc_id(self):
+        manifest = Manifest()
+        manifest.add_document(
+            DocumentEntry(
+                id="orphan_doc",
+                path="",
+                doc_type="pdf",
+                hash="aaa",
+                added="2026-01-01",
+            )
+        )
+
+        result = build_title_map(manifest)
+        assert result["orphan_doc"] == "orphan_doc"
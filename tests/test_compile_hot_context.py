@@ -6,6 +6,12 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from hwcc.compile.context import (
+    CompileContext,
+    DocumentSummary,
+    ErrataSummary,
+    PeripheralSummary,
+)
 from hwcc.compile.hot_context import HotContextCompiler
 from hwcc.config import (
     ConventionsConfig,
@@ -33,6 +39,7 @@ class FakeStore(BaseStore):
 
     def __init__(self, metadata: list[ChunkMetadata] | None = None) -> None:
         self._metadata = metadata or []
+        self.metadata_queries: list[dict[str, str | dict[str, str]] | None] = []
 
     def add(self, chunks: list[EmbeddedChunk], doc_id: str) -> int:
         return 0
@@ -52,13 +59,21 @@ class FakeStore(BaseStore):
         self,
         where: dict[str, str | dict[str, str]] | None = None,
     ) -> list[ChunkMetadata]:
+        self.metadata_queries.append(where)
         if where is None:
             return list(self._metadata)
-        return [
-            m
-            for m in self._metadata
-            if all(getattr(m, key, None) == v for key, v in where.items())
-        ]
+        return [m for m in self._metadata if self._matches(m, where)]
+
+    @staticmethod
+    def _matches(meta: ChunkMetadata, where: dict[str, str | dict[str, str]]) -> bool:
+        for key, val in where.items():
+            actual = getattr(meta, key, None)
+            if isinstance(val, dict) and "$ne" in val:
+                if actual == val["$ne"]:
+                    return False
+            elif actual != val:
+                return False
+        return True
 
     def get_chunks(
         self,
@@ -396,6 +411,23 @@ class TestHotContextContent:
         # Template renders: "- **SPI1** (3 registers)"
         assert "3 registers" in content
 
+    def test_queries_only_peripheral_tagged_metadata(
+        self,
+        project_dir: Path,
+        full_config: HwccConfig,
+        full_manifest: Manifest,
+        full_store_metadata: list[ChunkMetadata],
+    ):
+        """Untagged chunks are filtered by the store, not fetched and skipped."""
+        compiler, store = _setup_project(
+            project_dir,
+            full_manifest,
+            full_store_metadata,
+            full_config,
+        )
+        compiler.compile(store, full_config)
+        assert store.metadata_queries == [{"peripheral": {"$ne": ""}}]
+
     def test_multi_chip_documents_shown(
         self,
         project_dir: Path,
@@ -607,6 +639,85 @@ class TestHotContextLineBudget:
         line_count = len(content.strip().splitlines())
         assert line_count <= 30
 
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("", 0),
+            ("\n  \n", 0),
+            ("# Title", 1),
+            ("# Title\n", 1),
+            ("\n# Title\n\n- item\n\n", 3),
+            ("a\r\nb\r\n", 2),
+        ],
+    )
+    def test_count_lines(self, content: str, expected: int):
+        assert HotContextCompiler._count_lines(content) == expected
+
+    @pytest.mark.parametrize("conventions", ["", "HAL only"])
+    @pytest.mark.parametrize("count", [0, 1, 12, 40])
+    def test_estimate_never_exceeds_rendered_lines(
+        self, project_dir: Path, count: int, conventions: str
+    ):
+        context = CompileContext(
+            project_name="test",
+            mcu="STM32F407VGT6",
+            register_access=conventions,
+            pin_assignments=tuple((f"SIG{i}", f"PA{i}") for i in range(count % 7)),
+            documents=tuple(
+                DocumentSummary(doc_id=f"doc{i}", title=f"Doc {i}", doc_type="pdf")
+                for i in range(count)
+            ),
+            peripherals=tuple(PeripheralSummary(name=f"PERIPH{i}") for i in range(count)),
+            errata=tuple(ErrataSummary(errata_id=f"ES{i}", title="bug") for i in range(count % 3)),
+        )
+        compiler = HotContextCompiler(project_dir)
+        rendered = compiler._engine.render("hot_context.md.j2", context)
+        assert compiler._estimate_lines(context) <= compiler._count_lines(rendered)
+
+    def test_skips_rendering_steps_that_cannot_fit(self, project_dir: Path):
+        context = CompileContext(
+            project_name="test",
+            documents=tuple(
+                DocumentSummary(doc_id=f"doc{i}", title=f"Doc {i}", doc_type="pdf")
+                for i in range(20)
+            ),
+            peripherals=tuple(PeripheralSummary(name=f"PERIPH{i}") for i in range(50)),
+        )
+        compiler = HotContextCompiler(project_dir)
+        rendered: list[CompileContext] = []
+        render = compiler._engine.render
+
+        def spy(name: str, ctx: CompileContext) -> str:
+            rendered.append(ctx)
+            return render(name, ctx)
+
+        compiler._engine.render = spy  # type: ignore[method-assign]
+        content = compiler._render_within_budget(context, max_lines=20)
+
+        assert compiler._count_lines(content) <= 20
+        assert len(rendered) == 1
+        assert len(rendered[0].peripherals) == 0
+        assert len(rendered[0].documents) == 10
+
+    def test_overridden_template_is_not_truncated_by_estimate(self, project_dir: Path):
+        """A compact user template that fits is rendered in full."""
+        templates_dir = project_dir / ".rag" / "templates"
+        templates_dir.mkdir(parents=True, exist_ok=True)
+        (templates_dir / "hot_context.md.j2").write_text(
+            "# {{ project_name }}\n{% for p in peripherals %}{{ p.name }} {% endfor %}\n",
+            encoding="utf-8",
+        )
+        context = CompileContext(
+            project_name="test",
+            peripherals=tuple(PeripheralSummary(name=f"PERIPH{i}") for i in range(50)),
+        )
+        compiler = HotContextCompiler(project_dir)
+
+        content = compiler._render_within_budget(context, max_lines=5)
+
+        assert "PERIPH49" in content
+        assert compiler._count_lines(content) == 2
+
 
 # ---------------------------------------------------------------------------
 # Manifest timestamp update
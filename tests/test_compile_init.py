@@ -0,0 +1,32 @@
+"""Tests for the hwcc.compile package namespace."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import hwcc.compile
+
+
+class TestLazyExports:
+    @pytest.mark.parametrize("name", hwcc.compile.__all__)
+    def test_public_name_resolves_to_submodule_object(self, name: str):
+        value = getattr(hwcc.compile, name)
+        module = sys.modules[hwcc.compile._LAZY[name]]
+        assert value is getattr(module, name)
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            _ = hwcc.compile.missing  # type: ignore[attr-defined]
+
+    def test_submodule_import_does_not_load_compilers(self):
+        code = (
+            "import sys, hwcc.compile.citations; "
+            "print(sorted({'jinja2', 'hwcc.compile.peripheral'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
@@ -172,6 +172,7 @@ class TestOutputCompilerBasic:
         assert len(paths) == 1
         assert paths[0].name == "CLAUDE.md"
         assert "nonexistent" in caplog.text
+        assert "claude, codex, copilot, cursor, gemini" in caplog.text
 
     def test_wraps_exceptions_in_compile_error(
         self, project_dir: Path, config: HwccConfig, store: FakeStore
@@ -235,6 +236,35 @@ class TestOutputCompilerHotContext:
         assert "NRF52840" in content
         assert _BEGIN in content
 
+    def test_reads_and_flattens_context_once_for_all_targets(
+        self,
+        project_dir: Path,
+        config: HwccConfig,
+        store: FakeStore,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        context_dir = project_dir / ".rag" / "context"
+        context_dir.mkdir(parents=True, exist_ok=True)
+        (context_dir / "hot.md").write_text("# Hardware Summary\n", encoding="utf-8")
+        compiler = OutputCompiler(project_dir)
+        calls = {"read": 0, "flatten": 0}
+        read, flatten = compiler._read_hot_context, compiler._engine.flatten
+
+        def count(name, func):
+            def wrapper(*args):
+                calls[name] += 1
+                return func(*args)
+
+            return wrapper
+
+        monkeypatch.setattr(compiler, "_read_hot_context", count("read", read))
+        monkeypatch.setattr(compiler._engine, "flatten", count("flatten", flatten))
+        paths = compiler.compile(store, config)
+
+        assert len(paths) == 4
+        assert calls == {"read": 1, "flatten": 1}
+        assert all("Hardware Summary" in p.read_text(encoding="utf-8") for p in paths)
+
 
 # ---------------------------------------------------------------------------
 # Tests: Non-destructive injection
@@ -328,6 +358,21 @@ class TestOutputCompilerInjection:
         assert _BEGIN in content
         assert _END in content
 
+    def test_stray_end_before_begin_does_not_hide_section(
+        self, project_dir: Path, store: FakeStore
+    ):
+        existing = f"# My Project\n{_END}\n\n{_BEGIN}\nold hwcc content\n{_END}\n\nNotes\n"
+        claude_md = project_dir / "CLAUDE.md"
+        claude_md.write_text(existing, encoding="utf-8")
+
+        config = HwccConfig(output=OutputConfig(targets=["claude"]))
+        OutputCompiler(project_dir).compile(store, config)
+
+        content = claude_md.read_text(encoding="utf-8")
+        assert "old hwcc content" not in content
+        assert content.count(_BEGIN) == 1
+        assert content.endswith("Notes\n")
+
     def test_handles_malformed_markers_begin_without_end(
         self, project_dir: Path, store: FakeStore
     ):
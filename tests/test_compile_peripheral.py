@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from hwcc.compile.peripheral import PeripheralContextCompiler
+from hwcc.compile.peripheral import PeripheralContextCompiler, _second_path_element
 from hwcc.config import (
     HardwareConfig,
     HwccConfig,
@@ -287,6 +287,42 @@ class TestPeripheralCompilerBasic:
         names = sorted(p.name for p in paths)
         assert names == ["i2c1.md", "spi1.md"]
 
+    def test_unrelated_chunks_are_not_rescanned_per_peripheral(
+        self,
+        project_dir: Path,
+        config: HwccConfig,
+        spi_chunks: list[Chunk],
+        i2c_chunks: list[Chunk],
+        datasheet_chunks: list[Chunk],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Section paths are tokenized once; only matching chunks reach the helpers."""
+        unrelated = [
+            _make_chunk(
+                f"ds_chunk_{i:04d}_gpio",
+                "GPIO port mode register.",
+                doc_type="datasheet",
+                section_path="STM32F407 Datasheet > GPIO > MODER",
+            )
+            for i in range(20)
+        ]
+        checked: list[tuple[str, str]] = []
+        mentions = PeripheralContextCompiler._section_path_mentions_peripheral
+
+        def spy(section_path: str, peripheral_name: str) -> bool:
+            checked.append((section_path, peripheral_name))
+            return mentions(section_path, peripheral_name)
+
+        monkeypatch.setattr(
+            PeripheralContextCompiler, "_section_path_mentions_peripheral", staticmethod(spy)
+        )
+        store = FakeStore(spi_chunks + i2c_chunks + datasheet_chunks + unrelated)
+        PeripheralContextCompiler(project_dir).compile(store, config)
+
+        assert checked
+        assert all("GPIO" not in path for path, _name in checked)
+        assert all(mentions(path, name) for path, name in checked)
+
     def test_multi_chip_same_name_produces_distinct_files(
         self,
         project_dir: Path,
@@ -343,6 +379,60 @@ class TestPeripheralCompilerBasic:
         with pytest.raises(CE, match="connection lost"):
             compiler.compile(store, config)
 
+    def test_compile_writes_every_peripheral_file(
+        self,
+        project_dir: Path,
+        config: HwccConfig,
+    ) -> None:
+        chunks = [
+            _make_chunk(f"svd_chunk_{i:04d}", f"## UART{i}", section_path=f"Dev > UART{i}")
+            for i in range(30)
+        ]
+        compiler = PeripheralContextCompiler(project_dir)
+        paths = compiler.compile(FakeStore(chunks), config)
+
+        assert [p.name for p in paths] == sorted(f"uart{i}.md" for i in range(30))
+        assert all(f"UART{p.stem[4:]}" in p.read_text(encoding="utf-8") for p in paths)
+
+    def test_compile_flattens_shared_context_once(
+        self,
+        project_dir: Path,
+        config: HwccConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        chunks = [
+            _make_chunk(f"svd_chunk_{i:04d}", f"## UART{i}", section_path=f"Dev > UART{i}")
+            for i in range(3)
+        ]
+        compiler = PeripheralContextCompiler(project_dir)
+        flattened: list[object] = []
+        flatten = compiler._engine.flatten
+
+        def spy(context: object) -> dict[str, object]:
+            flattened.append(context)
+            return flatten(context)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(compiler._engine, "flatten", spy)
+        paths = compiler.compile(FakeStore(chunks), config)
+
+        assert len(paths) == 3
+        assert len(flattened) == 1
+        assert "# UART1" in paths[1].read_text(encoding="utf-8")
+
+    def test_compile_wraps_write_error(
+        self,
+        project_dir: Path,
+        config: HwccConfig,
+        spi_chunks: list[Chunk],
+    ) -> None:
+        from hwcc.exceptions import CompileError as CE
+
+        # A directory in the way makes the file write fail
+        (project_dir / ".rag" / "context" / "peripherals" / "spi1.md").mkdir(parents=True)
+        compiler = PeripheralContextCompiler(project_dir)
+        with pytest.raises(CE, match=r"spi1\.md"):
+            compiler.compile(FakeStore(spi_chunks), config)
+
 
 # ---------------------------------------------------------------------------
 # Tests: Empty / no-data edge cases
@@ -478,6 +568,68 @@ class TestPeripheralDiscovery:
         names = [p[0] for p in peripherals]
         assert names == ["ADC1", "I2C1", "USART1"]
 
+    @pytest.mark.parametrize(
+        "section_path",
+        ["", "Dev", "Dev > SPI1", "Dev >  SPI1  > CR1 > Bits", "Dev > ", "Dev>SPI1 > CR1"],
+    )
+    def test_second_path_element_matches_split(self, section_path: str) -> None:
+        parts = section_path.split(" > ")
+        expected = parts[1].strip() if len(parts) >= 2 else None
+        assert _second_path_element(section_path) == expected
+
+    def test_groups_chunks_by_peripheral_in_store_order(self, project_dir: Path) -> None:
+        chunks = [
+            _make_chunk("c0", "## SPI1 a", section_path="Dev > SPI1"),
+            _make_chunk("c1", "## I2C1", section_path="Dev > I2C1 > CR1"),
+            _make_chunk("c2", "## SPI1 b", section_path="Dev > SPI1 > CR1"),
+            _make_chunk("c3", "# Dev", section_path="Dev"),
+        ]
+        compiler = PeripheralContextCompiler(project_dir)
+        groups = compiler._group_by_peripheral(chunks)
+
+        assert {name: [c.chunk_id for c in group] for name, group in groups.items()} == {
+            "SPI1": ["c0", "c2"],
+            "I2C1": ["c1"],
+        }
+
+    def test_index_by_chip_splits_groups_in_order(self, project_dir: Path) -> None:
+        a0 = _make_chunk("a0", "x", chip="STM32F407")
+        b0 = _make_chunk("b0", "x", chip="nRF52840")
+        a1 = _make_chunk("a1", "x", chip="STM32F407")
+        compiler = PeripheralContextCompiler(project_dir)
+        index = compiler._index_by_chip({"spi1": [a0, b0, a1], "i2c1": []})
+
+        assert index == {("spi1", "STM32F407"): [a0, a1], ("spi1", "nRF52840"): [b0]}
+
+    def test_section_part_index_matches_mention_check(self, project_dir: Path) -> None:
+        chunks = [
+            _make_chunk("c0", "a", doc_type="datasheet", section_path="DS > SPI1 > SPI1"),
+            _make_chunk("c1", "b", doc_type="datasheet", section_path="DS > spi10"),
+            _make_chunk("c2", "c", doc_type="datasheet", section_path="DS > Overview >  Spi1 "),
+        ]
+        compiler = PeripheralContextCompiler(project_dir)
+        index = compiler._index_by_section_part(chunks)
+
+        for name in ("SPI1", "SPI10", "DS", "Overview", "UART"):
+            expected = [
+                c.chunk_id
+                for c in chunks
+                if compiler._section_path_mentions_peripheral(c.metadata.section_path, name)
+            ]
+            assert [c.chunk_id for c in index.get(name.lower(), [])] == expected
+
+    def test_section_part_index_keeps_only_requested_parts(self, project_dir: Path) -> None:
+        chunks = [
+            _make_chunk("c0", "a", doc_type="datasheet", section_path="DS > SPI1 > Setup"),
+            _make_chunk("c1", "b", doc_type="datasheet", section_path="DS > GPIO"),
+        ]
+        compiler = PeripheralContextCompiler(project_dir)
+        index = compiler._index_by_section_part(iter(chunks), keep={"spi1", "i2c1"})
+
+        assert {part: [c.chunk_id for c in group] for part, group in index.items()} == {
+            "spi1": ["c0"]
+        }
+
 
 # ---------------------------------------------------------------------------
 # Tests: Register map extraction
@@ -557,6 +709,21 @@ class TestRegisterMapExtraction:
 
         assert register_map == ""
 
+    @pytest.mark.parametrize(
+        ("register_map", "expected"),
+        [
+            ("## SPI1\n\n**Description:** Serial peripheral\n| a |", "Serial peripheral"),
+            ("  **Description:**  Indented  \r\n", "Indented"),
+            ("text **Description:** not at line start", ""),
+            ("\n" * 19 + "**Description:** last searched line", "last searched line"),
+            ("\n" * 20 + "**Description:** too far down", ""),
+            ("", ""),
+        ],
+    )
+    def test_extract_description(self, register_map: str, expected: str) -> None:
+        """Only a line starting with the marker within the first 20 lines counts."""
+        assert PeripheralContextCompiler._extract_description(register_map) == expected
+
 
 # ---------------------------------------------------------------------------
 # Tests: Cross-document details
@@ -800,6 +967,30 @@ class TestPinAssignments:
         result = compiler._filter_pins_for_peripheral("SPI1", pins)
         assert result == []
 
+    def test_filter_pins_underscored_peripheral_name(self, project_dir: Path) -> None:
+        compiler = PeripheralContextCompiler(project_dir)
+        pins = {"usb_otg_fs_dm": "PA11", "usb_otg_fs_dp": "PA12", "usb_vbus": "PA9"}
+        assert compiler._filter_pins_for_peripheral("USB_OTG_FS", pins) == [
+            ("DM", "PA11"),
+            ("DP", "PA12"),
+        ]
+        assert compiler._filter_pins_for_peripheral("USB", pins) == [
+            ("OTG_FS_DM", "PA11"),
+            ("OTG_FS_DP", "PA12"),
+            ("VBUS", "PA9"),
+        ]
+
+    def test_index_pins_matches_per_peripheral_filter(self) -> None:
+        pins = {"SPI1_SCK": "PA5", "spi1_mosi": "PA7", "spi1_": "PA0", "led": "PC13"}
+        index = PeripheralContextCompiler._index_pins(pins)
+        for name in ("SPI1", "spi1", "SPI", "LED", "I2C1", ""):
+            expected = [
+                (key[len(name) + 1 :].upper(), pin)
+                for key, pin in sorted(pins.items())
+                if key.lower().startswith(name.lower() + "_")
+            ]
+            assert index.get(name.lower(), []) == expected
+
     def test_pins_in_rendered_output(
         self,
         project_dir: Path,
@@ -914,6 +1105,16 @@ class TestCitationsInOutput:
         content = paths[0].read_text(encoding="utf-8")
         assert "*Source: stm32f407," in content
 
+    def test_first_chunk_per_doc_orders_by_doc_id(self) -> None:
+        """One chunk per doc_id, the first seen, in doc_id order."""
+
+        def chunk(chunk_id: str, doc_id: str) -> Chunk:
+            return Chunk(chunk_id, "x", 1, ChunkMetadata(doc_id=doc_id))
+
+        chunks = [chunk("c1", "b"), chunk("c2", "a"), chunk("c3", "b"), chunk("c4", "a")]
+        firsts = PeripheralContextCompiler._first_chunk_per_doc(chunks)
+        assert [c.chunk_id for c in firsts] == ["c2", "c1"]
+
     def test_no_manifest_no_crash(
         self,
         project_dir: Path,
@@ -183,6 +183,23 @@ class TestScoreChunkRelevance:
         """Empty keyword set returns 0.0."""
         assert score_chunk_relevance("some content", set()) == 0.0
 
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "SPI1 CR1 baud rate",
+            "the spi1x register",
+            "baudrate SPI1_CR1",
+            "SPIs use CR1 and cr2",
+            "nothing relevant here",
+            "Kelvin \u212a and \u0130 letters",
+        ],
+    )
+    def test_substring_precheck_matches_token_overlap(self, content: str) -> None:
+        """The fast path gives the same score as a full token overlap."""
+        keywords = {"spi1", "cr1", "baud", "k"}
+        expected = len(keywords & _tokenize(content)) / len(keywords)
+        assert score_chunk_relevance(content, keywords) == expected
+
     def test_empty_content_returns_zero(self) -> None:
         """Empty content returns 0.0."""
         assert score_chunk_relevance("", {"spi1"}) == 0.0
@@ -242,6 +259,72 @@ class TestRankChunks:
         assert result[0].chunk_id == "chunk_001"
         assert result[1].chunk_id == "chunk_002"
 
+    def test_duplicate_chunk_ids_keep_input_order(self) -> None:
+        """Chunks tied on score and chunk_id keep their input order."""
+        first = _make_chunk("chunk_001", "SPI1 configuration")
+        second = _make_chunk("chunk_001", "configuration SPI1")
+        keywords = {"spi1", "configuration"}
+
+        result = rank_chunks([first, second], keywords, max_chunks=5)
+        assert result[0] is first
+        assert result[1] is second
+
+    def test_token_cache_is_filled_and_reused(self) -> None:
+        """Cached token sets are used instead of re-tokenizing content."""
+        a = _make_chunk("chunk_001", "SPI1 configuration")
+        b = _make_chunk("chunk_002", "USART2 baud rate")
+        cache: dict[str, set[str]] = {}
+
+        result = rank_chunks([a, b], {"spi1", "baud"}, max_chunks=5, token_cache=cache)
+        assert [c.chunk_id for c in result] == ["chunk_001", "chunk_002"]
+        assert cache == {
+            "chunk_001": _tokenize(a.content),
+            "chunk_002": _tokenize(b.content),
+        }
+
+        cache["chunk_002"] = {"spi1"}
+        result = rank_chunks([a, b], {"spi1"}, max_chunks=5, token_cache=cache)
+        assert [c.chunk_id for c in result] == ["chunk_001", "chunk_002"]
+
+    def test_token_cache_matches_uncached_ranking(self) -> None:
+        """Ranking with a cache gives the same result as without one."""
+        chunks = [
+            _make_chunk("chunk_003", "SPI1 CR1 baud rate control"),
+            _make_chunk("chunk_001", "SPI1 status register"),
+            _make_chunk("chunk_002", "unrelated GPIO text"),
+        ]
+        keywords = {"spi1", "cr1", "baud", "status"}
+
+        cache: dict[str, set[str]] = {}
+        expected = rank_chunks(chunks, keywords, max_chunks=5)
+        assert rank_chunks(chunks, keywords, max_chunks=5, token_cache=cache) == expected
+        assert rank_chunks(chunks, keywords, max_chunks=5, token_cache=cache) == expected
+
+    def test_chunks_without_keyword_substring_are_not_tokenized(self) -> None:
+        """The substring pre-check rejects a chunk before tokenizing it."""
+        a = _make_chunk("chunk_001", "SPI1 configuration")
+        b = _make_chunk("chunk_002", "USART2 baud rate")
+        cache: dict[str, set[str]] = {}
+
+        result = rank_chunks([a, b], {"spi1"}, max_chunks=5, min_score=0.0, token_cache=cache)
+        assert [c.chunk_id for c in result] == ["chunk_001", "chunk_002"]
+        assert set(cache) == {"chunk_001"}
+
+    def test_top_chunks_match_full_sort(self) -> None:
+        """Selecting the top max_chunks equals sorting everything and slicing."""
+        chunks = [
+            _make_chunk(f"chunk_{i:03d}", " ".join(["spi1", "cr1", "baud"][: i % 4]) or "none")
+            for i in range(40)
+        ]
+        keywords = {"spi1", "cr1", "baud"}
+
+        ranked = rank_chunks(chunks, keywords, max_chunks=len(chunks), min_score=0.0)
+        assert rank_chunks(chunks, keywords, max_chunks=5, min_score=0.0) == ranked[:5]
+        assert (
+            rank_chunks(chunks, set(), max_chunks=3)
+            == sorted(chunks, key=lambda c: c.chunk_id)[:3]
+        )
+
     def test_empty_chunks_returns_empty(self) -> None:
         """Empty input returns empty list."""
         assert rank_chunks([], {"spi1"}) == []
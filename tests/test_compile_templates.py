@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import dataclasses
+import os
+from datetime import UTC, datetime, timedelta
 from pathlib import PurePosixPath
 
 import pytest
@@ -161,6 +164,18 @@ class TestTemplateEngineInit:
         templates = engine.list_templates()
         assert "custom.md.j2" in templates
 
+    def test_engines_share_compiled_templates(self, engine, minimal_context):
+        other = TemplateEngine()
+        engine.render("hot_context.md.j2", minimal_context)
+        assert other._env is engine._env
+        assert other._env.get_template("hot_context.md.j2") is engine._env.get_template(
+            "hot_context.md.j2"
+        )
+
+    def test_override_dir_gets_own_environment(self, tmp_path, engine):
+        (tmp_path / ".rag" / "templates").mkdir(parents=True)
+        assert TemplateEngine(project_root=tmp_path)._env is not engine._env
+
 
 # ---------------------------------------------------------------------------
 # Template rendering — hot_context.md.j2
@@ -168,6 +183,12 @@ class TestTemplateEngineInit:
 
 
 class TestHotContextTemplate:
+    def test_renders_flattened_variables(self, engine, full_context):
+        variables = engine.flatten(full_context)
+        assert engine.render("hot_context.md.j2", variables) == engine.render(
+            "hot_context.md.j2", full_context
+        )
+
     def test_renders_full_context(self, engine, full_context):
         result = engine.render("hot_context.md.j2", full_context)
         assert "motor-controller" in result
@@ -335,6 +356,20 @@ class TestTemplateOverrides:
         result = engine.render_target("claude", full_context)
         assert result == "CUSTOM: motor-controller v0.1.0"
 
+    def test_edited_override_is_reloaded(self, tmp_path, full_context):
+        override = tmp_path / ".rag" / "templates" / "claude.md.j2"
+        override.parent.mkdir(parents=True)
+        override.write_text("FIRST: {{ project_name }}")
+        engine = TemplateEngine(project_root=tmp_path)
+        assert engine.render_target("claude", full_context) == "FIRST: motor-controller"
+
+        override.write_text("SECOND: {{ project_name }}")
+        mtime = override.stat().st_mtime + 10
+        os.utime(override, (mtime, mtime))
+        assert engine.render_target("claude", full_context) == "SECOND: motor-controller"
+        again = TemplateEngine(project_root=tmp_path)
+        assert again.render_target("claude", full_context) == "SECOND: motor-controller"
+
     def test_is_overridden_true(self, tmp_path):
         override_dir = tmp_path / ".rag" / "templates"
         override_dir.mkdir(parents=True)
@@ -385,6 +420,8 @@ class TestCompileContext:
         assert ctx.register_access == "HAL only"
         assert ctx.hwcc_version == "0.3.0"
         assert ctx.generated_at  # Should have a timestamp
+        parsed = datetime.strptime(ctx.generated_at, "%Y-%m-%d %H:%M UTC").replace(tzinfo=UTC)
+        assert abs(datetime.now(UTC) - parsed) < timedelta(minutes=2)
 
     def test_from_config_bsp_fields(self):
         config = HwccConfig(
@@ -431,6 +468,18 @@ class TestCompileContext:
         with pytest.raises(AttributeError):
             ctx.mcu = "should fail"  # type: ignore[misc]
 
+    def test_with_overrides_matches_replace(self):
+        ctx = CompileContext(mcu="STM32F407", naming="snake_case", documents=())
+        derived = ctx.with_overrides(naming="", mcu_family="STM32F4")
+        assert derived == dataclasses.replace(ctx, naming="", mcu_family="STM32F4")
+        assert ctx.naming == "snake_case"
+        with pytest.raises(AttributeError):
+            derived.mcu = "should fail"  # type: ignore[misc]
+
+    def test_with_overrides_rejects_unknown_field(self):
+        with pytest.raises(TypeError, match="no_such_field"):
+            CompileContext().with_overrides(no_such_field="x")
+
     def test_document_summary_frozen(self):
         doc = DocumentSummary(doc_id="test", title="Test", doc_type="datasheet")
         with pytest.raises(AttributeError):
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from hwcc import config as config_module
 from hwcc.config import (
     HwccConfig,
+    clear_config_cache,
     default_config,
     load_config,
     save_config,
@@ -99,6 +103,17 @@ class TestConfigRoundTrip:
         assert loaded.software.language == ""
         assert loaded.hardware.mcu == "STM32F407"
 
+    def test_unknown_keys_and_sections_are_ignored(self, tmp_path: Path):
+        path = tmp_path / "config.toml"
+        path.write_text(
+            '[chunk]\nmax_tokens = 256\nlegacy_key = 1\n\n[future]\nfoo = "bar"\n',
+            encoding="utf-8",
+        )
+        loaded = load_config(path)
+        assert loaded.chunk.max_tokens == 256
+        assert not hasattr(loaded.chunk, "legacy_key")
+        assert not hasattr(loaded, "future")
+
     def test_save_and_load_custom_targets(self, tmp_path: Path):
         path = tmp_path / "config.toml"
         config = HwccConfig()
@@ -120,6 +135,7 @@ class TestConfigRoundTrip:
         config.embedding.provider = "openai"
         config.embedding.base_url = "http://localhost:8080/v1"
         config.embedding.batch_size = 32
+        config.embedding.max_concurrency = 8
         config.embedding.api_key_env = "OPENAI_API_KEY"
         save_config(config, path)
         loaded = load_config(path)
@@ -127,6 +143,7 @@ class TestConfigRoundTrip:
         assert loaded.embedding.provider == "openai"
         assert loaded.embedding.base_url == "http://localhost:8080/v1"
         assert loaded.embedding.batch_size == 32
+        assert loaded.embedding.max_concurrency == 8
         assert loaded.embedding.api_key_env == "OPENAI_API_KEY"
 
     def test_default_embedding_config_new_fields(self):
@@ -134,6 +151,9 @@ class TestConfigRoundTrip:
         config = default_config()
         assert config.embedding.base_url == ""
         assert config.embedding.batch_size == 64
+        assert config.embedding.max_concurrency == 4
+        assert config.embedding.cache_dir == "embed-cache"
+        assert config.embedding.compress_requests is False
 
     def test_store_config_roundtrip(self, tmp_path: Path):
         """StoreConfig fields survive save/load round-trip."""
@@ -213,3 +233,81 @@ class TestConfigErrors:
         path.write_text("this is [not valid toml", encoding="utf-8")
         with pytest.raises(ConfigError):
             load_config(path)
+
+
+class TestTomlParser:
+    def test_uses_rtoml_when_installed(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        fast = MagicMock()
+        fast.loads.return_value = {"project": {"name": "fast"}}
+        monkeypatch.setattr(config_module, "rtoml", fast)
+        path = tmp_path / "config.toml"
+        path.write_text('[project]\nname = "slow"\n', encoding="utf-8")
+        assert load_config(path).project.name == "fast"
+        fast.loads.assert_called_once_with('[project]\nname = "slow"\n')
+
+    def test_falls_back_to_tomllib(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config_module, "rtoml", None)
+        assert config_module._parse_toml('a = 1\n[b]\nc = "d"\n') == {"a": 1, "b": {"c": "d"}}
+
+
+def _count_toml_parses():
+    return patch.object(config_module, "_parse_toml", wraps=config_module._parse_toml)
+
+
+class TestConfigCache:
+    def test_repeated_load_parses_once(self, tmp_path: Path):
+        path = tmp_path / "config.toml"
+        path.write_text('[project]\nname = "cached"\n', encoding="utf-8")
+        with _count_toml_parses() as loads:
+            first = load_config(path)
+            second = load_config(path)
+        assert loads.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_cached_result_is_a_copy(self, tmp_path: Path):
+        path = tmp_path / "config.toml"
+        save_config(default_config(), path)
+        first = load_config(path)
+        first.project.name = "mutated"
+        first.output.targets.append("extra")
+        second = load_config(path)
+        assert second.project.name == ""
+        assert "extra" not in second.output.targets
+
+    def test_changed_mtime_reparses(self, tmp_path: Path):
+        path = tmp_path / "config.toml"
+        path.write_text('[project]\nname = "aaaa"\n', encoding="utf-8")
+        assert load_config(path).project.name == "aaaa"
+        st = path.stat()
+        path.write_text('[project]\nname = "bbbb"\n', encoding="utf-8")
+        # Same size; force a distinct mtime so the test doesn't depend on clock resolution
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_config(path).project.name == "bbbb"
+
+    def test_save_config_invalidates_cache(self, tmp_path: Path):
+        path = tmp_path / "config.toml"
+        config = default_config()
+        config.project.name = "aaaa"
+        save_config(config, path)
+        assert load_config(path).project.name == "aaaa"
+        config.project.name = "bbbb"
+        save_config(config, path)
+        assert load_config(path).project.name == "bbbb"
+
+    def test_clear_config_cache(self, tmp_path: Path):
+        path = tmp_path / "config.toml"
+        save_config(default_config(), path)
+        load_config(path)
+        clear_config_cache()
+        with _count_toml_parses() as loads:
+            load_config(path)
+        assert loads.call_count == 1
+
+    def test_missing_file_still_raises(self, tmp_path: Path):
+        path = tmp_path / "config.toml"
+        save_config(default_config(), path)
+        load_config(path)
+        path.unlink()
+        with pytest.raises(ConfigError, match="not found"):
+            load_config(path)
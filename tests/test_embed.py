@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
 import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
 
+import numpy as np
 import pytest
 
 from hwcc.config import HwccConfig
 from hwcc.embed.base import BaseEmbedder
+from hwcc.embed.cache import CACHE_FILE, CachedEmbedder
 from hwcc.embed.chromadb_embed import ChromaDBEmbedder
 from hwcc.embed.ollama import OllamaEmbedder
 from hwcc.embed.openai_compat import OpenAICompatEmbedder
+from hwcc.embed.transport import _pool, dumps_json, loads_json, urlopen
 from hwcc.exceptions import EmbeddingError
 from hwcc.types import Chunk, ChunkMetadata, EmbeddedChunk
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
 # --- Helpers ---
 
 _FAKE_VECTOR = [0.1, 0.2, 0.3, 0.4, 0.5]
@@ -147,6 +161,22 @@ class TestChromaDBEmbedChunks:
         for i, ec in enumerate(result):
             assert ec.chunk is chunks[i]
 
+    def test_float32_arrays_become_python_float_tuples(self):
+        vectors = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], dtype=np.float32)
+        mock_ef = MagicMock(return_value=list(vectors))
+        with patch(
+            "hwcc.embed.chromadb_embed.DefaultEmbeddingFunction",
+            return_value=mock_ef,
+        ):
+            embedder = ChromaDBEmbedder(HwccConfig())
+
+        result = embedder.embed_chunks(_make_chunks(2))
+
+        for ec, row in zip(result, vectors, strict=True):
+            assert isinstance(ec.embedding, tuple)
+            assert all(type(v) is float for v in ec.embedding)
+            assert ec.embedding == tuple(float(v) for v in row)
+
     def test_empty_chunks_returns_empty(self):
         embedder = self._make_embedder()
         result = embedder.embed_chunks([])
@@ -293,6 +323,7 @@ class TestOllamaEmbedChunks:
     def test_respects_batch_size(self):
         config = HwccConfig()
         config.embedding.batch_size = 2
+        config.embedding.max_concurrency = 1  # record calls in order
         embedder = OllamaEmbedder(config)
         chunks = _make_chunks(5)
 
@@ -458,9 +489,45 @@ class TestOpenAICompatEmbedChunks:
 
         assert len(result) == 1
 
+    def test_sends_plain_json_by_default(self):
+        config = HwccConfig()
+        config.embedding.api_key_env = ""
+        embedder = OpenAICompatEmbedder(config)
+        seen: list[Request] = []
+
+        def mock_urlopen(req, **kwargs):
+            seen.append(req)
+            return _FakeResponse(_openai_response([_FAKE_VECTOR]))
+
+        with patch("hwcc.embed.openai_compat.urlopen", side_effect=mock_urlopen):
+            embedder.embed_chunks([_make_chunk()])
+
+        assert seen[0].get_header("Content-encoding") is None
+        assert seen[0].get_header("Accept-encoding") == "gzip"
+        assert json.loads(seen[0].data)["input"] == ["test content"]
+
+    def test_compress_requests_gzips_body(self):
+        config = HwccConfig()
+        config.embedding.api_key_env = ""
+        config.embedding.compress_requests = True
+        embedder = OpenAICompatEmbedder(config)
+        seen: list[Request] = []
+
+        def mock_urlopen(req, **kwargs):
+            seen.append(req)
+            return _FakeResponse(_openai_response([_FAKE_VECTOR]))
+
+        with patch("hwcc.embed.openai_compat.urlopen", side_effect=mock_urlopen):
+            result = embedder.embed_chunks([_make_chunk()])
+
+        assert seen[0].get_header("Content-encoding") == "gzip"
+        assert json.loads(gzip.decompress(seen[0].data))["input"] == ["test content"]
+        assert result[0].embedding == tuple(_FAKE_VECTOR)
+
     def test_respects_batch_size(self):
         config = HwccConfig()
         config.embedding.batch_size = 3
+        config.embedding.max_concurrency = 1  # record calls in order
         config.embedding.api_key_env = ""
         config.embedding.base_url = "http://localhost:8080/v1"
         embedder = OpenAICompatEmbedder(config)
@@ -539,6 +606,27 @@ class TestOpenAICompatDimension:
 # --- EmbeddedChunk Contract Tests ---
 
 
+class TestAsyncEmbedChunks:
+    def test_runs_embed_chunks_off_the_event_loop(self):
+        config = HwccConfig()
+        config.embedding.api_key_env = ""
+        embedder = OllamaEmbedder(config)
+        chunks = _make_chunks(2)
+        threads: list[threading.Thread] = []
+
+        def mock_urlopen(req, **kwargs):
+            threads.append(threading.current_thread())
+            return _FakeResponse(_ollama_response([[1.0], [2.0]]))
+
+        with patch("hwcc.embed.ollama.urlopen", side_effect=mock_urlopen):
+            result = asyncio.run(embedder.aembed_chunks(chunks))
+
+        assert [ec.chunk for ec in result] == chunks
+        assert [ec.embedding for ec in result] == [(1.0,), (2.0,)]
+        assert threads
+        assert threads[0] is not threading.main_thread()
+
+
 class TestEmbeddedChunkContract:
     def test_embedding_is_tuple(self):
         """EmbeddedChunk.embedding must be a tuple of floats (frozen dataclass)."""
@@ -586,6 +674,35 @@ class TestOllamaErrorHandling:
             embedder.embed_chunks(chunks)
 
 
+class TestOpenAICompatResponseOrder:
+    def test_items_returned_out_of_order_are_placed_by_index(self):
+        config = HwccConfig()
+        config.embedding.api_key_env = ""
+        embedder = OpenAICompatEmbedder(config)
+        items = [{"index": i, "embedding": [float(i)]} for i in (2, 0, 1)]
+        response = _FakeResponse(json.dumps({"data": items}).encode())
+
+        with patch("hwcc.embed.openai_compat.urlopen", return_value=response):
+            result = embedder.embed_chunks(_make_chunks(3))
+
+        assert [ec.embedding for ec in result] == [(0.0,), (1.0,), (2.0,)]
+
+    @pytest.mark.parametrize(
+        ("indices", "expected"),
+        [
+            ([1, 2, 0], [0, 1, 2]),
+            ([0, 1, 2], [0, 1, 2]),
+            ([5, 3, 4], [3, 4, 5]),  # not 0..n-1: sorted
+            ([1, 1, 0], [0, 1, 1]),  # duplicate: sorted
+            ([1, None, 0], [1, None, 0]),  # missing: response order
+        ],
+    )
+    def test_order_by_index(self, indices, expected):
+        items = [{"embedding": [], **({"index": i} if i is not None else {})} for i in indices]
+        ordered = OpenAICompatEmbedder._order_by_index(items)
+        assert [item.get("index") for item in ordered] == expected
+
+
 class TestOpenAICompatErrorHandling:
     def test_raises_on_invalid_json_response(self):
         config = HwccConfig()
@@ -655,6 +772,7 @@ class TestBatchSizeValidation:
     def test_batch_size_one_works(self):
         config = HwccConfig()
         config.embedding.batch_size = 1
+        config.embedding.max_concurrency = 1  # record calls in order
         embedder = OllamaEmbedder(config)
         chunks = _make_chunks(3)
 
@@ -673,6 +791,300 @@ class TestBatchSizeValidation:
         assert len(result) == 3
         assert call_count == 3  # one chunk per call
 
+    def test_ollama_rejects_zero_max_concurrency(self):
+        config = HwccConfig()
+        config.embedding.max_concurrency = 0
+        with pytest.raises(EmbeddingError, match="max_concurrency"):
+            OllamaEmbedder(config)
+
+    def test_openai_rejects_zero_max_concurrency(self):
+        config = HwccConfig()
+        config.embedding.max_concurrency = 0
+        config.embedding.api_key_env = ""
+        with pytest.raises(EmbeddingError, match="max_concurrency"):
+            OpenAICompatEmbedder(config)
+
+
+class TestConcurrentBatches:
+    @pytest.mark.parametrize(
+        ("embedder_cls", "target", "make_response"),
+        [
+            (OllamaEmbedder, "hwcc.embed.ollama.urlopen", _ollama_response),
+            (OpenAICompatEmbedder, "hwcc.embed.openai_compat.urlopen", _openai_response),
+        ],
+    )
+    def test_batches_overlap_and_keep_input_order(self, embedder_cls, target, make_response):
+        config = HwccConfig()
+        config.embedding.api_key_env = ""
+        config.embedding.batch_size = 2
+        config.embedding.max_concurrency = 3
+        embedder = embedder_cls(config)
+        chunks = _make_chunks(6)
+        # Every batch waits for the other two, so this only passes if all
+        # three requests are in flight together
+        barrier = threading.Barrier(3, timeout=5)
+
+        def mock_urlopen(req, **kwargs):
+            texts = json.loads(req.data)["input"]
+            barrier.wait()
+            vectors = [[float(text.split()[-1])] for text in texts]
+            return _FakeResponse(make_response(vectors))
+
+        with patch(target, side_effect=mock_urlopen):
+            result = embedder.embed_chunks(chunks)
+
+        assert [ec.chunk for ec in result] == chunks
+        assert [ec.embedding for ec in result] == [(float(i),) for i in range(6)]
+
+
+def _chunks_with_contents(contents: list[str]) -> list[Chunk]:
+    return [
+        Chunk(chunk_id=f"doc_c{i}", content=c, token_count=5, metadata=ChunkMetadata(doc_id="doc"))
+        for i, c in enumerate(contents)
+    ]
+
+
+class TestDuplicateTexts:
+    @pytest.mark.parametrize(
+        ("embedder_cls", "target", "make_response"),
+        [
+            (OllamaEmbedder, "hwcc.embed.ollama.urlopen", _ollama_response),
+            (OpenAICompatEmbedder, "hwcc.embed.openai_compat.urlopen", _openai_response),
+        ],
+    )
+    def test_identical_texts_are_embedded_once(self, embedder_cls, target, make_response):
+        config = HwccConfig()
+        config.embedding.api_key_env = ""
+        config.embedding.batch_size = 2
+        config.embedding.max_concurrency = 1
+        embedder = embedder_cls(config)
+        chunks = _chunks_with_contents(["a 1", "b 2", "a 1", "c 3", "b 2", "a 1"])
+        sent: list[str] = []
+
+        def mock_urlopen(req, **kwargs):
+            texts = json.loads(req.data)["input"]
+            sent.extend(texts)
+            return _FakeResponse(make_response([[float(t.split()[-1])] for t in texts]))
+
+        with patch(target, side_effect=mock_urlopen):
+            result = embedder.embed_chunks(chunks)
+
+        assert sent == ["a 1", "b 2", "c 3"]
+        assert [ec.chunk for ec in result] == chunks
+        assert [ec.embedding for ec in result] == [(1.0,), (2.0,), (1.0,), (3.0,), (2.0,), (1.0,)]
+        assert result[0].embedding is result[2].embedding
+
+    def test_chromadb_embeds_identical_texts_once(self):
+        mock_ef = MagicMock(side_effect=_mock_ef)
+        with patch(
+            "hwcc.embed.chromadb_embed.DefaultEmbeddingFunction",
+            return_value=mock_ef,
+        ):
+            embedder = ChromaDBEmbedder(HwccConfig())
+        chunks = _chunks_with_contents(["same", "other", "same"])
+
+        result = embedder.embed_chunks(chunks)
+
+        mock_ef.assert_called_once_with(["same", "other"])
+        assert [ec.chunk for ec in result] == chunks
+        assert result[0].embedding is result[2].embedding
+
+
+# --- Embedding Cache Tests ---
+
+
+def _recording_embedder() -> MagicMock:
+    """Mock embedder whose vector for "x N" is (N, 0.1); records what it is sent."""
+    inner = MagicMock(spec=BaseEmbedder)
+    inner.embed_chunks.side_effect = lambda chunks: [
+        EmbeddedChunk(chunk=c, embedding=(float(c.content.split()[-1]), 0.1)) for c in chunks
+    ]
+    return inner
+
+
+def _sent_texts(inner: MagicMock) -> list[list[str]]:
+    return [[c.content for c in call.args[0]] for call in inner.embed_chunks.call_args_list]
+
+
+class TestCachedEmbedder:
+    def test_second_run_reuses_vectors(self, tmp_path: Path):
+        chunks = _chunks_with_contents(["x 1", "x 2"])
+        first_inner = _recording_embedder()
+        first = CachedEmbedder(first_inner, tmp_path, "ollama/test")
+        first_result = first.embed_chunks(chunks)
+        first.close()
+
+        second_inner = _recording_embedder()
+        second = CachedEmbedder(second_inner, tmp_path, "ollama/test")
+        second_result = second.embed_chunks(chunks)
+        second.close()
+
+        assert (tmp_path / CACHE_FILE).exists()
+        second_inner.embed_chunks.assert_not_called()
+        assert [ec.embedding for ec in second_result] == [ec.embedding for ec in first_result]
+        assert [ec.chunk for ec in second_result] == chunks
+
+    def test_only_uncached_texts_are_sent(self, tmp_path: Path):
+        inner = _recording_embedder()
+        embedder = CachedEmbedder(inner, tmp_path, "ollama/test")
+        embedder.embed_chunks(_chunks_with_contents(["x 1", "x 2"]))
+
+        result = embedder.embed_chunks(_chunks_with_contents(["x 2", "x 3", "x 3", "x 1"]))
+
+        assert _sent_texts(inner) == [["x 1", "x 2"], ["x 3"]]
+        assert [ec.embedding for ec in result] == [(2.0, 0.1), (3.0, 0.1), (3.0, 0.1), (1.0, 0.1)]
+
+    def test_entries_are_scoped_to_model(self, tmp_path: Path):
+        chunks = _chunks_with_contents(["x 1"])
+        CachedEmbedder(_recording_embedder(), tmp_path, "ollama/a").embed_chunks(chunks)
+
+        inner = _recording_embedder()
+        CachedEmbedder(inner, tmp_path, "ollama/b").embed_chunks(chunks)
+
+        assert _sent_texts(inner) == [["x 1"]]
+
+    def test_unusable_cache_dir_falls_back_to_wrapped_embedder(self, tmp_path: Path):
+        not_a_dir = tmp_path / "file"
+        not_a_dir.write_text("", encoding="utf-8")
+        inner = _recording_embedder()
+        embedder = CachedEmbedder(inner, not_a_dir, "ollama/test")
+
+        result = embedder.embed_chunks(_chunks_with_contents(["x 1", "x 1"]))
+
+        assert [ec.embedding for ec in result] == [(1.0, 0.1), (1.0, 0.1)]
+        assert _sent_texts(inner) == [["x 1", "x 1"]]
+
+    def test_query_and_dimension_pass_through(self, tmp_path: Path):
+        inner = _recording_embedder()
+        inner.embed_query.return_value = [0.5]
+        inner.dimension = 2
+        embedder = CachedEmbedder(inner, tmp_path, "ollama/test")
+
+        assert embedder.embed_query("q") == [0.5]
+        assert embedder.dimension == 2
+        inner.embed_query.assert_called_once_with("q")
+
+
+# --- Keep-alive Transport Tests ---
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Echo the request body; ``/fail`` answers 500, ``/close`` drops the socket.
+
+    ``/gzip`` echoes gzip-encoded; ``/badgzip`` claims gzip but sends plain bytes.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.ports.append(self.client_address[1])  # type: ignore[attr-defined]
+        self.send_response(500 if self.path == "/fail" else 200)
+        if self.path == "/gzip":
+            body = gzip.compress(body)
+        if self.path in ("/gzip", "/badgzip"):
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Close without "Connection: close", like a server whose idle timeout expired
+        self.close_connection = self.path == "/close"
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def echo_server() -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    server.ports = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        _pool.clear()
+        server.shutdown()
+        server.server_close()
+
+
+def _post(server: ThreadingHTTPServer, path: str, data: bytes) -> bytes:
+    url = f"http://127.0.0.1:{server.server_port}{path}"
+    with urlopen(Request(url, data=data), timeout=5) as resp:
+        return resp.read()
+
+
+class TestKeepAliveTransport:
+    def test_reuses_connection_across_requests(self, echo_server: ThreadingHTTPServer):
+        assert _post(echo_server, "/", b"one") == b"one"
+        assert _post(echo_server, "/", b"two") == b"two"
+        ports = echo_server.ports  # type: ignore[attr-defined]
+        assert len(ports) == 2
+        assert ports[0] == ports[1]
+
+    def test_reconnects_when_server_closed_idle_connection(self, echo_server: ThreadingHTTPServer):
+        assert _post(echo_server, "/close", b"one") == b"one"
+        assert _post(echo_server, "/", b"two") == b"two"
+        ports = echo_server.ports  # type: ignore[attr-defined]
+        assert ports[0] != ports[1]
+
+    def test_error_status_raises_http_error(self, echo_server: ThreadingHTTPServer):
+        with pytest.raises(HTTPError) as excinfo:
+            _post(echo_server, "/fail", b"x")
+        assert excinfo.value.code == 500
+        # The connection is still usable after an error response
+        assert _post(echo_server, "/", b"ok") == b"ok"
+
+    def test_gzip_response_is_decoded(self, echo_server: ThreadingHTTPServer):
+        assert _post(echo_server, "/gzip", b"squeeze me") == b"squeeze me"
+
+    def test_corrupt_gzip_response_raises_url_error(self, echo_server: ThreadingHTTPServer):
+        with pytest.raises(URLError, match="gzip"):
+            _post(echo_server, "/badgzip", b"not gzip")
+
+    def test_unreachable_host_raises_url_error(self, echo_server: ThreadingHTTPServer):
+        port = echo_server.server_port
+        echo_server.shutdown()
+        echo_server.server_close()
+        with pytest.raises(URLError):
+            urlopen(Request(f"http://127.0.0.1:{port}/", data=b"x"), timeout=5)
+
+    def test_embedder_batches_share_connection(self, echo_server: ThreadingHTTPServer):
+        class _EmbedHandler(_EchoHandler):
+            def do_POST(self) -> None:
+                texts = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["input"]
+                self.server.ports.append(self.client_address[1])  # type: ignore[attr-defined]
+                body = _ollama_response([_FAKE_VECTOR] * len(texts))
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        echo_server.RequestHandlerClass = _EmbedHandler
+        config = HwccConfig()
+        config.embedding.base_url = f"http://127.0.0.1:{echo_server.server_port}"
+        config.embedding.batch_size = 2
+        config.embedding.max_concurrency = 1
+        result = OllamaEmbedder(config).embed_chunks(_make_chunks(6))
+
+        assert len(result) == 6
+        assert len(set(echo_server.ports)) == 1  # type: ignore[attr-defined]
+
+
+class TestJsonCodec:
+    def test_roundtrips_embedding_payloads(self):
+        payload = {"model": "m", "input": ["µs timing", "plain"], "vec": [0.1, -2.5e-8]}
+        assert loads_json(dumps_json(payload)) == payload
+        assert json.loads(dumps_json(payload)) == payload
+
+    def test_encodes_lone_surrogates(self):
+        payload = {"input": ["bad \ud800 text"]}
+        assert json.loads(dumps_json(payload)) == payload
+
+    def test_invalid_body_raises_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            loads_json(b"{not json")
+
 
 # --- Registry Integration Tests ---
 
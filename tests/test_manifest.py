@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
 import pytest
@@ -38,6 +39,12 @@ class TestComputeHash:
         with pytest.raises(ManifestError, match="Failed to hash"):
             compute_hash(tmp_path / "nonexistent.txt")
 
+    def test_large_file_matches_sha256_of_contents(self, tmp_path: Path):
+        data = bytes(range(256)) * 5000
+        f = tmp_path / "big.bin"
+        f.write_bytes(data)
+        assert compute_hash(f) == f"sha256:{hashlib.sha256(data).hexdigest()}"
+
 
 class TestManifestCRUD:
     def test_empty_manifest(self):
@@ -145,6 +152,37 @@ class TestManifestCRUD:
         m.add_document(entry)
         assert m.is_changed("test", "sha256:xyz") is True
 
+    def test_is_stat_unchanged_matches_recorded_stat(self):
+        m = Manifest()
+        m.add_document(
+            DocumentEntry(
+                id="test",
+                path="test.pdf",
+                doc_type="pdf",
+                hash="sha256:abc",
+                added="2026-01-01T00:00:00Z",
+                mtime_ns=1_700_000_000_000_000_000,
+                size=4096,
+            )
+        )
+        assert m.is_stat_unchanged("test", 1_700_000_000_000_000_000, 4096) is True
+        assert m.is_stat_unchanged("test", 1_700_000_000_000_000_001, 4096) is False
+        assert m.is_stat_unchanged("test", 1_700_000_000_000_000_000, 4097) is False
+        assert m.is_stat_unchanged("other", 1_700_000_000_000_000_000, 4096) is False
+
+    def test_is_stat_unchanged_false_without_recorded_stat(self):
+        m = Manifest()
+        m.add_document(
+            DocumentEntry(
+                id="test",
+                path="test.pdf",
+                doc_type="pdf",
+                hash="sha256:abc",
+                added="2026-01-01T00:00:00Z",
+            )
+        )
+        assert m.is_stat_unchanged("test", 0, 0) is False
+
 
 class TestManifestRoundTrip:
     def test_save_and_load_empty(self, tmp_path: Path):
@@ -183,10 +221,78 @@ class TestManifestRoundTrip:
         assert doc.chip == "STM32F407"
         assert loaded.last_compiled == "2026-02-27T10:30:00Z"
 
+    def test_save_and_load_file_stat(self, tmp_path: Path):
+        path = tmp_path / "manifest.json"
+        m = Manifest()
+        m.add_document(
+            DocumentEntry(
+                id="ds",
+                path="ds.pdf",
+                doc_type="pdf",
+                hash="sha256:abc",
+                added="2026-01-01T00:00:00Z",
+                mtime_ns=1_700_000_000_123_456_789,
+                size=52_428_800,
+            )
+        )
+        save_manifest(m, path)
+        doc = load_manifest(path).documents[0]
+        assert doc.mtime_ns == 1_700_000_000_123_456_789
+        assert doc.size == 52_428_800
+
+    def test_load_entry_without_file_stat(self, tmp_path: Path):
+        path = tmp_path / "manifest.json"
+        path.write_text(
+            '{"schema_version": "1", "documents": [{"id": "x", "path": "x.pdf", '
+            '"hash": "sha256:abc", "added": "2026-01-01T00:00:00Z"}], "last_compiled": ""}',
+            encoding="utf-8",
+        )
+        doc = load_manifest(path).documents[0]
+        assert doc.mtime_ns == 0
+        assert doc.size == 0
+
+    def test_save_replaces_existing_without_leftovers(self, tmp_path: Path):
+        path = tmp_path / "manifest.json"
+        save_manifest(Manifest(last_compiled="first"), path)
+        save_manifest(Manifest(last_compiled="second"), path)
+        assert load_manifest(path).last_compiled == "second"
+        assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
+    def test_json_backends_write_identical_bytes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        pytest.importorskip("orjson")
+        m = Manifest(last_compiled="2026-02-27T10:30:00Z")
+        m.add_document(
+            DocumentEntry(
+                id="datenblatt_pdf",
+                path="docs/Datenblatt für µC.pdf",
+                doc_type="datasheet",
+                hash="sha256:abc123",
+                added="2026-02-27T10:00:00Z",
+                chunks=12,
+                chip="STM32F407",
+                mtime_ns=1_700_000_000_123_456_789,
+                size=4096,
+            )
+        )
+        fast_path = tmp_path / "fast.json"
+        save_manifest(m, fast_path)
+        monkeypatch.setattr("hwcc.manifest.orjson", None)
+        stdlib_path = tmp_path / "stdlib.json"
+        save_manifest(m, stdlib_path)
+
+        assert fast_path.read_bytes() == stdlib_path.read_bytes()
+        assert load_manifest(stdlib_path).documents == m.documents
+
     def test_load_nonexistent_raises_error(self, tmp_path: Path):
         with pytest.raises(ManifestError, match="not found"):
             load_manifest(tmp_path / "nonexistent.json")
 
+    def test_load_unreadable_path_raises_error(self, tmp_path: Path):
+        with pytest.raises(ManifestError, match="Failed to load"):
+            load_manifest(tmp_path)
+
     def test_load_invalid_json_raises_error(self, tmp_path: Path):
         path = tmp_path / "bad.json"
         path.write_text("{invalid json", encoding="utf-8")
@@ -12,7 +12,7 @@ from hwcc.config import HwccConfig
 from hwcc.embed.base import BaseEmbedder
 from hwcc.exceptions import PipelineError
 from hwcc.ingest.base import BaseParser
-from hwcc.pipeline import Pipeline
+from hwcc.pipeline import Pipeline, parse_and_chunk
 from hwcc.store.base import BaseStore
 from hwcc.types import Chunk, ChunkMetadata, EmbeddedChunk, ParseResult, SearchResult
 
@@ -196,6 +196,47 @@ class TestPipelineProcess:
             assert ec.chunk.metadata.chip == "NRF52840"
 
 
+class TestPipelineStages:
+    def test_parse_and_chunk_skips_embed_and_store(self, tmp_path: Path):
+        _, parser, chunker, embedder, store = _make_pipeline()
+        doc_path = tmp_path / "test.pdf"
+        doc_path.write_text("dummy", encoding="utf-8")
+
+        chunks = parse_and_chunk(parser, chunker, HwccConfig(), doc_path, chip="NRF52840")
+
+        assert [c.chunk_id for c in chunks] == ["c1", "c2"]
+        assert all(c.metadata.chip == "NRF52840" for c in chunks)
+        assert embedder.embed_calls == []
+        assert store.add_calls == []
+
+    def test_index_embeds_and_stores_given_chunks(self):
+        pipeline, parser, chunker, embedder, store = _make_pipeline()
+        meta = ChunkMetadata(doc_id="test_doc")
+        chunks = [Chunk(chunk_id="c1", content="chunk 1", token_count=10, metadata=meta)]
+
+        count = pipeline.index(chunks, doc_id="test_doc")
+
+        assert count == 1
+        assert parser.parse_calls == []
+        assert chunker.chunk_calls == []
+        assert embedder.embed_calls == [1]
+        assert store.add_calls == ["test_doc"]
+
+    def test_index_wraps_exceptions_in_pipeline_error(self):
+        pipeline, _, _, embedder, _ = _make_pipeline()
+
+        def broken_embed(chunks: list[Chunk]) -> list[EmbeddedChunk]:
+            msg = "embed failed"
+            raise ValueError(msg)
+
+        embedder.embed_chunks = broken_embed  # type: ignore[method-assign]
+        meta = ChunkMetadata(doc_id="test_doc")
+        chunks = [Chunk(chunk_id="c1", content="chunk 1", token_count=10, metadata=meta)]
+
+        with pytest.raises(PipelineError, match="embed failed"):
+            pipeline.index(chunks, doc_id="test_doc")
+
+
 class TestPipelineRemove:
     def test_remove_delegates_to_store(self):
         pipeline, _, _, _, store = _make_pipeline()
@@ -8,6 +8,7 @@ import pytest
 
 from hwcc.exceptions import StoreError
 from hwcc.store.chroma import ChromaStore
+from hwcc.store.write_behind import WriteBehindStore
 from hwcc.types import Chunk, ChunkMetadata, EmbeddedChunk, SearchResult
 
 if TYPE_CHECKING:
@@ -301,6 +302,27 @@ class TestChromaStoreDelete:
         assert len(results) == 1
         assert results[0].chunk.metadata.doc_id == "doc2"
 
+    def test_delete_many_removes_only_listed_docs(self, tmp_path: Path):
+        store = _make_store(tmp_path)
+        for i in range(1, 4):
+            store.add(
+                [
+                    _make_embedded_chunk(chunk_id=f"c{i}a", doc_id=f"doc{i}"),
+                    _make_embedded_chunk(chunk_id=f"c{i}b", doc_id=f"doc{i}"),
+                ],
+                f"doc{i}",
+            )
+
+        assert store.delete_many(["doc1", "doc3", "missing"]) == 4
+        assert store.count() == 2
+        assert {m.doc_id for m in store.get_chunk_metadata()} == {"doc2"}
+
+    def test_delete_many_empty_list_returns_zero(self, tmp_path: Path):
+        store = _make_store(tmp_path)
+        store.add([_make_embedded_chunk(chunk_id="c1", doc_id="doc1")], "doc1")
+        assert store.delete_many([]) == 0
+        assert store.count() == 1
+
 
 # --- Count Tests ---
 
@@ -467,6 +489,24 @@ class TestChromaStoreGetChunks:
         assert len(result) == 2
         assert all(isinstance(c, Chunk) for c in result)
 
+    def test_get_chunks_shares_repeated_metadata_strings(self, tmp_path: Path):
+        store = _make_store(tmp_path)
+        store.add(
+            [
+                _make_embedded_chunk(
+                    chunk_id="c1", content_type="register_map", section_path="Dev > SPI1"
+                ),
+                _make_embedded_chunk(
+                    chunk_id="c2", content_type="register_map", section_path="Dev > SPI1"
+                ),
+            ],
+            "doc1",
+        )
+        first, second = store.get_chunks()
+        assert first.metadata.content_type is second.metadata.content_type
+        assert first.metadata.chip is second.metadata.chip
+        assert first.metadata.section_path is second.metadata.section_path
+
     def test_get_chunks_filter_by_doc_type(self, tmp_path: Path):
         store = _make_store(tmp_path)
         store.add(
@@ -514,6 +554,31 @@ class TestChromaStoreGetChunks:
         assert doc_types == {"datasheet", "refman"}
 
 
+class TestChromaStoreIterChunks:
+    def test_pages_through_all_matching_chunks(self, tmp_path: Path):
+        store = _make_store(tmp_path)
+        store.add(
+            [
+                _make_embedded_chunk(chunk_id=f"c{i}", doc_type="svd" if i % 3 else "datasheet")
+                for i in range(7)
+            ],
+            "doc1",
+        )
+        paged = list(store.iter_chunks(where={"doc_type": "svd"}, batch_size=2))
+        assert sorted(c.chunk_id for c in paged) == sorted(
+            c.chunk_id for c in store.get_chunks(where={"doc_type": "svd"})
+        )
+        assert len(paged) == 4
+
+    def test_exact_multiple_of_batch_size(self, tmp_path: Path):
+        store = _make_store(tmp_path)
+        store.add([_make_embedded_chunk(chunk_id=f"c{i}") for i in range(4)], "doc1")
+        assert len(list(store.iter_chunks(batch_size=2))) == 4
+
+    def test_empty_store_yields_nothing(self, tmp_path: Path):
+        assert list(_make_store(tmp_path).iter_chunks()) == []
+
+
 class TestChromaStoreErrors:
     def test_add_wraps_chromadb_errors(self, tmp_path: Path):
         """Mismatched embedding dimensions should raise StoreError."""
@@ -525,3 +590,73 @@ class TestChromaStoreErrors:
         chunk_5d = _make_embedded_chunk(chunk_id="c2", embedding=(0.1, 0.2, 0.3, 0.4, 0.5))
         with pytest.raises(StoreError):
             store.add([chunk_5d], "doc1")
+
+    def test_add_mixed_dimensions_in_one_batch_raises_store_error(self, tmp_path: Path):
+        store = _make_store(tmp_path)
+        chunks = [
+            _make_embedded_chunk(chunk_id="c1", embedding=(0.1, 0.2, 0.3)),
+            _make_embedded_chunk(chunk_id="c2", embedding=(0.1, 0.2)),
+        ]
+        with pytest.raises(StoreError):
+            store.add(chunks, "doc1")
+        assert store.count() == 0
+
+
+class TestWriteBehindStore:
+    def test_add_returns_queued_count_and_wait_reports_stored(self, tmp_path: Path):
+        store = WriteBehindStore(_make_store(tmp_path))
+        try:
+            queued = store.add(
+                [_make_embedded_chunk(chunk_id="c1"), _make_embedded_chunk(chunk_id="c2")],
+                "doc1",
+            )
+            assert queued == 2
+            assert store.wait("doc1") == 2
+            assert store.wait("doc1") is None
+        finally:
+            store.close()
+
+    def test_add_empty_queues_nothing(self, tmp_path: Path):
+        store = WriteBehindStore(_make_store(tmp_path))
+        try:
+            assert store.add([], "doc1") == 0
+            assert store.wait("doc1") is None
+        finally:
+            store.close()
+
+    def test_reads_see_queued_writes(self, tmp_path: Path):
+        store = WriteBehindStore(_make_store(tmp_path))
+        try:
+            store.add([_make_embedded_chunk(chunk_id="c1")], "doc1")
+            assert store.count() == 1
+            assert len(store.get_chunks()) == 1
+            assert store.delete("doc1") == 1
+            assert store.count() == 0
+        finally:
+            store.close()
+
+    def test_wait_raises_store_error_for_failed_write(self, tmp_path: Path):
+        store = WriteBehindStore(_make_store(tmp_path))
+        try:
+            store.add([_make_embedded_chunk(chunk_id="c1", embedding=(0.1, 0.2, 0.3))], "doc1")
+            store.add([_make_embedded_chunk(chunk_id="c2", embedding=(0.1, 0.2))], "doc2")
+            assert store.wait("doc1") == 1
+            with pytest.raises(StoreError):
+                store.wait("doc2")
+        finally:
+            store.close()
+
+    def test_repeated_doc_id_is_waited_for_per_add(self, tmp_path: Path):
+        store = WriteBehindStore(_make_store(tmp_path))
+        try:
+            store.add(
+                [_make_embedded_chunk(chunk_id="c1"), _make_embedded_chunk(chunk_id="c2")],
+                "doc1",
+            )
+            store.add([_make_embedded_chunk(chunk_id="c3", embedding=(0.1, 0.2))], "doc1")
+            assert store.wait("doc1") == 2
+            with pytest.raises(StoreError):
+                store.wait("doc1")
+            assert store.wait("doc1") is None
+        finally:
+            store.close()